@@ -19,10 +19,9 @@ import requests
 import uuid
 import datetime
 
-from typing import DefaultDict, Set, List, Dict, Any, Tuple
+from typing import DefaultDict, Set, List, Dict, Any, Optional, Tuple
 from collections import OrderedDict, defaultdict, deque
 from methodtools import lru_cache
-from itertools import compress
 from pathlib import Path
 
 from scopeserver.dataserver.modules.gserver import s_pb2
@@ -35,6 +34,16 @@ from scopeserver.dataserver.utils import cell_color_by_features as ccbf
 from scopeserver.dataserver.utils import constant
 from scopeserver.dataserver.utils import data
 from scopeserver.dataserver.utils import search_space as ss
+from scopeserver.dataserver.utils import cell_index
+from scopeserver.dataserver.utils import coordinates
+from scopeserver.dataserver.utils import expression_store as es
+from scopeserver.dataserver.utils import expression_cache as ec
+from scopeserver.dataserver.utils import global_search
+from scopeserver.dataserver.utils import colour_cache
+from scopeserver.dataserver.utils import lod
+from scopeserver.dataserver.utils import tiles
+from scopeserver.dataserver.utils import numi
+from scopeserver.dataserver.utils import vmax
 from scopeserver.dataserver.utils import proto
 from scopeserver.dataserver.utils.search import get_search_results
 from scopeserver.dataserver.utils.loom import Loom
@@ -74,10 +83,21 @@ class SCope(s_pb2_grpc.MainServicer):
 
         self.check_ORCID_connection()
 
+        self.global_search = global_search.GlobalSearchIndex(self.lfh.loom_dir / global_search.GLOBAL_SEARCH_FILE_NAME)
+        self.refresh_global_search()
+
     def update_global_data(self) -> None:
         self.dfh.set_global_data()
         self.lfh.set_global_data()
 
+    def refresh_global_search(self) -> None:
+        looms = {
+            loom: self.lfh.get_loom_absolute_file_path(Path(loom))
+            for loom in self.lfh.get_global_looms()
+            if loom.endswith(".loom")
+        }
+        self.global_search.refresh_in_background(looms)
+
     def check_ORCID_connection(self) -> None:
         for i in ["orcidAPIClientID", "orcidAPIClientSecret", "orcidAPIRedirectURI"]:
             if i not in self.config.keys():
@@ -140,11 +160,11 @@ class SCope(s_pb2_grpc.MainServicer):
         )
 
     @lru_cache(maxsize=256)
-    def get_features(self, loom: Loom, query: str):
+    def get_features(self, loom: Loom, query: str, limit: int = 0):
         logger.debug("Searching for {0}".format(query))
         start_time = time.time()
 
-        features = get_search_results(query, loom)
+        features = get_search_results(query, loom, limit=limit)
         return features
 
     def getVmax(self, request, context):
@@ -159,23 +179,13 @@ class SCope(s_pb2_grpc.MainServicer):
                     l_v_max = 0
                     l_max_v_max = 0
                     loom = self.lfh.get_loom(loom_file_path=Path(loomFilePath))
-                    if request.featureType[n] == "gene":
-                        vals, _ = loom.get_gene_expression(
-                            gene_symbol=feature,
-                            log_transform=request.hasLogTransform,
-                            cpm_normalise=request.hasCpmTransform,
-                        )
-                        l_v_max, l_max_v_max = data.get_99_and_100_percentiles(vals)
-                    if request.featureType[n] == "regulon":
-                        vals, _ = loom.get_auc_values(regulon=feature)
-                        l_v_max, l_max_v_max = data.get_99_and_100_percentiles(vals)
-                    if request.featureType[n] == "metric":
-                        vals, _ = loom.get_metric(
-                            metric_name=feature,
+                    if request.featureType[n] in ["gene", "regulon", "metric"]:
+                        l_v_max, l_max_v_max = loom.get_vmax(
+                            feature_type=request.featureType[n],
+                            feature=feature,
                             log_transform=request.hasLogTransform,
                             cpm_normalise=request.hasCpmTransform,
                         )
-                        l_v_max, l_max_v_max = data.get_99_and_100_percentiles(vals)
                     if l_v_max > f_v_max:
                         f_v_max = l_v_max
                 if l_max_v_max > f_max_v_max:
@@ -185,19 +195,53 @@ class SCope(s_pb2_grpc.MainServicer):
         return s_pb2.VmaxReply(vmax=v_max, maxVmax=max_v_max)
 
     def getCellColorByFeatures(self, request, context):
-        start_time = time.time()
         try:
             loom = self.lfh.get_loom(loom_file_path=Path(request.loomFilePath))
         except ValueError:
             return
 
-        cell_color_by_features = ccbf.CellColorByFeatures(loom=loom)
+        return colour_cache.COLOUR_CACHE.get_or_compute(
+            colour_cache.make_key(loom, request), lambda: next(self.get_cell_color_by_features(loom, request))
+        )
+
+    def getCellColorByFeaturesStream(self, request, context):
+        try:
+            loom = self.lfh.get_loom(loom_file_path=Path(request.loomFilePath))
+        except ValueError:
+            return
+
+        # The chunks are computed as they are sent and not cached, their inputs (expression vectors, vmax and
+        # annotation filters) come from the loom caches
+        yield from self.get_cell_color_by_features(loom, request, chunk_size=constant.STREAM_CHUNK_SIZE)
 
+    def get_cell_color_by_features(self, loom, request, chunk_size: int = 0):
+        """ Yield the colours in replies of at most chunk_size cells, or in a single reply if chunk_size is 0. """
+        start_time = time.time()
+        if len(request.cellIndices) > 0:
+            # A subset of the cells is coloured on the colour scale of all cells, annotation filters do not apply
+            unfiltered_request = s_pb2.CellColorByFeaturesRequest()
+            unfiltered_request.CopyFrom(request)
+            unfiltered_request.ClearField("annotation")
+            request = unfiltered_request
+            cell_color_by_features = ccbf.CellColorByFeatures(
+                loom=loom, cell_indices=np.array(request.cellIndices, dtype=np.int64)
+            )
+        else:
+            cell_color_by_features = ccbf.CellColorByFeatures(loom=loom)
+
+        annotations: Optional[List[Annotation]]
         if len(request.annotation) > 0:
             annotations = [Annotation(name=ann.name, values=ann.values) for ann in request.annotation]
         else:
             annotations = None
 
+        # Read all requested genes in one pass, setGeneFeature then finds them in the expression cache
+        loom.get_genes_expression_vectors(
+            gene_symbols=[f for f, t in zip(request.feature, request.featureType) if t == "gene" and f != ""],
+            log_transform=request.hasLogTransform,
+            cpm_normalise=request.hasCpmTransform,
+        )
+
         for n, feature in enumerate(request.feature):
             if request.featureType[n] == "gene":
                 cell_color_by_features.setGeneFeature(request=request, feature=feature, n=n)
@@ -207,25 +251,18 @@ class SCope(s_pb2_grpc.MainServicer):
                 cell_color_by_features.setAnnotationFeature(
                     feature=feature, annotations=annotations, logic=request.logic
                 )
-                return cell_color_by_features.getReply()
+                break
             elif request.featureType[n] == "metric":
                 cell_color_by_features.setMetricFeature(request=request, feature=feature, n=n)
             elif request.featureType[n].startswith("Clustering: "):
                 cell_color_by_features.setClusteringFeature(request=request, feature=feature, n=n)
                 if cell_color_by_features.hasReply():
-                    return cell_color_by_features.getReply()
+                    break
             else:
                 cell_color_by_features.addEmptyFeature()
 
-        logger.debug("{0:.5f} seconds elapsed getting colours ---".format(time.time() - start_time))
-        return s_pb2.CellColorByFeaturesReply(
-            color=None,
-            compressedColor=cell_color_by_features.get_compressed_hex_vec(),
-            hasAddCompressionLayer=True,
-            vmax=cell_color_by_features.get_v_max(),
-            maxVmax=cell_color_by_features.get_max_v_max(),
-            cellIndices=cell_color_by_features.get_cell_indices(),
-        )
+        logger.debug("{0:.5f} seconds elapsed setting features ---".format(time.time() - start_time))
+        yield from cell_color_by_features.get_replies(encoding=request.colorEncoding, chunk_size=chunk_size)
 
     def getFeatureLabels(self, request, context):
         try:
@@ -246,11 +283,48 @@ class SCope(s_pb2_grpc.MainServicer):
 
         return s_pb2.FeatureLabelReply(labels=labels)
 
+    def getEmbeddingTile(self, request, context):
+        try:
+            loom = self.lfh.get_loom(loom_file_path=Path(request.loomFilePath))
+        except ValueError:
+            return
+
+        def render_tile():
+            colour_request = s_pb2.CellColorByFeaturesRequest()
+            colour_request.CopyFrom(request.colors)
+            colour_request.loomFilePath = request.loomFilePath
+            colour_request.ClearField("annotation")
+            colour_request.ClearField("cellIndices")
+            colour_request.colorEncoding = s_pb2.RGB
+            colours = self.getCellColorByFeatures(colour_request, context)
+            if colours.HasField("error"):
+                return s_pb2.EmbeddingTileReply(error=colours.error)
+
+            rgb = np.frombuffer(zlib.decompress(colours.compressedColor), dtype=np.uint8).reshape(-1, 3)
+            tile = tiles.Tile(
+                zoom=request.zoom, x=request.tileX, y=request.tileY, size=request.tileSize or constant.TILE_SIZE
+            )
+            png = tiles.render_tile(
+                loom.get_lod_index(request.coordinatesID),
+                rgb,
+                tile,
+                aggregation="max" if request.aggregation == s_pb2.MAX else "mean",
+            )
+            return s_pb2.EmbeddingTileReply(png=png)
+
+        return colour_cache.TILE_CACHE.get_or_compute(colour_cache.make_key(loom, request), render_tile)
+
     def getCellAUCValuesByFeatures(self, request, context):
         loom = self.lfh.get_loom(loom_file_path=Path(request.loomFilePath))
         vals, _ = loom.get_auc_values(regulon=request.feature[0])
         return s_pb2.CellAUCValuesByFeaturesReply(value=vals)
 
+    def getCellAUCValuesByFeaturesStream(self, request, context):
+        loom = self.lfh.get_loom(loom_file_path=Path(request.loomFilePath))
+        vals, _ = loom.get_auc_values(regulon=request.feature[0])
+        for start, end in data.get_chunks(len(vals), constant.STREAM_CHUNK_SIZE):
+            yield s_pb2.CellAUCValuesByFeaturesReply(value=vals[start:end])
+
     def getNextCluster(self, request, context):
         loom = self.lfh.get_loom(loom_file_path=Path(request.loomFilePath))
         clustering_meta = loom.get_meta_data_clustering_by_id(request.clusteringID)
@@ -291,56 +365,127 @@ class SCope(s_pb2_grpc.MainServicer):
 
     def getCellMetaData(self, request, context):
         loom = self.lfh.get_loom(loom_file_path=Path(request.loomFilePath))
-        cell_indices = request.cellIndices
+        return next(self.get_cell_meta_data_replies(loom, request))
+
+    def getCellMetaDataStream(self, request, context):
+        loom = self.lfh.get_loom(loom_file_path=Path(request.loomFilePath))
+        yield from self.get_cell_meta_data_replies(loom, request, chunk_size=constant.STREAM_CHUNK_SIZE)
+
+    def get_cell_meta_data_replies(self, loom, request, chunk_size: int = 0):
+        """ Yield the meta data in replies of at most chunk_size cells, or in a single reply if chunk_size is 0. """
+        cell_indices = np.array(request.cellIndices, dtype=np.int64)
         if len(cell_indices) == 0:
-            cell_indices = list(range(loom.get_nb_cells()))
-
-        cell_clusters = []
-        for clustering_id in request.clusterings:
-            if clustering_id != "":
-                cell_clusters.append(loom.get_clustering_by_id(clustering_id=clustering_id)[cell_indices])
-        gene_exp = []
-        for gene in request.selectedGenes:
-            if gene != "":
-                vals, _ = loom.get_gene_expression(
-                    gene_symbol=gene, log_transform=request.hasLogTransform, cpm_normalise=request.hasCpmTransform
-                )
-                gene_exp.append(vals[cell_indices])
-        auc_vals = []
-        for regulon in request.selectedRegulons:
-            if regulon != "":
-                vals, _ = loom.get_auc_values(regulon=regulon)
-                auc_vals.append(vals[[cell_indices]])
-        annotations = []
-        for anno in request.annotations:
-            if anno != "":
-                annotations.append(loom.get_ca_attr_by_name(name=anno)[cell_indices].astype(str))
-
-        return s_pb2.CellMetaDataReply(
-            clusterIDs=[s_pb2.CellClusters(clusters=x) for x in cell_clusters],
-            geneExpression=[s_pb2.FeatureValues(features=x) for x in gene_exp],
-            aucValues=[s_pb2.FeatureValues(features=x) for x in auc_vals],
-            annotations=[s_pb2.CellAnnotations(annotations=x) for x in annotations],
+            cell_indices = np.arange(loom.get_nb_cells())
+
+        clusterings = [
+            loom.get_clustering_by_id(clustering_id=clustering_id)
+            for clustering_id in request.clusterings
+            if clustering_id != ""
+        ]
+        genes = [gene for gene in request.selectedGenes if gene != ""]
+        gene_exp = loom.get_genes_expression_vectors(
+            gene_symbols=genes, log_transform=request.hasLogTransform, cpm_normalise=request.hasCpmTransform
         )
+        auc_vals = [loom.get_auc_values(regulon=regulon)[0] for regulon in request.selectedRegulons if regulon != ""]
+        annotations = [loom.get_ca_attr_by_name(name=anno) for anno in request.annotations if anno != ""]
+
+        for start, end in data.get_chunks(len(cell_indices), chunk_size):
+            cells = cell_indices[start:end]
+            yield s_pb2.CellMetaDataReply(
+                clusterIDs=[s_pb2.CellClusters(clusters=x[cells]) for x in clusterings],
+                geneExpression=[s_pb2.FeatureValues(features=x[cells]) for x in gene_exp],
+                aucValues=[s_pb2.FeatureValues(features=x[cells]) for x in auc_vals],
+                annotations=[s_pb2.CellAnnotations(annotations=x[cells].astype(str)) for x in annotations],
+            )
 
     def getFeatures(self, request, context):
         loom = self.lfh.get_loom(loom_file_path=Path(request.loomFilePath))
-        f = self.get_features(loom=loom, query=request.query)
+        f = self.get_features(loom=loom, query=request.query, limit=request.limit)
         return s_pb2.FeatureReply(
             feature=f["feature"], featureType=f["featureType"], featureDescription=f["featureDescription"]
         )
 
+    def getGlobalFeatures(self, request, context):
+        """ Search the features of all global looms, see global_search.GlobalSearchIndex. """
+        return s_pb2.GlobalFeatureReply(
+            features=[
+                s_pb2.GlobalFeatureReply.GlobalFeature(
+                    feature=key.element, featureType=key.element_type, loomFilePaths=looms
+                )
+                for key, looms in self.global_search.find(request.query, limit=request.limit)
+            ]
+        )
+
     def getCoordinates(self, request, context):
-        # request content
         loom = self.lfh.get_loom(loom_file_path=Path(request.loomFilePath))
+        return next(self.get_coordinates_replies(loom, request))
 
+    def getCoordinatesStream(self, request, context):
+        loom = self.lfh.get_loom(loom_file_path=Path(request.loomFilePath))
+        yield from self.get_coordinates_replies(loom, request, chunk_size=constant.STREAM_CHUNK_SIZE)
+
+    def get_coordinates_replies(self, loom, request, chunk_size: int = 0):
+        """ Yield the coordinates in replies of at most chunk_size cells, or in a single reply if chunk_size is 0. """
+        annotations: Optional[List[Annotation]] = None
         if len(request.annotation) > 0:
             annotations = [Annotation(name=ann.name, values=ann.values) for ann in request.annotation]
+
+        lod_requested = request.maxCells > 0 or request.HasField("viewport")
+        if request.encoding != s_pb2.FLOAT_LIST and not lod_requested and annotations is None:
+            # The packed coordinates of all cells are cached, their indices are implied
+            packed = loom.get_packed_coordinates(request.coordinatesID, request.encoding)
+            for start, end in data.get_chunks(loom.get_nb_cells(), chunk_size):
+                yield self.get_packed_coordinates_reply(
+                    packed.get_cells(start, end), total_cells=loom.get_nb_cells(), all_cells=True
+                )
+            return
+
+        if lod_requested:
+            viewport = (
+                lod.Viewport(request.viewport.xMin, request.viewport.xMax, request.viewport.yMin, request.viewport.yMax)
+                if request.HasField("viewport")
+                else None
+            )
+            c = loom.get_lod_coordinates(
+                coordinatesID=request.coordinatesID,
+                max_cells=request.maxCells,
+                viewport=viewport,
+                annotation=annotations,
+                logic=request.logic,
+            )
+            total_cells = c["totalCells"]
         else:
-            annotations = None
+            c = loom.get_coordinates(coordinatesID=request.coordinatesID, annotation=annotations, logic=request.logic)
+            total_cells = len(c["cellIndices"])
+        x, y, cell_indices = np.asarray(c["x"]), np.asarray(c["y"]), np.asarray(c["cellIndices"])
+
+        packed = coordinates.pack(x, y, request.encoding) if request.encoding != s_pb2.FLOAT_LIST else None
+        for start, end in data.get_chunks(len(cell_indices), chunk_size):
+            if packed is not None:
+                yield self.get_packed_coordinates_reply(
+                    packed.get_cells(start, end), total_cells=total_cells, cell_indices=cell_indices[start:end]
+                )
+            else:
+                yield s_pb2.CoordinatesReply(
+                    x=x[start:end], y=y[start:end], cellIndices=cell_indices[start:end], totalCells=total_cells
+                )
 
-        c = loom.get_coordinates(coordinatesID=request.coordinatesID, annotation=annotations, logic=request.logic)
-        return s_pb2.CoordinatesReply(x=c["x"], y=c["y"], cellIndices=c["cellIndices"])
+    @staticmethod
+    def get_packed_coordinates_reply(
+        packed: coordinates.PackedCoordinates, total_cells: int, cell_indices=None, all_cells: bool = False
+    ):
+        return s_pb2.CoordinatesReply(
+            cellIndices=cell_indices,
+            totalCells=total_cells,
+            encoding=packed.encoding,
+            packedX=packed.x,
+            packedY=packed.y,
+            xMin=packed.x_min,
+            xMax=packed.x_max,
+            yMin=packed.y_min,
+            yMax=packed.y_max,
+            allCells=all_cells,
+        )
 
     def setAnnotationName(self, request, context):
         loom = self.lfh.get_loom(loom_file_path=Path(request.loomFilePath))
@@ -563,6 +708,8 @@ class SCope(s_pb2_grpc.MainServicer):
             except ValueError as error:
                 logging.error(error)
         self.dfh.update_UUID_db()
+        # The search spaces of the global looms opened above are now written
+        self.refresh_global_search()
 
         return s_pb2.MyLoomsReply(myLooms=my_looms, update=update)
 
@@ -651,16 +798,13 @@ class SCope(s_pb2_grpc.MainServicer):
     def translateLassoSelection(self, request, context):
         src_loom = self.lfh.get_loom(loom_file_path=Path(request.srcLoomFilePath))
         dest_loom = self.lfh.get_loom(loom_file_path=Path(request.destLoomFilePath))
-        src_cell_ids = [src_loom.get_cell_ids()[i] for i in request.cellIndices]
-        src_fast_index = set(src_cell_ids)
-        dest_mask = [x in src_fast_index for x in dest_loom.get_cell_ids()]
-        dest_cell_indices = list(compress(range(len(dest_mask)), dest_mask))
+        dest_cell_indices = cell_index.translate(src_loom, dest_loom, request.cellIndices)
         return s_pb2.TranslateLassoSelectionReply(cellIndices=dest_cell_indices)
 
     def getCellIDs(self, request, context):
         loom = self.lfh.get_loom(loom_file_path=Path(request.loomFilePath))
         cell_ids = loom.get_cell_ids()
-        slctd_cell_ids = [cell_ids[i] for i in request.cellIndices]
+        slctd_cell_ids = cell_ids[np.array(request.cellIndices, dtype=np.int64)]
         return s_pb2.CellIDsReply(cellIds=slctd_cell_ids)
 
     def deleteUserFile(self, request, context):
@@ -674,10 +818,12 @@ class SCope(s_pb2_grpc.MainServicer):
                     if basename.endswith(".loom"):
                         abs_file_path = self.lfh.drop_loom(request.filePath)
                         try:
-                            os.remove(abs_file_path.with_suffix(".ss_pkl"))
-
+                            ss.remove(abs_file_path)
                         except OSError as err:
-                            logger.error(f"Could not delete search space pickle from {request.filePath}. {err}")
+                            logger.error(f"Could not delete search space from {request.filePath}. {err}")
+                        es.remove(abs_file_path)
+                        numi.remove(abs_file_path)
+                        vmax.remove(abs_file_path)
                     try:
                         os.remove(finalPath)
                     except OSError as err:
@@ -708,8 +854,8 @@ class SCope(s_pb2_grpc.MainServicer):
         if request.featureType == "clusterings":
             a = list(filter(lambda x: x["name"] == request.featureName, meta_data["clusterings"]))
             b = list(filter(lambda x: x["description"] == request.featureValue, a[0]["clusters"]))[0]
-            cells = loom_connection.ca["Clusterings"][str(a[0]["id"])] == b["id"]
-            logger.debug("Number of cells in {0}: {1}".format(request.featureValue, np.sum(cells)))
+            cells = loom.get_cluster_index(a[0]["id"]).get_cells(b["id"])
+            logger.debug("Number of cells in {0}: {1}".format(request.featureValue, len(cells)))
             sub_loom_file_name = file_name + "_Sub_" + request.featureValue.replace(" ", "_").replace("/", "_")
         elif request.featureType == "cellSelection":
             cells = np.full(loom.get_nb_cells(), False)
@@ -856,6 +1002,13 @@ class SCope(s_pb2_grpc.MainServicer):
 
 def serve(run_event, config: Dict[str, Any]) -> None:
     SCope.app_mode = config["app_mode"]
+    es.set_enabled(bool(config.get("expressionStore", False)))
+    if "expressionCacheMaxBytes" in config:
+        ec.EXPRESSION_CACHE.set_max_bytes(int(config["expressionCacheMaxBytes"]))
+    if "colourCacheMaxBytes" in config:
+        colour_cache.COLOUR_CACHE.set_max_bytes(int(config["colourCacheMaxBytes"]))
+    if "tileCacheMaxBytes" in config:
+        colour_cache.TILE_CACHE.set_max_bytes(int(config["tileCacheMaxBytes"]))
     server = grpc.server(
         futures.ThreadPoolExecutor(max_workers=10),
         options=[("grpc.max_send_message_length", -1), ("grpc.max_receive_message_length", -1)],
@@ -874,6 +1027,10 @@ def serve(run_event, config: Dict[str, Any]) -> None:
     for loom in scope.lfh.active_looms.values():
         loom.get_connection().close()
 
+    logger.info(f"Expression cache statistics: {ec.EXPRESSION_CACHE.stats()}")
+    logger.info(f"Colour cache statistics: {colour_cache.COLOUR_CACHE.stats()}")
+    logger.info(f"Tile cache statistics: {colour_cache.TILE_CACHE.stats()}")
+
     # Write UUIDs to file here
     scope.dfh.get_uuid_log().close()
     scope.dfh.update_UUID_db()
@@ -4,6 +4,7 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: s.proto
 """Generated protocol buffer code."""
+from google.protobuf.internal import enum_type_wrapper
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from google.protobuf import reflection as _reflection
@@ -20,9 +21,130 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     syntax="proto3",
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
-    serialized_pb=b'\n\x07s.proto\x12\x05scope"+\n\nErrorReply\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t"\x89\x02\n\x1a\x43\x65llColorByFeaturesRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x0f\n\x07\x66\x65\x61ture\x18\x02 \x03(\t\x12\x13\n\x0b\x66\x65\x61tureType\x18\x03 \x03(\t\x12\x17\n\x0fhasLogTransform\x18\x04 \x01(\x08\x12\x17\n\x0fhasCpmTransform\x18\x05 \x01(\x08\x12\x11\n\tthreshold\x18\x06 \x03(\x02\x12\x18\n\x10scaleThresholded\x18\x07 \x01(\x08\x12%\n\nannotation\x18\x08 \x03(\x0b\x32\x11.scope.Annotation\x12\x0c\n\x04vmax\x18\t \x03(\x02\x12\x0c\n\x04vmin\x18\n \x03(\x02\x12\r\n\x05logic\x18\x0b \x01(\t"-\n\x0b\x43olorLegend\x12\x0e\n\x06values\x18\x01 \x03(\t\x12\x0e\n\x06\x63olors\x18\x02 \x03(\t"\xdc\x01\n\x18\x43\x65llColorByFeaturesReply\x12\x1e\n\x16hasAddCompressionLayer\x18\x01 \x01(\x08\x12\x17\n\x0f\x63ompressedColor\x18\x02 \x01(\x0c\x12\r\n\x05\x63olor\x18\x03 \x03(\t\x12\x0c\n\x04vmax\x18\x04 \x03(\x02\x12\x0f\n\x07maxVmax\x18\x05 \x03(\x02\x12\x13\n\x0b\x63\x65llIndices\x18\x06 \x03(\x05\x12"\n\x06legend\x18\x07 \x01(\x0b\x32\x12.scope.ColorLegend\x12 \n\x05\x65rror\x18\x08 \x01(\x0b\x32\x11.scope.ErrorReply"\\\n\x1e\x43\x65llAUCValuesByFeaturesRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x0f\n\x07\x66\x65\x61ture\x18\x02 \x03(\t\x12\x13\n\x0b\x66\x65\x61tureType\x18\x03 \x03(\t"-\n\x1c\x43\x65llAUCValuesByFeaturesReply\x12\r\n\x05value\x18\x01 \x03(\x02"5\n\x0e\x46\x65\x61tureRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\r\n\x05query\x18\x02 \x01(\t"\xcd\x01\n\x13\x43\x65llMetaDataRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x13\n\x0b\x63\x65llIndices\x18\x02 \x03(\x05\x12\x15\n\rselectedGenes\x18\x03 \x03(\t\x12\x17\n\x0fhasLogTransform\x18\x04 \x01(\x08\x12\x17\n\x0fhasCpmTransform\x18\x05 \x01(\x08\x12\x18\n\x10selectedRegulons\x18\x06 \x03(\t\x12\x13\n\x0b\x63lusterings\x18\x07 \x03(\x05\x12\x13\n\x0b\x61nnotations\x18\x08 \x03(\t"P\n\x0c\x46\x65\x61tureReply\x12\x0f\n\x07\x66\x65\x61ture\x18\x01 \x03(\t\x12\x13\n\x0b\x66\x65\x61tureType\x18\x02 \x03(\t\x12\x1a\n\x12\x66\x65\x61tureDescription\x18\x03 \x03(\t"w\n\x12\x43oordinatesRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x15\n\rcoordinatesID\x18\x02 \x01(\x05\x12%\n\nannotation\x18\x03 \x03(\x0b\x32\x11.scope.Annotation\x12\r\n\x05logic\x18\x04 \x01(\t"=\n\x10\x43oordinatesReply\x12\t\n\x01x\x18\x01 \x03(\x02\x12\t\n\x01y\x18\x02 \x03(\x02\x12\x13\n\x0b\x63\x65llIndices\x18\x03 \x03(\x05":\n\nAnnotation\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0e\n\x06values\x18\x02 \x03(\t\x12\x0e\n\x06\x63olors\x18\x03 \x03(\t""\n\nCoordinate\x12\t\n\x01x\x18\x01 \x01(\x02\x12\t\n\x01y\x18\x02 \x01(\x02"&\n\x04\x45\x64ge\x12\x0e\n\x06source\x18\x01 \x01(\t\x12\x0e\n\x06target\x18\x02 \x01(\t"_\n\nTrajectory\x12\r\n\x05nodes\x18\x01 \x03(\t\x12\x1a\n\x05\x65\x64ges\x18\x02 \x03(\x0b\x32\x0b.scope.Edge\x12&\n\x0b\x63oordinates\x18\x03 \x03(\x0b\x32\x11.scope.Coordinate"L\n\tEmbedding\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12%\n\ntrajectory\x18\x03 \x01(\x0b\x32\x11.scope.Trajectory"J\n\x13\x43lusterMarkerMetric\x12\x10\n\x08\x61\x63\x63\x65ssor\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t"\xbf\x01\n\x0e\x43ollabAnnoData\x12\x14\n\x0c\x63urator_name\x18\x01 \x01(\t\x12\x12\n\ncurator_id\x18\x02 \x01(\t\x12\x11\n\ttimestamp\x18\x03 \x01(\x03\x12\x0e\n\x06obo_id\x18\x04 \x01(\t\x12\x0f\n\x07ols_iri\x18\x05 \x01(\t\x12\x18\n\x10\x61nnotation_label\x18\x06 \x01(\t\x12\x0f\n\x07markers\x18\x07 \x03(\t\x12\x13\n\x0bpublication\x18\x08 \x01(\t\x12\x0f\n\x07\x63omment\x18\t \x01(\t"K\n\x0f\x43ollabAnnoVoter\x12\x12\n\nvoter_name\x18\x01 \x01(\t\x12\x10\n\x08voter_id\x18\x02 \x01(\t\x12\x12\n\nvoter_hash\x18\x03 \x01(\x08"H\n\x0f\x43ollabAnnoVotes\x12\r\n\x05total\x18\x01 \x01(\x05\x12&\n\x06voters\x18\x02 \x03(\x0b\x32\x16.scope.CollabAnnoVoter"\xaa\x01\n\x12\x43\x65llTypeAnnotation\x12#\n\x04\x64\x61ta\x18\x01 \x01(\x0b\x32\x15.scope.CollabAnnoData\x12\x15\n\rvalidate_hash\x18\x02 \x01(\x08\x12)\n\tvotes_for\x18\x03 \x01(\x0b\x32\x16.scope.CollabAnnoVotes\x12-\n\rvotes_against\x18\x04 \x01(\x0b\x32\x16.scope.CollabAnnoVotes"m\n\x11\x43lusterAnnotation\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x37\n\x14\x63\x65ll_type_annotation\x18\x03 \x03(\x0b\x32\x19.scope.CellTypeAnnotation"\xb2\x01\n\nClustering\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05group\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x38\n\x14\x63lusterMarkerMetrics\x18\x04 \x03(\x0b\x32\x1a.scope.ClusterMarkerMetric\x12*\n\x08\x63lusters\x18\x05 \x03(\x0b\x32\x18.scope.ClusterAnnotation\x12\x15\n\rclusterColors\x18\x06 \x03(\t"\x84\x01\n\x0c\x43\x65llMetaData\x12&\n\x0b\x61nnotations\x18\x01 \x03(\x0b\x32\x11.scope.Annotation\x12$\n\nembeddings\x18\x02 \x03(\x0b\x32\x10.scope.Embedding\x12&\n\x0b\x63lusterings\x18\x03 \x03(\x0b\x32\x11.scope.Clustering"/\n\x0c\x41UCThreshold\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\tthreshold\x18\x02 \x01(\x02"Y\n\x12RegulonGenesMetric\x12\x10\n\x08\x61\x63\x63\x65ssor\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x0e\n\x06values\x18\x04 \x03(\x02"\x9e\x01\n\x07Regulon\x12\r\n\x05genes\x18\x01 \x03(\t\x12+\n\x0e\x61utoThresholds\x18\x02 \x03(\x0b\x32\x13.scope.AUCThreshold\x12\x18\n\x10\x64\x65\x66\x61ultThreshold\x18\x03 \x01(\t\x12\x11\n\tmotifName\x18\x04 \x01(\t\x12*\n\x07metrics\x18\x05 \x03(\x0b\x32\x19.scope.RegulonGenesMetric"\x97\x01\n\x0c\x46ileMetaData\x12\x16\n\x0ehasRegulonsAUC\x18\x01 \x01(\x08\x12\x13\n\x0bhasGeneSets\x18\x02 \x01(\x08\x12\x16\n\x0ehasClusterings\x18\x03 \x01(\x08\x12\x1a\n\x12hasExtraEmbeddings\x18\x04 \x01(\x08\x12\x15\n\rhasGlobalMeta\x18\x05 \x01(\x08\x12\x0f\n\x07species\x18\x06 \x01(\t"!\n\rFeatureValues\x12\x10\n\x08\x66\x65\x61tures\x18\x01 \x03(\x02"&\n\x0f\x43\x65llAnnotations\x12\x13\n\x0b\x61nnotations\x18\x01 \x03(\t" \n\x0c\x43\x65llClusters\x12\x10\n\x08\x63lusters\x18\x01 \x03(\x05"\xc0\x01\n\x11\x43\x65llMetaDataReply\x12\'\n\nclusterIDs\x18\x01 \x03(\x0b\x32\x13.scope.CellClusters\x12,\n\x0egeneExpression\x18\x02 \x03(\x0b\x32\x14.scope.FeatureValues\x12\'\n\taucValues\x18\x03 \x03(\x0b\x32\x14.scope.FeatureValues\x12+\n\x0b\x61nnotations\x18\x04 \x03(\x0b\x32\x16.scope.CellAnnotations"?\n\x16RegulonMetaDataRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x0f\n\x07regulon\x18\x02 \x01(\t";\n\x14RegulonMetaDataReply\x12#\n\x0bregulonMeta\x18\x01 \x01(\x0b\x32\x0e.scope.Regulon"S\n\x12MarkerGenesRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x14\n\x0c\x63lusteringID\x18\x02 \x01(\x05\x12\x11\n\tclusterID\x18\x03 \x01(\x05"X\n\x11MarkerGenesMetric\x12\x10\n\x08\x61\x63\x63\x65ssor\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x0e\n\x06values\x18\x04 \x03(\x02"L\n\x10MarkerGenesReply\x12\r\n\x05genes\x18\x01 \x03(\t\x12)\n\x07metrics\x18\x02 \x03(\x0b\x32\x18.scope.MarkerGenesMetric"0\n\x0eMyLoomsRequest\x12\x0c\n\x04UUID\x18\x01 \x01(\t\x12\x10\n\x08loomFile\x18\x02 \x01(\t"4\n\x0eLoomHeierarchy\x12\n\n\x02L1\x18\x01 \x01(\t\x12\n\n\x02L2\x18\x02 \x01(\t\x12\n\n\x02L3\x18\x03 \x01(\t"\xce\x01\n\x06MyLoom\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x17\n\x0floomDisplayName\x18\x02 \x01(\t\x12\x10\n\x08loomSize\x18\x03 \x01(\x03\x12)\n\x0c\x63\x65llMetaData\x18\x04 \x01(\x0b\x32\x13.scope.CellMetaData\x12)\n\x0c\x66ileMetaData\x18\x05 \x01(\x0b\x32\x13.scope.FileMetaData\x12-\n\x0eloomHeierarchy\x18\x06 \x01(\x0b\x32\x15.scope.LoomHeierarchy">\n\x0cMyLoomsReply\x12\x1e\n\x07myLooms\x18\x01 \x03(\x0b\x32\r.scope.MyLoom\x12\x0e\n\x06update\x18\x02 \x01(\x08"h\n\x1eTranslateLassoSelectionRequest\x12\x17\n\x0fsrcLoomFilePath\x18\x01 \x01(\t\x12\x18\n\x10\x64\x65stLoomFilePath\x18\x02 \x01(\t\x12\x13\n\x0b\x63\x65llIndices\x18\x03 \x03(\x05"3\n\x1cTranslateLassoSelectionReply\x12\x13\n\x0b\x63\x65llIndices\x18\x01 \x03(\x05";\n\x0e\x43\x65llIDsRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x13\n\x0b\x63\x65llIndices\x18\x02 \x03(\x05"\x1f\n\x0c\x43\x65llIDsReply\x12\x0f\n\x07\x63\x65llIds\x18\x01 \x03(\t"Y\n\x18GeneSetEnrichmentRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x17\n\x0fgeneSetFilePath\x18\x02 \x01(\t\x12\x0e\n\x06method\x18\x03 \x01(\t")\n\x08Progress\x12\r\n\x05value\x18\x01 \x01(\x02\x12\x0e\n\x06status\x18\x02 \x01(\t"\x80\x01\n\x16GeneSetEnrichmentReply\x12!\n\x08progress\x18\x01 \x01(\x0b\x32\x0f.scope.Progress\x12\x0e\n\x06isDone\x18\x02 \x01(\x08\x12\x33\n\ncellValues\x18\x03 \x01(\x0b\x32\x1f.scope.CellColorByFeaturesReply"{\n\x0bVmaxRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x03(\t\x12\x0f\n\x07\x66\x65\x61ture\x18\x02 \x03(\t\x12\x13\n\x0b\x66\x65\x61tureType\x18\x03 \x03(\t\x12\x17\n\x0fhasLogTransform\x18\x04 \x01(\x08\x12\x17\n\x0fhasCpmTransform\x18\x05 \x01(\x08"*\n\tVmaxReply\x12\x0c\n\x04vmax\x18\x01 \x03(\x02\x12\x0f\n\x07maxVmax\x18\x02 \x03(\x02"\x19\n\x0bUUIDRequest\x12\n\n\x02ip\x18\x01 \x01(\t"\x19\n\tUUIDReply\x12\x0c\n\x04UUID\x18\x01 \x01(\t"I\n\x18RemainingUUIDTimeRequest\x12\n\n\x02ip\x18\x01 \x01(\t\x12\x0c\n\x04UUID\x18\x02 \x01(\t\x12\x13\n\x0bmouseEvents\x18\x03 \x01(\x03"p\n\x16RemainingUUIDTimeReply\x12\x0c\n\x04UUID\x18\x01 \x01(\t\x12\x15\n\rtimeRemaining\x18\x02 \x01(\x03\x12\x1c\n\x14sessionsLimitReached\x18\x03 \x01(\x08\x12\x13\n\x0bsessionMode\x18\x04 \x01(\t"5\n\x13LoomUploadedRequest\x12\x0c\n\x04UUID\x18\x01 \x01(\t\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t"\x13\n\x11LoomUploadedReply"@\n\tMyGeneSet\x12\x17\n\x0fgeneSetFilePath\x18\x01 \x01(\t\x12\x1a\n\x12geneSetDisplayName\x18\x02 \x01(\t"!\n\x11MyGeneSetsRequest\x12\x0c\n\x04UUID\x18\x01 \x01(\t"7\n\x0fMyGeneSetsReply\x12$\n\nmyGeneSets\x18\x01 \x03(\x0b\x32\x10.scope.MyGeneSet"I\n\x15\x44\x65leteUserFileRequest\x12\x0c\n\x04UUID\x18\x01 \x01(\t\x12\x10\n\x08\x66ilePath\x18\x02 \x01(\t\x12\x10\n\x08\x66ileType\x18\x03 \x01(\t"2\n\x13\x44\x65leteUserFileReply\x12\x1b\n\x13\x64\x65letedSuccessfully\x18\x01 \x01(\x08"\x95\x01\n\x16\x44ownloadSubLoomRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x13\n\x0b\x66\x65\x61tureType\x18\x02 \x01(\t\x12\x13\n\x0b\x66\x65\x61tureName\x18\x03 \x01(\t\x12\x14\n\x0c\x66\x65\x61tureValue\x18\x04 \x01(\t\x12\x10\n\x08operator\x18\x05 \x01(\t\x12\x13\n\x0b\x63\x65llIndices\x18\x06 \x03(\x05"\x97\x01\n\x14\x44ownloadSubLoomReply\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x14\n\x0cloomFileSize\x18\x02 \x01(\x03\x12!\n\x08progress\x18\x03 \x01(\x0b\x32\x0f.scope.Progress\x12\x0e\n\x06isDone\x18\x04 \x01(\x08\x12 \n\x05\x65rror\x18\x05 \x01(\x0b\x32\x11.scope.ErrorReply"n\n\x18SetAnnotationNameRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x14\n\x0c\x63lusteringID\x18\x02 \x01(\x03\x12\x11\n\tclusterID\x18\x03 \x01(\x03\x12\x13\n\x0bnewAnnoName\x18\x04 \x01(\t")\n\x16SetAnnotationNameReply\x12\x0f\n\x07success\x18\x01 \x01(\x08"z\n\x17SetLoomHierarchyRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x17\n\x0fnewHierarchy_L1\x18\x02 \x01(\t\x12\x17\n\x0fnewHierarchy_L2\x18\x03 \x01(\t\x12\x17\n\x0fnewHierarchy_L3\x18\x04 \x01(\t"(\n\x15SetLoomHierarchyReply\x12\x0f\n\x07success\x18\x01 \x01(\x08"$\n\x0fgetORCIDRequest\x12\x11\n\tauth_code\x18\x01 \x01(\t"Z\n\rgetORCIDReply\x12\x18\n\x10orcid_scope_uuid\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x10\n\x08orcid_id\x18\x03 \x01(\t\x12\x0f\n\x07success\x18\x04 \x01(\x08"\x17\n\x15getORCIDStatusRequest"%\n\x13getORCIDStatusReply\x12\x0e\n\x06\x61\x63tive\x18\x01 \x01(\x08"I\n\x10orcidInfoMessage\x12\x11\n\torcidName\x18\x01 \x01(\t\x12\x0f\n\x07orcidID\x18\x02 \x01(\t\x12\x11\n\torcidUUID\x18\x03 \x01(\t"\xb3\x01\n\x1dsetColabAnnotationDataRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x14\n\x0c\x63lusteringID\x18\x02 \x01(\x05\x12\x11\n\tclusterID\x18\x03 \x01(\x05\x12*\n\torcidInfo\x18\x04 \x01(\x0b\x32\x17.scope.orcidInfoMessage\x12\'\n\x08\x61nnoData\x18\x05 \x01(\x0b\x32\x15.scope.CollabAnnoData"?\n\x1bsetColabAnnotationDataReply\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t"\xbe\x01\n\x15voteAnnotationRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x14\n\x0c\x63lusteringID\x18\x02 \x01(\x05\x12\x11\n\tclusterID\x18\x03 \x01(\x05\x12*\n\torcidInfo\x18\x04 \x01(\x0b\x32\x17.scope.orcidInfoMessage\x12\'\n\x08\x61nnoData\x18\x05 \x01(\x0b\x32\x15.scope.CollabAnnoData\x12\x11\n\tdirection\x18\x06 \x01(\t"7\n\x13voteAnnotationReply\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t"i\n\x15getNextClusterRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x14\n\x0c\x63lusteringID\x18\x02 \x01(\x05\x12\x11\n\tclusterID\x18\x03 \x01(\x05\x12\x11\n\tdirection\x18\x04 \x01(\t"M\n\x0eNewClusterInfo\x12\x0f\n\x07\x63\x65llIDs\x18\x01 \x03(\t\x12\x12\n\nclusterIDs\x18\x02 \x03(\t\x12\x16\n\x0e\x63lusteringName\x18\x03 \x01(\t"\x87\x01\n\x17\x41\x64\x64NewClusteringRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12*\n\torcidInfo\x18\x02 \x01(\x0b\x32\x17.scope.orcidInfoMessage\x12*\n\x0b\x63lusterInfo\x18\x03 \x01(\x0b\x32\x15.scope.NewClusterInfo"9\n\x15\x41\x64\x64NewClusteringReply\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t"F\n\x19GetClusterOverlapsRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x13\n\x0b\x63\x65llIndices\x18\x02 \x03(\x05"\xd8\x01\n\x0f\x43lusterOverlaps\x12>\n\x0f\x63lusterOverlaps\x18\x01 \x03(\x0b\x32%.scope.ClusterOverlaps.ClusterOverlap\x1a\x84\x01\n\x0e\x43lusterOverlap\x12\x17\n\x0f\x63lustering_name\x18\x01 \x01(\t\x12\x14\n\x0c\x63luster_name\x18\x02 \x01(\t\x12\x0f\n\x07n_cells\x18\x03 \x01(\x05\x12\x18\n\x10\x63\x65lls_in_cluster\x18\x04 \x01(\x02\x12\x18\n\x10\x63luster_in_cells\x18\x05 \x01(\x02"O\n\x13\x46\x65\x61tureLabelRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x11\n\tembedding\x18\x02 \x01(\x11\x12\x0f\n\x07\x66\x65\x61ture\x18\x03 \x01(\t"\xa0\x01\n\x11\x46\x65\x61tureLabelReply\x12\x35\n\x06labels\x18\x01 \x03(\x0b\x32%.scope.FeatureLabelReply.FeatureLabel\x1aT\n\x0c\x46\x65\x61tureLabel\x12\r\n\x05label\x18\x01 \x01(\t\x12\x0e\n\x06\x63olour\x18\x02 \x01(\t\x12%\n\ncoordinate\x18\x03 \x01(\x0b\x32\x11.scope.Coordinate2\x8a\x11\n\x04Main\x12^\n\x16getCellColorByFeatures\x12!.scope.CellColorByFeaturesRequest\x1a\x1f.scope.CellColorByFeaturesReply"\x00\x12j\n\x1agetCellAUCValuesByFeatures\x12%.scope.CellAUCValuesByFeaturesRequest\x1a#.scope.CellAUCValuesByFeaturesReply"\x00\x12I\n\x0fgetCellMetaData\x12\x1a.scope.CellMetaDataRequest\x1a\x18.scope.CellMetaDataReply"\x00\x12;\n\x0bgetFeatures\x12\x15.scope.FeatureRequest\x1a\x13.scope.FeatureReply"\x00\x12\x46\n\x0egetCoordinates\x12\x19.scope.CoordinatesRequest\x1a\x17.scope.CoordinatesReply"\x00\x12R\n\x12getRegulonMetaData\x12\x1d.scope.RegulonMetaDataRequest\x1a\x1b.scope.RegulonMetaDataReply"\x00\x12\x46\n\x0egetMarkerGenes\x12\x19.scope.MarkerGenesRequest\x1a\x17.scope.MarkerGenesReply"\x00\x12:\n\ngetMyLooms\x12\x15.scope.MyLoomsRequest\x1a\x13.scope.MyLoomsReply"\x00\x12g\n\x17translateLassoSelection\x12%.scope.TranslateLassoSelectionRequest\x1a#.scope.TranslateLassoSelectionReply"\x00\x12:\n\ngetCellIDs\x12\x15.scope.CellIDsRequest\x1a\x13.scope.CellIDsReply"\x00\x12Y\n\x13\x64oGeneSetEnrichment\x12\x1f.scope.GeneSetEnrichmentRequest\x1a\x1d.scope.GeneSetEnrichmentReply"\x00\x30\x01\x12\x31\n\x07getVmax\x12\x12.scope.VmaxRequest\x1a\x10.scope.VmaxReply"\x00\x12\x31\n\x07getUUID\x12\x12.scope.UUIDRequest\x1a\x10.scope.UUIDReply"\x00\x12X\n\x14getRemainingUUIDTime\x12\x1f.scope.RemainingUUIDTimeRequest\x1a\x1d.scope.RemainingUUIDTimeReply"\x00\x12\x46\n\x0cloomUploaded\x12\x1a.scope.LoomUploadedRequest\x1a\x18.scope.LoomUploadedReply"\x00\x12\x43\n\rgetMyGeneSets\x12\x18.scope.MyGeneSetsRequest\x1a\x16.scope.MyGeneSetsReply"\x00\x12L\n\x0e\x64\x65leteUserFile\x12\x1c.scope.DeleteUserFileRequest\x1a\x1a.scope.DeleteUserFileReply"\x00\x12Q\n\x0f\x64ownloadSubLoom\x12\x1d.scope.DownloadSubLoomRequest\x1a\x1b.scope.DownloadSubLoomReply"\x00\x30\x01\x12U\n\x11setAnnotationName\x12\x1f.scope.SetAnnotationNameRequest\x1a\x1d.scope.SetAnnotationNameReply"\x00\x12R\n\x10setLoomHierarchy\x12\x1e.scope.SetLoomHierarchyRequest\x1a\x1c.scope.SetLoomHierarchyReply"\x00\x12:\n\x08getORCID\x12\x16.scope.getORCIDRequest\x1a\x14.scope.getORCIDReply"\x00\x12L\n\x0egetORCIDStatus\x12\x1c.scope.getORCIDStatusRequest\x1a\x1a.scope.getORCIDStatusReply"\x00\x12\x64\n\x16setColabAnnotationData\x12$.scope.setColabAnnotationDataRequest\x1a".scope.setColabAnnotationDataReply"\x00\x12L\n\x0evoteAnnotation\x12\x1c.scope.voteAnnotationRequest\x1a\x1a.scope.voteAnnotationReply"\x00\x12\x45\n\x0egetNextCluster\x12\x1c.scope.getNextClusterRequest\x1a\x13.scope.FeatureReply"\x00\x12R\n\x10\x61\x64\x64NewClustering\x12\x1e.scope.AddNewClusteringRequest\x1a\x1c.scope.AddNewClusteringReply"\x00\x12P\n\x12getClusterOverlaps\x12 .scope.GetClusterOverlapsRequest\x1a\x16.scope.ClusterOverlaps"\x00\x12J\n\x10getFeatureLabels\x12\x1a.scope.FeatureLabelRequest\x1a\x18.scope.FeatureLabelReply"\x00\x62\x06proto3',
+    serialized_pb=b'\n\x07s.proto\x12\x05scope"+\n\nErrorReply\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t"\xcb\x02\n\x1a\x43\x65llColorByFeaturesRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x0f\n\x07\x66\x65\x61ture\x18\x02 \x03(\t\x12\x13\n\x0b\x66\x65\x61tureType\x18\x03 \x03(\t\x12\x17\n\x0fhasLogTransform\x18\x04 \x01(\x08\x12\x17\n\x0fhasCpmTransform\x18\x05 \x01(\x08\x12\x11\n\tthreshold\x18\x06 \x03(\x02\x12\x18\n\x10scaleThresholded\x18\x07 \x01(\x08\x12%\n\nannotation\x18\x08 \x03(\x0b\x32\x11.scope.Annotation\x12\x0c\n\x04vmax\x18\t \x03(\x02\x12\x0c\n\x04vmin\x18\n \x03(\x02\x12\r\n\x05logic\x18\x0b \x01(\t\x12+\n\rcolorEncoding\x18\x0c \x01(\x0e\x32\x14.scope.ColorEncoding\x12\x13\n\x0b\x63\x65llIndices\x18\r \x03(\x05"-\n\x0b\x43olorLegend\x12\x0e\n\x06values\x18\x01 \x03(\t\x12\x0e\n\x06\x63olors\x18\x02 \x03(\t"\x9a\x02\n\x18\x43\x65llColorByFeaturesReply\x12\x1e\n\x16hasAddCompressionLayer\x18\x01 \x01(\x08\x12\x17\n\x0f\x63ompressedColor\x18\x02 \x01(\x0c\x12\r\n\x05\x63olor\x18\x03 \x03(\t\x12\x0c\n\x04vmax\x18\x04 \x03(\x02\x12\x0f\n\x07maxVmax\x18\x05 \x03(\x02\x12\x13\n\x0b\x63\x65llIndices\x18\x06 \x03(\x05\x12"\n\x06legend\x18\x07 \x01(\x0b\x32\x12.scope.ColorLegend\x12 \n\x05\x65rror\x18\x08 \x01(\x0b\x32\x11.scope.ErrorReply\x12+\n\rcolorEncoding\x18\t \x01(\x0e\x32\x14.scope.ColorEncoding\x12\x0f\n\x07palette\x18\n \x03(\t"\xe1\x01\n\x14\x45mbeddingTileRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x15\n\rcoordinatesID\x18\x02 \x01(\x05\x12\x31\n\x06\x63olors\x18\x03 \x01(\x0b\x32!.scope.CellColorByFeaturesRequest\x12\x0c\n\x04zoom\x18\x04 \x01(\x05\x12\r\n\x05tileX\x18\x05 \x01(\x05\x12\r\n\x05tileY\x18\x06 \x01(\x05\x12\x10\n\x08tileSize\x18\x07 \x01(\x05\x12+\n\x0b\x61ggregation\x18\x08 \x01(\x0e\x32\x16.scope.TileAggregation"C\n\x12\x45mbeddingTileReply\x12\x0b\n\x03png\x18\x01 \x01(\x0c\x12 \n\x05\x65rror\x18\x02 \x01(\x0b\x32\x11.scope.ErrorReply"\\\n\x1e\x43\x65llAUCValuesByFeaturesRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x0f\n\x07\x66\x65\x61ture\x18\x02 \x03(\t\x12\x13\n\x0b\x66\x65\x61tureType\x18\x03 \x03(\t"-\n\x1c\x43\x65llAUCValuesByFeaturesReply\x12\r\n\x05value\x18\x01 \x03(\x02"D\n\x0e\x46\x65\x61tureRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\r\n\x05query\x18\x02 \x01(\t\x12\r\n\x05limit\x18\x03 \x01(\x05"\xcd\x01\n\x13\x43\x65llMetaDataRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x13\n\x0b\x63\x65llIndices\x18\x02 \x03(\x05\x12\x15\n\rselectedGenes\x18\x03 \x03(\t\x12\x17\n\x0fhasLogTransform\x18\x04 \x01(\x08\x12\x17\n\x0fhasCpmTransform\x18\x05 \x01(\x08\x12\x18\n\x10selectedRegulons\x18\x06 \x03(\t\x12\x13\n\x0b\x63lusterings\x18\x07 \x03(\x05\x12\x13\n\x0b\x61nnotations\x18\x08 \x03(\t"P\n\x0c\x46\x65\x61tureReply\x12\x0f\n\x07\x66\x65\x61ture\x18\x01 \x03(\t\x12\x13\n\x0b\x66\x65\x61tureType\x18\x02 \x03(\t\x12\x1a\n\x12\x66\x65\x61tureDescription\x18\x03 \x03(\t"4\n\x14GlobalFeatureRequest\x12\r\n\x05query\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\x05"\x9d\x01\n\x12GlobalFeatureReply\x12\x39\n\x08\x66\x65\x61tures\x18\x01 \x03(\x0b\x32\'.scope.GlobalFeatureReply.GlobalFeature\x1aL\n\rGlobalFeature\x12\x0f\n\x07\x66\x65\x61ture\x18\x01 \x01(\t\x12\x13\n\x0b\x66\x65\x61tureType\x18\x02 \x01(\t\x12\x15\n\rloomFilePaths\x18\x03 \x03(\t"B\n\x08Viewport\x12\x0c\n\x04xMin\x18\x01 \x01(\x02\x12\x0c\n\x04xMax\x18\x02 \x01(\x02\x12\x0c\n\x04yMin\x18\x03 \x01(\x02\x12\x0c\n\x04yMax\x18\x04 \x01(\x02"\xda\x01\n\x12\x43oordinatesRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x15\n\rcoordinatesID\x18\x02 \x01(\x05\x12%\n\nannotation\x18\x03 \x03(\x0b\x32\x11.scope.Annotation\x12\r\n\x05logic\x18\x04 \x01(\t\x12\x10\n\x08maxCells\x18\x05 \x01(\x05\x12!\n\x08viewport\x18\x06 \x01(\x0b\x32\x0f.scope.Viewport\x12,\n\x08\x65ncoding\x18\x07 \x01(\x0e\x32\x1a.scope.CoordinatesEncoding"\xeb\x01\n\x10\x43oordinatesReply\x12\t\n\x01x\x18\x01 \x03(\x02\x12\t\n\x01y\x18\x02 \x03(\x02\x12\x13\n\x0b\x63\x65llIndices\x18\x03 \x03(\x05\x12\x12\n\ntotalCells\x18\x04 \x01(\x05\x12,\n\x08\x65ncoding\x18\x05 \x01(\x0e\x32\x1a.scope.CoordinatesEncoding\x12\x0f\n\x07packedX\x18\x06 \x01(\x0c\x12\x0f\n\x07packedY\x18\x07 \x01(\x0c\x12\x0c\n\x04xMin\x18\x08 \x01(\x01\x12\x0c\n\x04xMax\x18\t \x01(\x01\x12\x0c\n\x04yMin\x18\n \x01(\x01\x12\x0c\n\x04yMax\x18\x0b \x01(\x01\x12\x10\n\x08\x61llCells\x18\x0c \x01(\x08":\n\nAnnotation\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0e\n\x06values\x18\x02 \x03(\t\x12\x0e\n\x06\x63olors\x18\x03 \x03(\t""\n\nCoordinate\x12\t\n\x01x\x18\x01 \x01(\x02\x12\t\n\x01y\x18\x02 \x01(\x02"&\n\x04\x45\x64ge\x12\x0e\n\x06source\x18\x01 \x01(\t\x12\x0e\n\x06target\x18\x02 \x01(\t"_\n\nTrajectory\x12\r\n\x05nodes\x18\x01 \x03(\t\x12\x1a\n\x05\x65\x64ges\x18\x02 \x03(\x0b\x32\x0b.scope.Edge\x12&\n\x0b\x63oordinates\x18\x03 \x03(\x0b\x32\x11.scope.Coordinate"L\n\tEmbedding\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12%\n\ntrajectory\x18\x03 \x01(\x0b\x32\x11.scope.Trajectory"J\n\x13\x43lusterMarkerMetric\x12\x10\n\x08\x61\x63\x63\x65ssor\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t"\xbf\x01\n\x0e\x43ollabAnnoData\x12\x14\n\x0c\x63urator_name\x18\x01 \x01(\t\x12\x12\n\ncurator_id\x18\x02 \x01(\t\x12\x11\n\ttimestamp\x18\x03 \x01(\x03\x12\x0e\n\x06obo_id\x18\x04 \x01(\t\x12\x0f\n\x07ols_iri\x18\x05 \x01(\t\x12\x18\n\x10\x61nnotation_label\x18\x06 \x01(\t\x12\x0f\n\x07markers\x18\x07 \x03(\t\x12\x13\n\x0bpublication\x18\x08 \x01(\t\x12\x0f\n\x07\x63omment\x18\t \x01(\t"K\n\x0f\x43ollabAnnoVoter\x12\x12\n\nvoter_name\x18\x01 \x01(\t\x12\x10\n\x08voter_id\x18\x02 \x01(\t\x12\x12\n\nvoter_hash\x18\x03 \x01(\x08"H\n\x0f\x43ollabAnnoVotes\x12\r\n\x05total\x18\x01 \x01(\x05\x12&\n\x06voters\x18\x02 \x03(\x0b\x32\x16.scope.CollabAnnoVoter"\xaa\x01\n\x12\x43\x65llTypeAnnotation\x12#\n\x04\x64\x61ta\x18\x01 \x01(\x0b\x32\x15.scope.CollabAnnoData\x12\x15\n\rvalidate_hash\x18\x02 \x01(\x08\x12)\n\tvotes_for\x18\x03 \x01(\x0b\x32\x16.scope.CollabAnnoVotes\x12-\n\rvotes_against\x18\x04 \x01(\x0b\x32\x16.scope.CollabAnnoVotes"m\n\x11\x43lusterAnnotation\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x37\n\x14\x63\x65ll_type_annotation\x18\x03 \x03(\x0b\x32\x19.scope.CellTypeAnnotation"\xb2\x01\n\nClustering\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05group\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x38\n\x14\x63lusterMarkerMetrics\x18\x04 \x03(\x0b\x32\x1a.scope.ClusterMarkerMetric\x12*\n\x08\x63lusters\x18\x05 \x03(\x0b\x32\x18.scope.ClusterAnnotation\x12\x15\n\rclusterColors\x18\x06 \x03(\t"\x84\x01\n\x0c\x43\x65llMetaData\x12&\n\x0b\x61nnotations\x18\x01 \x03(\x0b\x32\x11.scope.Annotation\x12$\n\nembeddings\x18\x02 \x03(\x0b\x32\x10.scope.Embedding\x12&\n\x0b\x63lusterings\x18\x03 \x03(\x0b\x32\x11.scope.Clustering"/\n\x0c\x41UCThreshold\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\tthreshold\x18\x02 \x01(\x02"Y\n\x12RegulonGenesMetric\x12\x10\n\x08\x61\x63\x63\x65ssor\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x0e\n\x06values\x18\x04 \x03(\x02"\x9e\x01\n\x07Regulon\x12\r\n\x05genes\x18\x01 \x03(\t\x12+\n\x0e\x61utoThresholds\x18\x02 \x03(\x0b\x32\x13.scope.AUCThreshold\x12\x18\n\x10\x64\x65\x66\x61ultThreshold\x18\x03 \x01(\t\x12\x11\n\tmotifName\x18\x04 \x01(\t\x12*\n\x07metrics\x18\x05 \x03(\x0b\x32\x19.scope.RegulonGenesMetric"\x97\x01\n\x0c\x46ileMetaData\x12\x16\n\x0ehasRegulonsAUC\x18\x01 \x01(\x08\x12\x13\n\x0bhasGeneSets\x18\x02 \x01(\x08\x12\x16\n\x0ehasClusterings\x18\x03 \x01(\x08\x12\x1a\n\x12hasExtraEmbeddings\x18\x04 \x01(\x08\x12\x15\n\rhasGlobalMeta\x18\x05 \x01(\x08\x12\x0f\n\x07species\x18\x06 \x01(\t"!\n\rFeatureValues\x12\x10\n\x08\x66\x65\x61tures\x18\x01 \x03(\x02"&\n\x0f\x43\x65llAnnotations\x12\x13\n\x0b\x61nnotations\x18\x01 \x03(\t" \n\x0c\x43\x65llClusters\x12\x10\n\x08\x63lusters\x18\x01 \x03(\x05"\xc0\x01\n\x11\x43\x65llMetaDataReply\x12\'\n\nclusterIDs\x18\x01 \x03(\x0b\x32\x13.scope.CellClusters\x12,\n\x0egeneExpression\x18\x02 \x03(\x0b\x32\x14.scope.FeatureValues\x12\'\n\taucValues\x18\x03 \x03(\x0b\x32\x14.scope.FeatureValues\x12+\n\x0b\x61nnotations\x18\x04 \x03(\x0b\x32\x16.scope.CellAnnotations"?\n\x16RegulonMetaDataRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x0f\n\x07regulon\x18\x02 \x01(\t";\n\x14RegulonMetaDataReply\x12#\n\x0bregulonMeta\x18\x01 \x01(\x0b\x32\x0e.scope.Regulon"S\n\x12MarkerGenesRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x14\n\x0c\x63lusteringID\x18\x02 \x01(\x05\x12\x11\n\tclusterID\x18\x03 \x01(\x05"X\n\x11MarkerGenesMetric\x12\x10\n\x08\x61\x63\x63\x65ssor\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x0e\n\x06values\x18\x04 \x03(\x02"L\n\x10MarkerGenesReply\x12\r\n\x05genes\x18\x01 \x03(\t\x12)\n\x07metrics\x18\x02 \x03(\x0b\x32\x18.scope.MarkerGenesMetric"0\n\x0eMyLoomsRequest\x12\x0c\n\x04UUID\x18\x01 \x01(\t\x12\x10\n\x08loomFile\x18\x02 \x01(\t"4\n\x0eLoomHeierarchy\x12\n\n\x02L1\x18\x01 \x01(\t\x12\n\n\x02L2\x18\x02 \x01(\t\x12\n\n\x02L3\x18\x03 \x01(\t"\xce\x01\n\x06MyLoom\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x17\n\x0floomDisplayName\x18\x02 \x01(\t\x12\x10\n\x08loomSize\x18\x03 \x01(\x03\x12)\n\x0c\x63\x65llMetaData\x18\x04 \x01(\x0b\x32\x13.scope.CellMetaData\x12)\n\x0c\x66ileMetaData\x18\x05 \x01(\x0b\x32\x13.scope.FileMetaData\x12-\n\x0eloomHeierarchy\x18\x06 \x01(\x0b\x32\x15.scope.LoomHeierarchy">\n\x0cMyLoomsReply\x12\x1e\n\x07myLooms\x18\x01 \x03(\x0b\x32\r.scope.MyLoom\x12\x0e\n\x06update\x18\x02 \x01(\x08"h\n\x1eTranslateLassoSelectionRequest\x12\x17\n\x0fsrcLoomFilePath\x18\x01 \x01(\t\x12\x18\n\x10\x64\x65stLoomFilePath\x18\x02 \x01(\t\x12\x13\n\x0b\x63\x65llIndices\x18\x03 \x03(\x05"3\n\x1cTranslateLassoSelectionReply\x12\x13\n\x0b\x63\x65llIndices\x18\x01 \x03(\x05";\n\x0e\x43\x65llIDsRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x13\n\x0b\x63\x65llIndices\x18\x02 \x03(\x05"\x1f\n\x0c\x43\x65llIDsReply\x12\x0f\n\x07\x63\x65llIds\x18\x01 \x03(\t"Y\n\x18GeneSetEnrichmentRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x17\n\x0fgeneSetFilePath\x18\x02 \x01(\t\x12\x0e\n\x06method\x18\x03 \x01(\t")\n\x08Progress\x12\r\n\x05value\x18\x01 \x01(\x02\x12\x0e\n\x06status\x18\x02 \x01(\t"\x80\x01\n\x16GeneSetEnrichmentReply\x12!\n\x08progress\x18\x01 \x01(\x0b\x32\x0f.scope.Progress\x12\x0e\n\x06isDone\x18\x02 \x01(\x08\x12\x33\n\ncellValues\x18\x03 \x01(\x0b\x32\x1f.scope.CellColorByFeaturesReply"{\n\x0bVmaxRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x03(\t\x12\x0f\n\x07\x66\x65\x61ture\x18\x02 \x03(\t\x12\x13\n\x0b\x66\x65\x61tureType\x18\x03 \x03(\t\x12\x17\n\x0fhasLogTransform\x18\x04 \x01(\x08\x12\x17\n\x0fhasCpmTransform\x18\x05 \x01(\x08"*\n\tVmaxReply\x12\x0c\n\x04vmax\x18\x01 \x03(\x02\x12\x0f\n\x07maxVmax\x18\x02 \x03(\x02"\x19\n\x0bUUIDRequest\x12\n\n\x02ip\x18\x01 \x01(\t"\x19\n\tUUIDReply\x12\x0c\n\x04UUID\x18\x01 \x01(\t"I\n\x18RemainingUUIDTimeRequest\x12\n\n\x02ip\x18\x01 \x01(\t\x12\x0c\n\x04UUID\x18\x02 \x01(\t\x12\x13\n\x0bmouseEvents\x18\x03 \x01(\x03"p\n\x16RemainingUUIDTimeReply\x12\x0c\n\x04UUID\x18\x01 \x01(\t\x12\x15\n\rtimeRemaining\x18\x02 \x01(\x03\x12\x1c\n\x14sessionsLimitReached\x18\x03 \x01(\x08\x12\x13\n\x0bsessionMode\x18\x04 \x01(\t"5\n\x13LoomUploadedRequest\x12\x0c\n\x04UUID\x18\x01 \x01(\t\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t"\x13\n\x11LoomUploadedReply"@\n\tMyGeneSet\x12\x17\n\x0fgeneSetFilePath\x18\x01 \x01(\t\x12\x1a\n\x12geneSetDisplayName\x18\x02 \x01(\t"!\n\x11MyGeneSetsRequest\x12\x0c\n\x04UUID\x18\x01 \x01(\t"7\n\x0fMyGeneSetsReply\x12$\n\nmyGeneSets\x18\x01 \x03(\x0b\x32\x10.scope.MyGeneSet"I\n\x15\x44\x65leteUserFileRequest\x12\x0c\n\x04UUID\x18\x01 \x01(\t\x12\x10\n\x08\x66ilePath\x18\x02 \x01(\t\x12\x10\n\x08\x66ileType\x18\x03 \x01(\t"2\n\x13\x44\x65leteUserFileReply\x12\x1b\n\x13\x64\x65letedSuccessfully\x18\x01 \x01(\x08"\x95\x01\n\x16\x44ownloadSubLoomRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x13\n\x0b\x66\x65\x61tureType\x18\x02 \x01(\t\x12\x13\n\x0b\x66\x65\x61tureName\x18\x03 \x01(\t\x12\x14\n\x0c\x66\x65\x61tureValue\x18\x04 \x01(\t\x12\x10\n\x08operator\x18\x05 \x01(\t\x12\x13\n\x0b\x63\x65llIndices\x18\x06 \x03(\x05"\x97\x01\n\x14\x44ownloadSubLoomReply\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x14\n\x0cloomFileSize\x18\x02 \x01(\x03\x12!\n\x08progress\x18\x03 \x01(\x0b\x32\x0f.scope.Progress\x12\x0e\n\x06isDone\x18\x04 \x01(\x08\x12 \n\x05\x65rror\x18\x05 \x01(\x0b\x32\x11.scope.ErrorReply"n\n\x18SetAnnotationNameRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x14\n\x0c\x63lusteringID\x18\x02 \x01(\x03\x12\x11\n\tclusterID\x18\x03 \x01(\x03\x12\x13\n\x0bnewAnnoName\x18\x04 \x01(\t")\n\x16SetAnnotationNameReply\x12\x0f\n\x07success\x18\x01 \x01(\x08"z\n\x17SetLoomHierarchyRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x17\n\x0fnewHierarchy_L1\x18\x02 \x01(\t\x12\x17\n\x0fnewHierarchy_L2\x18\x03 \x01(\t\x12\x17\n\x0fnewHierarchy_L3\x18\x04 \x01(\t"(\n\x15SetLoomHierarchyReply\x12\x0f\n\x07success\x18\x01 \x01(\x08"$\n\x0fgetORCIDRequest\x12\x11\n\tauth_code\x18\x01 \x01(\t"Z\n\rgetORCIDReply\x12\x18\n\x10orcid_scope_uuid\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x10\n\x08orcid_id\x18\x03 \x01(\t\x12\x0f\n\x07success\x18\x04 \x01(\x08"\x17\n\x15getORCIDStatusRequest"%\n\x13getORCIDStatusReply\x12\x0e\n\x06\x61\x63tive\x18\x01 \x01(\x08"I\n\x10orcidInfoMessage\x12\x11\n\torcidName\x18\x01 \x01(\t\x12\x0f\n\x07orcidID\x18\x02 \x01(\t\x12\x11\n\torcidUUID\x18\x03 \x01(\t"\xb3\x01\n\x1dsetColabAnnotationDataRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x14\n\x0c\x63lusteringID\x18\x02 \x01(\x05\x12\x11\n\tclusterID\x18\x03 \x01(\x05\x12*\n\torcidInfo\x18\x04 \x01(\x0b\x32\x17.scope.orcidInfoMessage\x12\'\n\x08\x61nnoData\x18\x05 \x01(\x0b\x32\x15.scope.CollabAnnoData"?\n\x1bsetColabAnnotationDataReply\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t"\xbe\x01\n\x15voteAnnotationRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x14\n\x0c\x63lusteringID\x18\x02 \x01(\x05\x12\x11\n\tclusterID\x18\x03 \x01(\x05\x12*\n\torcidInfo\x18\x04 \x01(\x0b\x32\x17.scope.orcidInfoMessage\x12\'\n\x08\x61nnoData\x18\x05 \x01(\x0b\x32\x15.scope.CollabAnnoData\x12\x11\n\tdirection\x18\x06 \x01(\t"7\n\x13voteAnnotationReply\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t"i\n\x15getNextClusterRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x14\n\x0c\x63lusteringID\x18\x02 \x01(\x05\x12\x11\n\tclusterID\x18\x03 \x01(\x05\x12\x11\n\tdirection\x18\x04 \x01(\t"M\n\x0eNewClusterInfo\x12\x0f\n\x07\x63\x65llIDs\x18\x01 \x03(\t\x12\x12\n\nclusterIDs\x18\x02 \x03(\t\x12\x16\n\x0e\x63lusteringName\x18\x03 \x01(\t"\x87\x01\n\x17\x41\x64\x64NewClusteringRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12*\n\torcidInfo\x18\x02 \x01(\x0b\x32\x17.scope.orcidInfoMessage\x12*\n\x0b\x63lusterInfo\x18\x03 \x01(\x0b\x32\x15.scope.NewClusterInfo"9\n\x15\x41\x64\x64NewClusteringReply\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t"F\n\x19GetClusterOverlapsRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x13\n\x0b\x63\x65llIndices\x18\x02 \x03(\x05"\xd8\x01\n\x0f\x43lusterOverlaps\x12>\n\x0f\x63lusterOverlaps\x18\x01 \x03(\x0b\x32%.scope.ClusterOverlaps.ClusterOverlap\x1a\x84\x01\n\x0e\x43lusterOverlap\x12\x17\n\x0f\x63lustering_name\x18\x01 \x01(\t\x12\x14\n\x0c\x63luster_name\x18\x02 \x01(\t\x12\x0f\n\x07n_cells\x18\x03 \x01(\x05\x12\x18\n\x10\x63\x65lls_in_cluster\x18\x04 \x01(\x02\x12\x18\n\x10\x63luster_in_cells\x18\x05 \x01(\x02"O\n\x13\x46\x65\x61tureLabelRequest\x12\x14\n\x0cloomFilePath\x18\x01 \x01(\t\x12\x11\n\tembedding\x18\x02 \x01(\x11\x12\x0f\n\x07\x66\x65\x61ture\x18\x03 \x01(\t"\xa0\x01\n\x11\x46\x65\x61tureLabelReply\x12\x35\n\x06labels\x18\x01 \x03(\x0b\x32%.scope.FeatureLabelReply.FeatureLabel\x1aT\n\x0c\x46\x65\x61tureLabel\x12\r\n\x05label\x18\x01 \x01(\t\x12\x0e\n\x06\x63olour\x18\x02 \x01(\t\x12%\n\ncoordinate\x18\x03 \x01(\x0b\x32\x11.scope.Coordinate*.\n\rColorEncoding\x12\x07\n\x03HEX\x10\x00\x12\x07\n\x03RGB\x10\x01\x12\x0b\n\x07PALETTE\x10\x02*$\n\x0fTileAggregation\x12\x08\n\x04MEAN\x10\x00\x12\x07\n\x03MAX\x10\x01*>\n\x13\x43oordinatesEncoding\x12\x0e\n\nFLOAT_LIST\x10\x00\x12\x0b\n\x07\x46LOAT32\x10\x01\x12\n\n\x06UINT16\x10\x02\x32\xa6\x15\n\x04Main\x12^\n\x16getCellColorByFeatures\x12!.scope.CellColorByFeaturesRequest\x1a\x1f.scope.CellColorByFeaturesReply"\x00\x12j\n\x1agetCellAUCValuesByFeatures\x12%.scope.CellAUCValuesByFeaturesRequest\x1a#.scope.CellAUCValuesByFeaturesReply"\x00\x12I\n\x0fgetCellMetaData\x12\x1a.scope.CellMetaDataRequest\x1a\x18.scope.CellMetaDataReply"\x00\x12;\n\x0bgetFeatures\x12\x15.scope.FeatureRequest\x1a\x13.scope.FeatureReply"\x00\x12\x46\n\x0egetCoordinates\x12\x19.scope.CoordinatesRequest\x1a\x17.scope.CoordinatesReply"\x00\x12R\n\x12getRegulonMetaData\x12\x1d.scope.RegulonMetaDataRequest\x1a\x1b.scope.RegulonMetaDataReply"\x00\x12\x46\n\x0egetMarkerGenes\x12\x19.scope.MarkerGenesRequest\x1a\x17.scope.MarkerGenesReply"\x00\x12:\n\ngetMyLooms\x12\x15.scope.MyLoomsRequest\x1a\x13.scope.MyLoomsReply"\x00\x12g\n\x17translateLassoSelection\x12%.scope.TranslateLassoSelectionRequest\x1a#.scope.TranslateLassoSelectionReply"\x00\x12:\n\ngetCellIDs\x12\x15.scope.CellIDsRequest\x1a\x13.scope.CellIDsReply"\x00\x12Y\n\x13\x64oGeneSetEnrichment\x12\x1f.scope.GeneSetEnrichmentRequest\x1a\x1d.scope.GeneSetEnrichmentReply"\x00\x30\x01\x12\x31\n\x07getVmax\x12\x12.scope.VmaxRequest\x1a\x10.scope.VmaxReply"\x00\x12\x31\n\x07getUUID\x12\x12.scope.UUIDRequest\x1a\x10.scope.UUIDReply"\x00\x12X\n\x14getRemainingUUIDTime\x12\x1f.scope.RemainingUUIDTimeRequest\x1a\x1d.scope.RemainingUUIDTimeReply"\x00\x12\x46\n\x0cloomUploaded\x12\x1a.scope.LoomUploadedRequest\x1a\x18.scope.LoomUploadedReply"\x00\x12\x43\n\rgetMyGeneSets\x12\x18.scope.MyGeneSetsRequest\x1a\x16.scope.MyGeneSetsReply"\x00\x12L\n\x0e\x64\x65leteUserFile\x12\x1c.scope.DeleteUserFileRequest\x1a\x1a.scope.DeleteUserFileReply"\x00\x12Q\n\x0f\x64ownloadSubLoom\x12\x1d.scope.DownloadSubLoomRequest\x1a\x1b.scope.DownloadSubLoomReply"\x00\x30\x01\x12U\n\x11setAnnotationName\x12\x1f.scope.SetAnnotationNameRequest\x1a\x1d.scope.SetAnnotationNameReply"\x00\x12R\n\x10setLoomHierarchy\x12\x1e.scope.SetLoomHierarchyRequest\x1a\x1c.scope.SetLoomHierarchyReply"\x00\x12:\n\x08getORCID\x12\x16.scope.getORCIDRequest\x1a\x14.scope.getORCIDReply"\x00\x12L\n\x0egetORCIDStatus\x12\x1c.scope.getORCIDStatusRequest\x1a\x1a.scope.getORCIDStatusReply"\x00\x12\x64\n\x16setColabAnnotationData\x12$.scope.setColabAnnotationDataRequest\x1a".scope.setColabAnnotationDataReply"\x00\x12L\n\x0evoteAnnotation\x12\x1c.scope.voteAnnotationRequest\x1a\x1a.scope.voteAnnotationReply"\x00\x12\x45\n\x0egetNextCluster\x12\x1c.scope.getNextClusterRequest\x1a\x13.scope.FeatureReply"\x00\x12R\n\x10\x61\x64\x64NewClustering\x12\x1e.scope.AddNewClusteringRequest\x1a\x1c.scope.AddNewClusteringReply"\x00\x12P\n\x12getClusterOverlaps\x12 .scope.GetClusterOverlapsRequest\x1a\x16.scope.ClusterOverlaps"\x00\x12J\n\x10getFeatureLabels\x12\x1a.scope.FeatureLabelRequest\x1a\x18.scope.FeatureLabelReply"\x00\x12L\n\x10getEmbeddingTile\x12\x1b.scope.EmbeddingTileRequest\x1a\x19.scope.EmbeddingTileReply"\x00\x12N\n\x14getCoordinatesStream\x12\x19.scope.CoordinatesRequest\x1a\x17.scope.CoordinatesReply"\x00\x30\x01\x12\x66\n\x1cgetCellColorByFeaturesStream\x12!.scope.CellColorByFeaturesRequest\x1a\x1f.scope.CellColorByFeaturesReply"\x00\x30\x01\x12Q\n\x15getCellMetaDataStream\x12\x1a.scope.CellMetaDataRequest\x1a\x18.scope.CellMetaDataReply"\x00\x30\x01\x12r\n getCellAUCValuesByFeaturesStream\x12%.scope.CellAUCValuesByFeaturesRequest\x1a#.scope.CellAUCValuesByFeaturesReply"\x00\x30\x01\x12M\n\x11getGlobalFeatures\x12\x1b.scope.GlobalFeatureRequest\x1a\x19.scope.GlobalFeatureReply"\x00\x62\x06proto3',
 )
 
+_COLORENCODING = _descriptor.EnumDescriptor(
+    name="ColorEncoding",
+    full_name="scope.ColorEncoding",
+    filename=None,
+    file=DESCRIPTOR,
+    create_key=_descriptor._internal_create_key,
+    values=[
+        _descriptor.EnumValueDescriptor(
+            name="HEX",
+            index=0,
+            number=0,
+            serialized_options=None,
+            type=None,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.EnumValueDescriptor(
+            name="RGB",
+            index=1,
+            number=1,
+            serialized_options=None,
+            type=None,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.EnumValueDescriptor(
+            name="PALETTE",
+            index=2,
+            number=2,
+            serialized_options=None,
+            type=None,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    containing_type=None,
+    serialized_options=None,
+    serialized_start=8717,
+    serialized_end=8763,
+)
+_sym_db.RegisterEnumDescriptor(_COLORENCODING)
+
+ColorEncoding = enum_type_wrapper.EnumTypeWrapper(_COLORENCODING)
+_TILEAGGREGATION = _descriptor.EnumDescriptor(
+    name="TileAggregation",
+    full_name="scope.TileAggregation",
+    filename=None,
+    file=DESCRIPTOR,
+    create_key=_descriptor._internal_create_key,
+    values=[
+        _descriptor.EnumValueDescriptor(
+            name="MEAN",
+            index=0,
+            number=0,
+            serialized_options=None,
+            type=None,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.EnumValueDescriptor(
+            name="MAX",
+            index=1,
+            number=1,
+            serialized_options=None,
+            type=None,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    containing_type=None,
+    serialized_options=None,
+    serialized_start=8765,
+    serialized_end=8801,
+)
+_sym_db.RegisterEnumDescriptor(_TILEAGGREGATION)
+
+TileAggregation = enum_type_wrapper.EnumTypeWrapper(_TILEAGGREGATION)
+_COORDINATESENCODING = _descriptor.EnumDescriptor(
+    name="CoordinatesEncoding",
+    full_name="scope.CoordinatesEncoding",
+    filename=None,
+    file=DESCRIPTOR,
+    create_key=_descriptor._internal_create_key,
+    values=[
+        _descriptor.EnumValueDescriptor(
+            name="FLOAT_LIST",
+            index=0,
+            number=0,
+            serialized_options=None,
+            type=None,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.EnumValueDescriptor(
+            name="FLOAT32",
+            index=1,
+            number=1,
+            serialized_options=None,
+            type=None,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.EnumValueDescriptor(
+            name="UINT16",
+            index=2,
+            number=2,
+            serialized_options=None,
+            type=None,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    containing_type=None,
+    serialized_options=None,
+    serialized_start=8803,
+    serialized_end=8865,
+)
+_sym_db.RegisterEnumDescriptor(_COORDINATESENCODING)
+
+CoordinatesEncoding = enum_type_wrapper.EnumTypeWrapper(_COORDINATESENCODING)
+HEX = 0
+RGB = 1
+PALETTE = 2
+MEAN = 0
+MAX = 1
+FLOAT_LIST = 0
+FLOAT32 = 1
+UINT16 = 2
+
 
 _ERRORREPLY = _descriptor.Descriptor(
     name="ErrorReply",
@@ -301,6 +423,44 @@ _CELLCOLORBYFEATURESREQUEST = _descriptor.Descriptor(
             file=DESCRIPTOR,
             create_key=_descriptor._internal_create_key,
         ),
+        _descriptor.FieldDescriptor(
+            name="colorEncoding",
+            full_name="scope.CellColorByFeaturesRequest.colorEncoding",
+            index=11,
+            number=12,
+            type=14,
+            cpp_type=8,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="cellIndices",
+            full_name="scope.CellColorByFeaturesRequest.cellIndices",
+            index=12,
+            number=13,
+            type=5,
+            cpp_type=1,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
     ],
     extensions=[],
     nested_types=[],
@@ -311,7 +471,7 @@ _CELLCOLORBYFEATURESREQUEST = _descriptor.Descriptor(
     extension_ranges=[],
     oneofs=[],
     serialized_start=64,
-    serialized_end=329,
+    serialized_end=395,
 )
 
 
@@ -370,8 +530,8 @@ _COLORLEGEND = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=331,
-    serialized_end=376,
+    serialized_start=397,
+    serialized_end=442,
 )
 
 
@@ -535,57 +695,16 @@ _CELLCOLORBYFEATURESREPLY = _descriptor.Descriptor(
             file=DESCRIPTOR,
             create_key=_descriptor._internal_create_key,
         ),
-    ],
-    extensions=[],
-    nested_types=[],
-    enum_types=[],
-    serialized_options=None,
-    is_extendable=False,
-    syntax="proto3",
-    extension_ranges=[],
-    oneofs=[],
-    serialized_start=379,
-    serialized_end=599,
-)
-
-
-_CELLAUCVALUESBYFEATURESREQUEST = _descriptor.Descriptor(
-    name="CellAUCValuesByFeaturesRequest",
-    full_name="scope.CellAUCValuesByFeaturesRequest",
-    filename=None,
-    file=DESCRIPTOR,
-    containing_type=None,
-    create_key=_descriptor._internal_create_key,
-    fields=[
         _descriptor.FieldDescriptor(
-            name="loomFilePath",
-            full_name="scope.CellAUCValuesByFeaturesRequest.loomFilePath",
-            index=0,
-            number=1,
-            type=9,
-            cpp_type=9,
+            name="colorEncoding",
+            full_name="scope.CellColorByFeaturesReply.colorEncoding",
+            index=8,
+            number=9,
+            type=14,
+            cpp_type=8,
             label=1,
             has_default_value=False,
-            default_value=b"".decode("utf-8"),
-            message_type=None,
-            enum_type=None,
-            containing_type=None,
-            is_extension=False,
-            extension_scope=None,
-            serialized_options=None,
-            file=DESCRIPTOR,
-            create_key=_descriptor._internal_create_key,
-        ),
-        _descriptor.FieldDescriptor(
-            name="feature",
-            full_name="scope.CellAUCValuesByFeaturesRequest.feature",
-            index=1,
-            number=2,
-            type=9,
-            cpp_type=9,
-            label=3,
-            has_default_value=False,
-            default_value=[],
+            default_value=0,
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -596,10 +715,10 @@ _CELLAUCVALUESBYFEATURESREQUEST = _descriptor.Descriptor(
             create_key=_descriptor._internal_create_key,
         ),
         _descriptor.FieldDescriptor(
-            name="featureType",
-            full_name="scope.CellAUCValuesByFeaturesRequest.featureType",
-            index=2,
-            number=3,
+            name="palette",
+            full_name="scope.CellColorByFeaturesReply.palette",
+            index=9,
+            number=10,
             type=9,
             cpp_type=9,
             label=3,
@@ -623,29 +742,29 @@ _CELLAUCVALUESBYFEATURESREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=601,
-    serialized_end=693,
+    serialized_start=445,
+    serialized_end=727,
 )
 
 
-_CELLAUCVALUESBYFEATURESREPLY = _descriptor.Descriptor(
-    name="CellAUCValuesByFeaturesReply",
-    full_name="scope.CellAUCValuesByFeaturesReply",
+_EMBEDDINGTILEREQUEST = _descriptor.Descriptor(
+    name="EmbeddingTileRequest",
+    full_name="scope.EmbeddingTileRequest",
     filename=None,
     file=DESCRIPTOR,
     containing_type=None,
     create_key=_descriptor._internal_create_key,
     fields=[
         _descriptor.FieldDescriptor(
-            name="value",
-            full_name="scope.CellAUCValuesByFeaturesReply.value",
+            name="loomFilePath",
+            full_name="scope.EmbeddingTileRequest.loomFilePath",
             index=0,
             number=1,
-            type=2,
-            cpp_type=6,
-            label=3,
+            type=9,
+            cpp_type=9,
+            label=1,
             has_default_value=False,
-            default_value=[],
+            default_value=b"".decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -655,38 +774,16 @@ _CELLAUCVALUESBYFEATURESREPLY = _descriptor.Descriptor(
             file=DESCRIPTOR,
             create_key=_descriptor._internal_create_key,
         ),
-    ],
-    extensions=[],
-    nested_types=[],
-    enum_types=[],
-    serialized_options=None,
-    is_extendable=False,
-    syntax="proto3",
-    extension_ranges=[],
-    oneofs=[],
-    serialized_start=695,
-    serialized_end=740,
-)
-
-
-_FEATUREREQUEST = _descriptor.Descriptor(
-    name="FeatureRequest",
-    full_name="scope.FeatureRequest",
-    filename=None,
-    file=DESCRIPTOR,
-    containing_type=None,
-    create_key=_descriptor._internal_create_key,
-    fields=[
         _descriptor.FieldDescriptor(
-            name="loomFilePath",
-            full_name="scope.FeatureRequest.loomFilePath",
-            index=0,
-            number=1,
-            type=9,
-            cpp_type=9,
+            name="coordinatesID",
+            full_name="scope.EmbeddingTileRequest.coordinatesID",
+            index=1,
+            number=2,
+            type=5,
+            cpp_type=1,
             label=1,
             has_default_value=False,
-            default_value=b"".decode("utf-8"),
+            default_value=0,
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -697,15 +794,15 @@ _FEATUREREQUEST = _descriptor.Descriptor(
             create_key=_descriptor._internal_create_key,
         ),
         _descriptor.FieldDescriptor(
-            name="query",
-            full_name="scope.FeatureRequest.query",
-            index=1,
-            number=2,
-            type=9,
-            cpp_type=9,
+            name="colors",
+            full_name="scope.EmbeddingTileRequest.colors",
+            index=2,
+            number=3,
+            type=11,
+            cpp_type=10,
             label=1,
             has_default_value=False,
-            default_value=b"".decode("utf-8"),
+            default_value=None,
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -715,38 +812,16 @@ _FEATUREREQUEST = _descriptor.Descriptor(
             file=DESCRIPTOR,
             create_key=_descriptor._internal_create_key,
         ),
-    ],
-    extensions=[],
-    nested_types=[],
-    enum_types=[],
-    serialized_options=None,
-    is_extendable=False,
-    syntax="proto3",
-    extension_ranges=[],
-    oneofs=[],
-    serialized_start=742,
-    serialized_end=795,
-)
-
-
-_CELLMETADATAREQUEST = _descriptor.Descriptor(
-    name="CellMetaDataRequest",
-    full_name="scope.CellMetaDataRequest",
-    filename=None,
-    file=DESCRIPTOR,
-    containing_type=None,
-    create_key=_descriptor._internal_create_key,
-    fields=[
         _descriptor.FieldDescriptor(
-            name="loomFilePath",
-            full_name="scope.CellMetaDataRequest.loomFilePath",
-            index=0,
-            number=1,
-            type=9,
-            cpp_type=9,
+            name="zoom",
+            full_name="scope.EmbeddingTileRequest.zoom",
+            index=3,
+            number=4,
+            type=5,
+            cpp_type=1,
             label=1,
             has_default_value=False,
-            default_value=b"".decode("utf-8"),
+            default_value=0,
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -757,15 +832,15 @@ _CELLMETADATAREQUEST = _descriptor.Descriptor(
             create_key=_descriptor._internal_create_key,
         ),
         _descriptor.FieldDescriptor(
-            name="cellIndices",
-            full_name="scope.CellMetaDataRequest.cellIndices",
-            index=1,
-            number=2,
+            name="tileX",
+            full_name="scope.EmbeddingTileRequest.tileX",
+            index=4,
+            number=5,
             type=5,
             cpp_type=1,
-            label=3,
+            label=1,
             has_default_value=False,
-            default_value=[],
+            default_value=0,
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -776,12 +851,543 @@ _CELLMETADATAREQUEST = _descriptor.Descriptor(
             create_key=_descriptor._internal_create_key,
         ),
         _descriptor.FieldDescriptor(
-            name="selectedGenes",
-            full_name="scope.CellMetaDataRequest.selectedGenes",
-            index=2,
-            number=3,
-            type=9,
-            cpp_type=9,
+            name="tileY",
+            full_name="scope.EmbeddingTileRequest.tileY",
+            index=5,
+            number=6,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="tileSize",
+            full_name="scope.EmbeddingTileRequest.tileSize",
+            index=6,
+            number=7,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="aggregation",
+            full_name="scope.EmbeddingTileRequest.aggregation",
+            index=7,
+            number=8,
+            type=14,
+            cpp_type=8,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=730,
+    serialized_end=955,
+)
+
+
+_EMBEDDINGTILEREPLY = _descriptor.Descriptor(
+    name="EmbeddingTileReply",
+    full_name="scope.EmbeddingTileReply",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="png",
+            full_name="scope.EmbeddingTileReply.png",
+            index=0,
+            number=1,
+            type=12,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"",
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="error",
+            full_name="scope.EmbeddingTileReply.error",
+            index=1,
+            number=2,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=957,
+    serialized_end=1024,
+)
+
+
+_CELLAUCVALUESBYFEATURESREQUEST = _descriptor.Descriptor(
+    name="CellAUCValuesByFeaturesRequest",
+    full_name="scope.CellAUCValuesByFeaturesRequest",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="loomFilePath",
+            full_name="scope.CellAUCValuesByFeaturesRequest.loomFilePath",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="feature",
+            full_name="scope.CellAUCValuesByFeaturesRequest.feature",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="featureType",
+            full_name="scope.CellAUCValuesByFeaturesRequest.featureType",
+            index=2,
+            number=3,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1026,
+    serialized_end=1118,
+)
+
+
+_CELLAUCVALUESBYFEATURESREPLY = _descriptor.Descriptor(
+    name="CellAUCValuesByFeaturesReply",
+    full_name="scope.CellAUCValuesByFeaturesReply",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="value",
+            full_name="scope.CellAUCValuesByFeaturesReply.value",
+            index=0,
+            number=1,
+            type=2,
+            cpp_type=6,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1120,
+    serialized_end=1165,
+)
+
+
+_FEATUREREQUEST = _descriptor.Descriptor(
+    name="FeatureRequest",
+    full_name="scope.FeatureRequest",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="loomFilePath",
+            full_name="scope.FeatureRequest.loomFilePath",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="query",
+            full_name="scope.FeatureRequest.query",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="limit",
+            full_name="scope.FeatureRequest.limit",
+            index=2,
+            number=3,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1167,
+    serialized_end=1235,
+)
+
+
+_CELLMETADATAREQUEST = _descriptor.Descriptor(
+    name="CellMetaDataRequest",
+    full_name="scope.CellMetaDataRequest",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="loomFilePath",
+            full_name="scope.CellMetaDataRequest.loomFilePath",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="cellIndices",
+            full_name="scope.CellMetaDataRequest.cellIndices",
+            index=1,
+            number=2,
+            type=5,
+            cpp_type=1,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="selectedGenes",
+            full_name="scope.CellMetaDataRequest.selectedGenes",
+            index=2,
+            number=3,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="hasLogTransform",
+            full_name="scope.CellMetaDataRequest.hasLogTransform",
+            index=3,
+            number=4,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="hasCpmTransform",
+            full_name="scope.CellMetaDataRequest.hasCpmTransform",
+            index=4,
+            number=5,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="selectedRegulons",
+            full_name="scope.CellMetaDataRequest.selectedRegulons",
+            index=5,
+            number=6,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="clusterings",
+            full_name="scope.CellMetaDataRequest.clusterings",
+            index=6,
+            number=7,
+            type=5,
+            cpp_type=1,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="annotations",
+            full_name="scope.CellMetaDataRequest.annotations",
+            index=7,
+            number=8,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1238,
+    serialized_end=1443,
+)
+
+
+_FEATUREREPLY = _descriptor.Descriptor(
+    name="FeatureReply",
+    full_name="scope.FeatureReply",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="feature",
+            full_name="scope.FeatureReply.feature",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="featureType",
+            full_name="scope.FeatureReply.featureType",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
             label=3,
             has_default_value=False,
             default_value=[],
@@ -795,15 +1401,56 @@ _CELLMETADATAREQUEST = _descriptor.Descriptor(
             create_key=_descriptor._internal_create_key,
         ),
         _descriptor.FieldDescriptor(
-            name="hasLogTransform",
-            full_name="scope.CellMetaDataRequest.hasLogTransform",
-            index=3,
-            number=4,
-            type=8,
-            cpp_type=7,
+            name="featureDescription",
+            full_name="scope.FeatureReply.featureDescription",
+            index=2,
+            number=3,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1445,
+    serialized_end=1525,
+)
+
+
+_GLOBALFEATUREREQUEST = _descriptor.Descriptor(
+    name="GlobalFeatureRequest",
+    full_name="scope.GlobalFeatureRequest",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="query",
+            full_name="scope.GlobalFeatureRequest.query",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
             label=1,
             has_default_value=False,
-            default_value=False,
+            default_value=b"".decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -814,15 +1461,15 @@ _CELLMETADATAREQUEST = _descriptor.Descriptor(
             create_key=_descriptor._internal_create_key,
         ),
         _descriptor.FieldDescriptor(
-            name="hasCpmTransform",
-            full_name="scope.CellMetaDataRequest.hasCpmTransform",
-            index=4,
-            number=5,
-            type=8,
-            cpp_type=7,
+            name="limit",
+            full_name="scope.GlobalFeatureRequest.limit",
+            index=1,
+            number=2,
+            type=5,
+            cpp_type=1,
             label=1,
             has_default_value=False,
-            default_value=False,
+            default_value=0,
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -832,16 +1479,38 @@ _CELLMETADATAREQUEST = _descriptor.Descriptor(
             file=DESCRIPTOR,
             create_key=_descriptor._internal_create_key,
         ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1527,
+    serialized_end=1579,
+)
+
+
+_GLOBALFEATUREREPLY_GLOBALFEATURE = _descriptor.Descriptor(
+    name="GlobalFeature",
+    full_name="scope.GlobalFeatureReply.GlobalFeature",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
         _descriptor.FieldDescriptor(
-            name="selectedRegulons",
-            full_name="scope.CellMetaDataRequest.selectedRegulons",
-            index=5,
-            number=6,
+            name="feature",
+            full_name="scope.GlobalFeatureReply.GlobalFeature.feature",
+            index=0,
+            number=1,
             type=9,
             cpp_type=9,
-            label=3,
+            label=1,
             has_default_value=False,
-            default_value=[],
+            default_value=b"".decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -852,15 +1521,15 @@ _CELLMETADATAREQUEST = _descriptor.Descriptor(
             create_key=_descriptor._internal_create_key,
         ),
         _descriptor.FieldDescriptor(
-            name="clusterings",
-            full_name="scope.CellMetaDataRequest.clusterings",
-            index=6,
-            number=7,
-            type=5,
-            cpp_type=1,
-            label=3,
+            name="featureType",
+            full_name="scope.GlobalFeatureReply.GlobalFeature.featureType",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
+            label=1,
             has_default_value=False,
-            default_value=[],
+            default_value=b"".decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -871,10 +1540,10 @@ _CELLMETADATAREQUEST = _descriptor.Descriptor(
             create_key=_descriptor._internal_create_key,
         ),
         _descriptor.FieldDescriptor(
-            name="annotations",
-            full_name="scope.CellMetaDataRequest.annotations",
-            index=7,
-            number=8,
+            name="loomFilePaths",
+            full_name="scope.GlobalFeatureReply.GlobalFeature.loomFilePaths",
+            index=2,
+            number=3,
             type=9,
             cpp_type=9,
             label=3,
@@ -898,26 +1567,25 @@ _CELLMETADATAREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=798,
-    serialized_end=1003,
+    serialized_start=1663,
+    serialized_end=1739,
 )
 
-
-_FEATUREREPLY = _descriptor.Descriptor(
-    name="FeatureReply",
-    full_name="scope.FeatureReply",
+_GLOBALFEATUREREPLY = _descriptor.Descriptor(
+    name="GlobalFeatureReply",
+    full_name="scope.GlobalFeatureReply",
     filename=None,
     file=DESCRIPTOR,
     containing_type=None,
     create_key=_descriptor._internal_create_key,
     fields=[
         _descriptor.FieldDescriptor(
-            name="feature",
-            full_name="scope.FeatureReply.feature",
+            name="features",
+            full_name="scope.GlobalFeatureReply.features",
             index=0,
             number=1,
-            type=9,
-            cpp_type=9,
+            type=11,
+            cpp_type=10,
             label=3,
             has_default_value=False,
             default_value=[],
@@ -930,16 +1598,59 @@ _FEATUREREPLY = _descriptor.Descriptor(
             file=DESCRIPTOR,
             create_key=_descriptor._internal_create_key,
         ),
+    ],
+    extensions=[],
+    nested_types=[
+        _GLOBALFEATUREREPLY_GLOBALFEATURE,
+    ],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1582,
+    serialized_end=1739,
+)
+
+
+_VIEWPORT = _descriptor.Descriptor(
+    name="Viewport",
+    full_name="scope.Viewport",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
         _descriptor.FieldDescriptor(
-            name="featureType",
-            full_name="scope.FeatureReply.featureType",
+            name="xMin",
+            full_name="scope.Viewport.xMin",
+            index=0,
+            number=1,
+            type=2,
+            cpp_type=6,
+            label=1,
+            has_default_value=False,
+            default_value=float(0),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="xMax",
+            full_name="scope.Viewport.xMax",
             index=1,
             number=2,
-            type=9,
-            cpp_type=9,
-            label=3,
+            type=2,
+            cpp_type=6,
+            label=1,
             has_default_value=False,
-            default_value=[],
+            default_value=float(0),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -950,15 +1661,34 @@ _FEATUREREPLY = _descriptor.Descriptor(
             create_key=_descriptor._internal_create_key,
         ),
         _descriptor.FieldDescriptor(
-            name="featureDescription",
-            full_name="scope.FeatureReply.featureDescription",
+            name="yMin",
+            full_name="scope.Viewport.yMin",
             index=2,
             number=3,
-            type=9,
-            cpp_type=9,
-            label=3,
+            type=2,
+            cpp_type=6,
+            label=1,
             has_default_value=False,
-            default_value=[],
+            default_value=float(0),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="yMax",
+            full_name="scope.Viewport.yMax",
+            index=3,
+            number=4,
+            type=2,
+            cpp_type=6,
+            label=1,
+            has_default_value=False,
+            default_value=float(0),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -977,8 +1707,8 @@ _FEATUREREPLY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1005,
-    serialized_end=1085,
+    serialized_start=1741,
+    serialized_end=1807,
 )
 
 
@@ -991,10 +1721,67 @@ _COORDINATESREQUEST = _descriptor.Descriptor(
     create_key=_descriptor._internal_create_key,
     fields=[
         _descriptor.FieldDescriptor(
-            name="loomFilePath",
-            full_name="scope.CoordinatesRequest.loomFilePath",
-            index=0,
-            number=1,
+            name="loomFilePath",
+            full_name="scope.CoordinatesRequest.loomFilePath",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="coordinatesID",
+            full_name="scope.CoordinatesRequest.coordinatesID",
+            index=1,
+            number=2,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="annotation",
+            full_name="scope.CoordinatesRequest.annotation",
+            index=2,
+            number=3,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="logic",
+            full_name="scope.CoordinatesRequest.logic",
+            index=3,
+            number=4,
             type=9,
             cpp_type=9,
             label=1,
@@ -1010,10 +1797,10 @@ _COORDINATESREQUEST = _descriptor.Descriptor(
             create_key=_descriptor._internal_create_key,
         ),
         _descriptor.FieldDescriptor(
-            name="coordinatesID",
-            full_name="scope.CoordinatesRequest.coordinatesID",
-            index=1,
-            number=2,
+            name="maxCells",
+            full_name="scope.CoordinatesRequest.maxCells",
+            index=4,
+            number=5,
             type=5,
             cpp_type=1,
             label=1,
@@ -1029,15 +1816,15 @@ _COORDINATESREQUEST = _descriptor.Descriptor(
             create_key=_descriptor._internal_create_key,
         ),
         _descriptor.FieldDescriptor(
-            name="annotation",
-            full_name="scope.CoordinatesRequest.annotation",
-            index=2,
-            number=3,
+            name="viewport",
+            full_name="scope.CoordinatesRequest.viewport",
+            index=5,
+            number=6,
             type=11,
             cpp_type=10,
-            label=3,
+            label=1,
             has_default_value=False,
-            default_value=[],
+            default_value=None,
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -1048,15 +1835,15 @@ _COORDINATESREQUEST = _descriptor.Descriptor(
             create_key=_descriptor._internal_create_key,
         ),
         _descriptor.FieldDescriptor(
-            name="logic",
-            full_name="scope.CoordinatesRequest.logic",
-            index=3,
-            number=4,
-            type=9,
-            cpp_type=9,
+            name="encoding",
+            full_name="scope.CoordinatesRequest.encoding",
+            index=6,
+            number=7,
+            type=14,
+            cpp_type=8,
             label=1,
             has_default_value=False,
-            default_value=b"".decode("utf-8"),
+            default_value=0,
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -1075,8 +1862,8 @@ _COORDINATESREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1087,
-    serialized_end=1206,
+    serialized_start=1810,
+    serialized_end=2028,
 )
 
 
@@ -1145,6 +1932,177 @@ _COORDINATESREPLY = _descriptor.Descriptor(
             file=DESCRIPTOR,
             create_key=_descriptor._internal_create_key,
         ),
+        _descriptor.FieldDescriptor(
+            name="totalCells",
+            full_name="scope.CoordinatesReply.totalCells",
+            index=3,
+            number=4,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="encoding",
+            full_name="scope.CoordinatesReply.encoding",
+            index=4,
+            number=5,
+            type=14,
+            cpp_type=8,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="packedX",
+            full_name="scope.CoordinatesReply.packedX",
+            index=5,
+            number=6,
+            type=12,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"",
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="packedY",
+            full_name="scope.CoordinatesReply.packedY",
+            index=6,
+            number=7,
+            type=12,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"",
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="xMin",
+            full_name="scope.CoordinatesReply.xMin",
+            index=7,
+            number=8,
+            type=1,
+            cpp_type=5,
+            label=1,
+            has_default_value=False,
+            default_value=float(0),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="xMax",
+            full_name="scope.CoordinatesReply.xMax",
+            index=8,
+            number=9,
+            type=1,
+            cpp_type=5,
+            label=1,
+            has_default_value=False,
+            default_value=float(0),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="yMin",
+            full_name="scope.CoordinatesReply.yMin",
+            index=9,
+            number=10,
+            type=1,
+            cpp_type=5,
+            label=1,
+            has_default_value=False,
+            default_value=float(0),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="yMax",
+            full_name="scope.CoordinatesReply.yMax",
+            index=10,
+            number=11,
+            type=1,
+            cpp_type=5,
+            label=1,
+            has_default_value=False,
+            default_value=float(0),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="allCells",
+            full_name="scope.CoordinatesReply.allCells",
+            index=11,
+            number=12,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
     ],
     extensions=[],
     nested_types=[],
@@ -1154,8 +2112,8 @@ _COORDINATESREPLY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1208,
-    serialized_end=1269,
+    serialized_start=2031,
+    serialized_end=2266,
 )
 
 
@@ -1233,8 +2191,8 @@ _ANNOTATION = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1271,
-    serialized_end=1329,
+    serialized_start=2268,
+    serialized_end=2326,
 )
 
 
@@ -1293,8 +2251,8 @@ _COORDINATE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1331,
-    serialized_end=1365,
+    serialized_start=2328,
+    serialized_end=2362,
 )
 
 
@@ -1353,8 +2311,8 @@ _EDGE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1367,
-    serialized_end=1405,
+    serialized_start=2364,
+    serialized_end=2402,
 )
 
 
@@ -1432,8 +2390,8 @@ _TRAJECTORY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1407,
-    serialized_end=1502,
+    serialized_start=2404,
+    serialized_end=2499,
 )
 
 
@@ -1511,8 +2469,8 @@ _EMBEDDING = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1504,
-    serialized_end=1580,
+    serialized_start=2501,
+    serialized_end=2577,
 )
 
 
@@ -1590,8 +2548,8 @@ _CLUSTERMARKERMETRIC = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1582,
-    serialized_end=1656,
+    serialized_start=2579,
+    serialized_end=2653,
 )
 
 
@@ -1783,8 +2741,8 @@ _COLLABANNODATA = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1659,
-    serialized_end=1850,
+    serialized_start=2656,
+    serialized_end=2847,
 )
 
 
@@ -1862,8 +2820,8 @@ _COLLABANNOVOTER = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1852,
-    serialized_end=1927,
+    serialized_start=2849,
+    serialized_end=2924,
 )
 
 
@@ -1922,8 +2880,8 @@ _COLLABANNOVOTES = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1929,
-    serialized_end=2001,
+    serialized_start=2926,
+    serialized_end=2998,
 )
 
 
@@ -2020,8 +2978,8 @@ _CELLTYPEANNOTATION = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=2004,
-    serialized_end=2174,
+    serialized_start=3001,
+    serialized_end=3171,
 )
 
 
@@ -2099,8 +3057,8 @@ _CLUSTERANNOTATION = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=2176,
-    serialized_end=2285,
+    serialized_start=3173,
+    serialized_end=3282,
 )
 
 
@@ -2235,8 +3193,8 @@ _CLUSTERING = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=2288,
-    serialized_end=2466,
+    serialized_start=3285,
+    serialized_end=3463,
 )
 
 
@@ -2314,8 +3272,8 @@ _CELLMETADATA = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=2469,
-    serialized_end=2601,
+    serialized_start=3466,
+    serialized_end=3598,
 )
 
 
@@ -2374,8 +3332,8 @@ _AUCTHRESHOLD = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=2603,
-    serialized_end=2650,
+    serialized_start=3600,
+    serialized_end=3647,
 )
 
 
@@ -2472,8 +3430,8 @@ _REGULONGENESMETRIC = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=2652,
-    serialized_end=2741,
+    serialized_start=3649,
+    serialized_end=3738,
 )
 
 
@@ -2589,8 +3547,8 @@ _REGULON = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=2744,
-    serialized_end=2902,
+    serialized_start=3741,
+    serialized_end=3899,
 )
 
 
@@ -2725,8 +3683,8 @@ _FILEMETADATA = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=2905,
-    serialized_end=3056,
+    serialized_start=3902,
+    serialized_end=4053,
 )
 
 
@@ -2766,8 +3724,8 @@ _FEATUREVALUES = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=3058,
-    serialized_end=3091,
+    serialized_start=4055,
+    serialized_end=4088,
 )
 
 
@@ -2807,8 +3765,8 @@ _CELLANNOTATIONS = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=3093,
-    serialized_end=3131,
+    serialized_start=4090,
+    serialized_end=4128,
 )
 
 
@@ -2848,8 +3806,8 @@ _CELLCLUSTERS = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=3133,
-    serialized_end=3165,
+    serialized_start=4130,
+    serialized_end=4162,
 )
 
 
@@ -2946,8 +3904,8 @@ _CELLMETADATAREPLY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=3168,
-    serialized_end=3360,
+    serialized_start=4165,
+    serialized_end=4357,
 )
 
 
@@ -3006,8 +3964,8 @@ _REGULONMETADATAREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=3362,
-    serialized_end=3425,
+    serialized_start=4359,
+    serialized_end=4422,
 )
 
 
@@ -3047,8 +4005,8 @@ _REGULONMETADATAREPLY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=3427,
-    serialized_end=3486,
+    serialized_start=4424,
+    serialized_end=4483,
 )
 
 
@@ -3126,8 +4084,8 @@ _MARKERGENESREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=3488,
-    serialized_end=3571,
+    serialized_start=4485,
+    serialized_end=4568,
 )
 
 
@@ -3224,8 +4182,8 @@ _MARKERGENESMETRIC = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=3573,
-    serialized_end=3661,
+    serialized_start=4570,
+    serialized_end=4658,
 )
 
 
@@ -3284,8 +4242,8 @@ _MARKERGENESREPLY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=3663,
-    serialized_end=3739,
+    serialized_start=4660,
+    serialized_end=4736,
 )
 
 
@@ -3344,8 +4302,8 @@ _MYLOOMSREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=3741,
-    serialized_end=3789,
+    serialized_start=4738,
+    serialized_end=4786,
 )
 
 
@@ -3423,8 +4381,8 @@ _LOOMHEIERARCHY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=3791,
-    serialized_end=3843,
+    serialized_start=4788,
+    serialized_end=4840,
 )
 
 
@@ -3559,8 +4517,8 @@ _MYLOOM = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=3846,
-    serialized_end=4052,
+    serialized_start=4843,
+    serialized_end=5049,
 )
 
 
@@ -3619,8 +4577,8 @@ _MYLOOMSREPLY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=4054,
-    serialized_end=4116,
+    serialized_start=5051,
+    serialized_end=5113,
 )
 
 
@@ -3698,8 +4656,8 @@ _TRANSLATELASSOSELECTIONREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=4118,
-    serialized_end=4222,
+    serialized_start=5115,
+    serialized_end=5219,
 )
 
 
@@ -3739,8 +4697,8 @@ _TRANSLATELASSOSELECTIONREPLY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=4224,
-    serialized_end=4275,
+    serialized_start=5221,
+    serialized_end=5272,
 )
 
 
@@ -3799,8 +4757,8 @@ _CELLIDSREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=4277,
-    serialized_end=4336,
+    serialized_start=5274,
+    serialized_end=5333,
 )
 
 
@@ -3840,8 +4798,8 @@ _CELLIDSREPLY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=4338,
-    serialized_end=4369,
+    serialized_start=5335,
+    serialized_end=5366,
 )
 
 
@@ -3919,8 +4877,8 @@ _GENESETENRICHMENTREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=4371,
-    serialized_end=4460,
+    serialized_start=5368,
+    serialized_end=5457,
 )
 
 
@@ -3979,8 +4937,8 @@ _PROGRESS = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=4462,
-    serialized_end=4503,
+    serialized_start=5459,
+    serialized_end=5500,
 )
 
 
@@ -4058,8 +5016,8 @@ _GENESETENRICHMENTREPLY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=4506,
-    serialized_end=4634,
+    serialized_start=5503,
+    serialized_end=5631,
 )
 
 
@@ -4175,8 +5133,8 @@ _VMAXREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=4636,
-    serialized_end=4759,
+    serialized_start=5633,
+    serialized_end=5756,
 )
 
 
@@ -4235,8 +5193,8 @@ _VMAXREPLY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=4761,
-    serialized_end=4803,
+    serialized_start=5758,
+    serialized_end=5800,
 )
 
 
@@ -4276,8 +5234,8 @@ _UUIDREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=4805,
-    serialized_end=4830,
+    serialized_start=5802,
+    serialized_end=5827,
 )
 
 
@@ -4317,8 +5275,8 @@ _UUIDREPLY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=4832,
-    serialized_end=4857,
+    serialized_start=5829,
+    serialized_end=5854,
 )
 
 
@@ -4396,8 +5354,8 @@ _REMAININGUUIDTIMEREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=4859,
-    serialized_end=4932,
+    serialized_start=5856,
+    serialized_end=5929,
 )
 
 
@@ -4494,8 +5452,8 @@ _REMAININGUUIDTIMEREPLY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=4934,
-    serialized_end=5046,
+    serialized_start=5931,
+    serialized_end=6043,
 )
 
 
@@ -4554,8 +5512,8 @@ _LOOMUPLOADEDREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=5048,
-    serialized_end=5101,
+    serialized_start=6045,
+    serialized_end=6098,
 )
 
 
@@ -4575,8 +5533,8 @@ _LOOMUPLOADEDREPLY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=5103,
-    serialized_end=5122,
+    serialized_start=6100,
+    serialized_end=6119,
 )
 
 
@@ -4635,8 +5593,8 @@ _MYGENESET = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=5124,
-    serialized_end=5188,
+    serialized_start=6121,
+    serialized_end=6185,
 )
 
 
@@ -4676,8 +5634,8 @@ _MYGENESETSREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=5190,
-    serialized_end=5223,
+    serialized_start=6187,
+    serialized_end=6220,
 )
 
 
@@ -4717,8 +5675,8 @@ _MYGENESETSREPLY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=5225,
-    serialized_end=5280,
+    serialized_start=6222,
+    serialized_end=6277,
 )
 
 
@@ -4796,8 +5754,8 @@ _DELETEUSERFILEREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=5282,
-    serialized_end=5355,
+    serialized_start=6279,
+    serialized_end=6352,
 )
 
 
@@ -4837,8 +5795,8 @@ _DELETEUSERFILEREPLY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=5357,
-    serialized_end=5407,
+    serialized_start=6354,
+    serialized_end=6404,
 )
 
 
@@ -4973,8 +5931,8 @@ _DOWNLOADSUBLOOMREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=5410,
-    serialized_end=5559,
+    serialized_start=6407,
+    serialized_end=6556,
 )
 
 
@@ -5090,8 +6048,8 @@ _DOWNLOADSUBLOOMREPLY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=5562,
-    serialized_end=5713,
+    serialized_start=6559,
+    serialized_end=6710,
 )
 
 
@@ -5188,8 +6146,8 @@ _SETANNOTATIONNAMEREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=5715,
-    serialized_end=5825,
+    serialized_start=6712,
+    serialized_end=6822,
 )
 
 
@@ -5229,8 +6187,8 @@ _SETANNOTATIONNAMEREPLY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=5827,
-    serialized_end=5868,
+    serialized_start=6824,
+    serialized_end=6865,
 )
 
 
@@ -5327,8 +6285,8 @@ _SETLOOMHIERARCHYREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=5870,
-    serialized_end=5992,
+    serialized_start=6867,
+    serialized_end=6989,
 )
 
 
@@ -5368,8 +6326,8 @@ _SETLOOMHIERARCHYREPLY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=5994,
-    serialized_end=6034,
+    serialized_start=6991,
+    serialized_end=7031,
 )
 
 
@@ -5409,8 +6367,8 @@ _GETORCIDREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=6036,
-    serialized_end=6072,
+    serialized_start=7033,
+    serialized_end=7069,
 )
 
 
@@ -5507,8 +6465,8 @@ _GETORCIDREPLY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=6074,
-    serialized_end=6164,
+    serialized_start=7071,
+    serialized_end=7161,
 )
 
 
@@ -5528,8 +6486,8 @@ _GETORCIDSTATUSREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=6166,
-    serialized_end=6189,
+    serialized_start=7163,
+    serialized_end=7186,
 )
 
 
@@ -5569,8 +6527,8 @@ _GETORCIDSTATUSREPLY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=6191,
-    serialized_end=6228,
+    serialized_start=7188,
+    serialized_end=7225,
 )
 
 
@@ -5648,8 +6606,8 @@ _ORCIDINFOMESSAGE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=6230,
-    serialized_end=6303,
+    serialized_start=7227,
+    serialized_end=7300,
 )
 
 
@@ -5765,8 +6723,8 @@ _SETCOLABANNOTATIONDATAREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=6306,
-    serialized_end=6485,
+    serialized_start=7303,
+    serialized_end=7482,
 )
 
 
@@ -5825,8 +6783,8 @@ _SETCOLABANNOTATIONDATAREPLY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=6487,
-    serialized_end=6550,
+    serialized_start=7484,
+    serialized_end=7547,
 )
 
 
@@ -5961,8 +6919,8 @@ _VOTEANNOTATIONREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=6553,
-    serialized_end=6743,
+    serialized_start=7550,
+    serialized_end=7740,
 )
 
 
@@ -6021,8 +6979,8 @@ _VOTEANNOTATIONREPLY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=6745,
-    serialized_end=6800,
+    serialized_start=7742,
+    serialized_end=7797,
 )
 
 
@@ -6119,8 +7077,8 @@ _GETNEXTCLUSTERREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=6802,
-    serialized_end=6907,
+    serialized_start=7799,
+    serialized_end=7904,
 )
 
 
@@ -6198,8 +7156,8 @@ _NEWCLUSTERINFO = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=6909,
-    serialized_end=6986,
+    serialized_start=7906,
+    serialized_end=7983,
 )
 
 
@@ -6277,8 +7235,8 @@ _ADDNEWCLUSTERINGREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=6989,
-    serialized_end=7124,
+    serialized_start=7986,
+    serialized_end=8121,
 )
 
 
@@ -6337,8 +7295,8 @@ _ADDNEWCLUSTERINGREPLY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=7126,
-    serialized_end=7183,
+    serialized_start=8123,
+    serialized_end=8180,
 )
 
 
@@ -6397,8 +7355,8 @@ _GETCLUSTEROVERLAPSREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=7185,
-    serialized_end=7255,
+    serialized_start=8182,
+    serialized_end=8252,
 )
 
 
@@ -6514,8 +7472,8 @@ _CLUSTEROVERLAPS_CLUSTEROVERLAP = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=7342,
-    serialized_end=7474,
+    serialized_start=8339,
+    serialized_end=8471,
 )
 
 _CLUSTEROVERLAPS = _descriptor.Descriptor(
@@ -6556,8 +7514,8 @@ _CLUSTEROVERLAPS = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=7258,
-    serialized_end=7474,
+    serialized_start=8255,
+    serialized_end=8471,
 )
 
 
@@ -6635,8 +7593,8 @@ _FEATURELABELREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=7476,
-    serialized_end=7555,
+    serialized_start=8473,
+    serialized_end=8552,
 )
 
 
@@ -6714,8 +7672,8 @@ _FEATURELABELREPLY_FEATURELABEL = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=7634,
-    serialized_end=7718,
+    serialized_start=8631,
+    serialized_end=8715,
 )
 
 _FEATURELABELREPLY = _descriptor.Descriptor(
@@ -6756,14 +7714,24 @@ _FEATURELABELREPLY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=7558,
-    serialized_end=7718,
+    serialized_start=8555,
+    serialized_end=8715,
 )
 
 _CELLCOLORBYFEATURESREQUEST.fields_by_name["annotation"].message_type = _ANNOTATION
+_CELLCOLORBYFEATURESREQUEST.fields_by_name["colorEncoding"].enum_type = _COLORENCODING
 _CELLCOLORBYFEATURESREPLY.fields_by_name["legend"].message_type = _COLORLEGEND
 _CELLCOLORBYFEATURESREPLY.fields_by_name["error"].message_type = _ERRORREPLY
+_CELLCOLORBYFEATURESREPLY.fields_by_name["colorEncoding"].enum_type = _COLORENCODING
+_EMBEDDINGTILEREQUEST.fields_by_name["colors"].message_type = _CELLCOLORBYFEATURESREQUEST
+_EMBEDDINGTILEREQUEST.fields_by_name["aggregation"].enum_type = _TILEAGGREGATION
+_EMBEDDINGTILEREPLY.fields_by_name["error"].message_type = _ERRORREPLY
+_GLOBALFEATUREREPLY_GLOBALFEATURE.containing_type = _GLOBALFEATUREREPLY
+_GLOBALFEATUREREPLY.fields_by_name["features"].message_type = _GLOBALFEATUREREPLY_GLOBALFEATURE
 _COORDINATESREQUEST.fields_by_name["annotation"].message_type = _ANNOTATION
+_COORDINATESREQUEST.fields_by_name["viewport"].message_type = _VIEWPORT
+_COORDINATESREQUEST.fields_by_name["encoding"].enum_type = _COORDINATESENCODING
+_COORDINATESREPLY.fields_by_name["encoding"].enum_type = _COORDINATESENCODING
 _TRAJECTORY.fields_by_name["edges"].message_type = _EDGE
 _TRAJECTORY.fields_by_name["coordinates"].message_type = _COORDINATE
 _EMBEDDING.fields_by_name["trajectory"].message_type = _TRAJECTORY
@@ -6809,11 +7777,16 @@ DESCRIPTOR.message_types_by_name["ErrorReply"] = _ERRORREPLY
 DESCRIPTOR.message_types_by_name["CellColorByFeaturesRequest"] = _CELLCOLORBYFEATURESREQUEST
 DESCRIPTOR.message_types_by_name["ColorLegend"] = _COLORLEGEND
 DESCRIPTOR.message_types_by_name["CellColorByFeaturesReply"] = _CELLCOLORBYFEATURESREPLY
+DESCRIPTOR.message_types_by_name["EmbeddingTileRequest"] = _EMBEDDINGTILEREQUEST
+DESCRIPTOR.message_types_by_name["EmbeddingTileReply"] = _EMBEDDINGTILEREPLY
 DESCRIPTOR.message_types_by_name["CellAUCValuesByFeaturesRequest"] = _CELLAUCVALUESBYFEATURESREQUEST
 DESCRIPTOR.message_types_by_name["CellAUCValuesByFeaturesReply"] = _CELLAUCVALUESBYFEATURESREPLY
 DESCRIPTOR.message_types_by_name["FeatureRequest"] = _FEATUREREQUEST
 DESCRIPTOR.message_types_by_name["CellMetaDataRequest"] = _CELLMETADATAREQUEST
 DESCRIPTOR.message_types_by_name["FeatureReply"] = _FEATUREREPLY
+DESCRIPTOR.message_types_by_name["GlobalFeatureRequest"] = _GLOBALFEATUREREQUEST
+DESCRIPTOR.message_types_by_name["GlobalFeatureReply"] = _GLOBALFEATUREREPLY
+DESCRIPTOR.message_types_by_name["Viewport"] = _VIEWPORT
 DESCRIPTOR.message_types_by_name["CoordinatesRequest"] = _COORDINATESREQUEST
 DESCRIPTOR.message_types_by_name["CoordinatesReply"] = _COORDINATESREPLY
 DESCRIPTOR.message_types_by_name["Annotation"] = _ANNOTATION
@@ -6889,6 +7862,9 @@ DESCRIPTOR.message_types_by_name["GetClusterOverlapsRequest"] = _GETCLUSTEROVERL
 DESCRIPTOR.message_types_by_name["ClusterOverlaps"] = _CLUSTEROVERLAPS
 DESCRIPTOR.message_types_by_name["FeatureLabelRequest"] = _FEATURELABELREQUEST
 DESCRIPTOR.message_types_by_name["FeatureLabelReply"] = _FEATURELABELREPLY
+DESCRIPTOR.enum_types_by_name["ColorEncoding"] = _COLORENCODING
+DESCRIPTOR.enum_types_by_name["TileAggregation"] = _TILEAGGREGATION
+DESCRIPTOR.enum_types_by_name["CoordinatesEncoding"] = _COORDINATESENCODING
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
 ErrorReply = _reflection.GeneratedProtocolMessageType(
@@ -6935,6 +7911,28 @@ CellColorByFeaturesReply = _reflection.GeneratedProtocolMessageType(
 )
 _sym_db.RegisterMessage(CellColorByFeaturesReply)
 
+EmbeddingTileRequest = _reflection.GeneratedProtocolMessageType(
+    "EmbeddingTileRequest",
+    (_message.Message,),
+    {
+        "DESCRIPTOR": _EMBEDDINGTILEREQUEST,
+        "__module__": "s_pb2"
+        # @@protoc_insertion_point(class_scope:scope.EmbeddingTileRequest)
+    },
+)
+_sym_db.RegisterMessage(EmbeddingTileRequest)
+
+EmbeddingTileReply = _reflection.GeneratedProtocolMessageType(
+    "EmbeddingTileReply",
+    (_message.Message,),
+    {
+        "DESCRIPTOR": _EMBEDDINGTILEREPLY,
+        "__module__": "s_pb2"
+        # @@protoc_insertion_point(class_scope:scope.EmbeddingTileReply)
+    },
+)
+_sym_db.RegisterMessage(EmbeddingTileReply)
+
 CellAUCValuesByFeaturesRequest = _reflection.GeneratedProtocolMessageType(
     "CellAUCValuesByFeaturesRequest",
     (_message.Message,),
@@ -6990,6 +7988,49 @@ FeatureReply = _reflection.GeneratedProtocolMessageType(
 )
 _sym_db.RegisterMessage(FeatureReply)
 
+GlobalFeatureRequest = _reflection.GeneratedProtocolMessageType(
+    "GlobalFeatureRequest",
+    (_message.Message,),
+    {
+        "DESCRIPTOR": _GLOBALFEATUREREQUEST,
+        "__module__": "s_pb2"
+        # @@protoc_insertion_point(class_scope:scope.GlobalFeatureRequest)
+    },
+)
+_sym_db.RegisterMessage(GlobalFeatureRequest)
+
+GlobalFeatureReply = _reflection.GeneratedProtocolMessageType(
+    "GlobalFeatureReply",
+    (_message.Message,),
+    {
+        "GlobalFeature": _reflection.GeneratedProtocolMessageType(
+            "GlobalFeature",
+            (_message.Message,),
+            {
+                "DESCRIPTOR": _GLOBALFEATUREREPLY_GLOBALFEATURE,
+                "__module__": "s_pb2"
+                # @@protoc_insertion_point(class_scope:scope.GlobalFeatureReply.GlobalFeature)
+            },
+        ),
+        "DESCRIPTOR": _GLOBALFEATUREREPLY,
+        "__module__": "s_pb2"
+        # @@protoc_insertion_point(class_scope:scope.GlobalFeatureReply)
+    },
+)
+_sym_db.RegisterMessage(GlobalFeatureReply)
+_sym_db.RegisterMessage(GlobalFeatureReply.GlobalFeature)
+
+Viewport = _reflection.GeneratedProtocolMessageType(
+    "Viewport",
+    (_message.Message,),
+    {
+        "DESCRIPTOR": _VIEWPORT,
+        "__module__": "s_pb2"
+        # @@protoc_insertion_point(class_scope:scope.Viewport)
+    },
+)
+_sym_db.RegisterMessage(Viewport)
+
 CoordinatesRequest = _reflection.GeneratedProtocolMessageType(
     "CoordinatesRequest",
     (_message.Message,),
@@ -7843,8 +8884,8 @@ _MAIN = _descriptor.ServiceDescriptor(
     index=0,
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
-    serialized_start=7721,
-    serialized_end=9907,
+    serialized_start=8868,
+    serialized_end=11594,
     methods=[
         _descriptor.MethodDescriptor(
             name="getCellColorByFeatures",
@@ -8126,6 +9167,66 @@ _MAIN = _descriptor.ServiceDescriptor(
             serialized_options=None,
             create_key=_descriptor._internal_create_key,
         ),
+        _descriptor.MethodDescriptor(
+            name="getEmbeddingTile",
+            full_name="scope.Main.getEmbeddingTile",
+            index=28,
+            containing_service=None,
+            input_type=_EMBEDDINGTILEREQUEST,
+            output_type=_EMBEDDINGTILEREPLY,
+            serialized_options=None,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.MethodDescriptor(
+            name="getCoordinatesStream",
+            full_name="scope.Main.getCoordinatesStream",
+            index=29,
+            containing_service=None,
+            input_type=_COORDINATESREQUEST,
+            output_type=_COORDINATESREPLY,
+            serialized_options=None,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.MethodDescriptor(
+            name="getCellColorByFeaturesStream",
+            full_name="scope.Main.getCellColorByFeaturesStream",
+            index=30,
+            containing_service=None,
+            input_type=_CELLCOLORBYFEATURESREQUEST,
+            output_type=_CELLCOLORBYFEATURESREPLY,
+            serialized_options=None,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.MethodDescriptor(
+            name="getCellMetaDataStream",
+            full_name="scope.Main.getCellMetaDataStream",
+            index=31,
+            containing_service=None,
+            input_type=_CELLMETADATAREQUEST,
+            output_type=_CELLMETADATAREPLY,
+            serialized_options=None,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.MethodDescriptor(
+            name="getCellAUCValuesByFeaturesStream",
+            full_name="scope.Main.getCellAUCValuesByFeaturesStream",
+            index=32,
+            containing_service=None,
+            input_type=_CELLAUCVALUESBYFEATURESREQUEST,
+            output_type=_CELLAUCVALUESBYFEATURESREPLY,
+            serialized_options=None,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.MethodDescriptor(
+            name="getGlobalFeatures",
+            full_name="scope.Main.getGlobalFeatures",
+            index=33,
+            containing_service=None,
+            input_type=_GLOBALFEATUREREQUEST,
+            output_type=_GLOBALFEATUREREPLY,
+            serialized_options=None,
+            create_key=_descriptor._internal_create_key,
+        ),
     ],
 )
 _sym_db.RegisterServiceDescriptor(_MAIN)
@@ -2,6 +2,7 @@
 import sys
 from google.protobuf.descriptor import (
     Descriptor as google___protobuf___descriptor___Descriptor,
+    EnumDescriptor as google___protobuf___descriptor___EnumDescriptor,
     FileDescriptor as google___protobuf___descriptor___FileDescriptor,
 )
 
@@ -10,14 +11,20 @@ from google.protobuf.internal.containers import (
     RepeatedScalarFieldContainer as google___protobuf___internal___containers___RepeatedScalarFieldContainer,
 )
 
+from google.protobuf.internal.enum_type_wrapper import (
+    _EnumTypeWrapper as google___protobuf___internal___enum_type_wrapper____EnumTypeWrapper,
+)
+
 from google.protobuf.message import (
     Message as google___protobuf___message___Message,
 )
 
 from typing import (
     Iterable as typing___Iterable,
+    NewType as typing___NewType,
     Optional as typing___Optional,
     Text as typing___Text,
+    cast as typing___cast,
 )
 
 from typing_extensions import (
@@ -31,6 +38,51 @@ builtin___int = int
 
 DESCRIPTOR: google___protobuf___descriptor___FileDescriptor = ...
 
+ColorEncodingValue = typing___NewType("ColorEncodingValue", builtin___int)
+type___ColorEncodingValue = ColorEncodingValue
+ColorEncoding: _ColorEncoding
+
+class _ColorEncoding(google___protobuf___internal___enum_type_wrapper____EnumTypeWrapper[ColorEncodingValue]):
+    DESCRIPTOR: google___protobuf___descriptor___EnumDescriptor = ...
+    HEX = typing___cast(ColorEncodingValue, 0)
+    RGB = typing___cast(ColorEncodingValue, 1)
+    PALETTE = typing___cast(ColorEncodingValue, 2)
+
+HEX = typing___cast(ColorEncodingValue, 0)
+RGB = typing___cast(ColorEncodingValue, 1)
+PALETTE = typing___cast(ColorEncodingValue, 2)
+type___ColorEncoding = ColorEncoding
+
+TileAggregationValue = typing___NewType("TileAggregationValue", builtin___int)
+type___TileAggregationValue = TileAggregationValue
+TileAggregation: _TileAggregation
+
+class _TileAggregation(google___protobuf___internal___enum_type_wrapper____EnumTypeWrapper[TileAggregationValue]):
+    DESCRIPTOR: google___protobuf___descriptor___EnumDescriptor = ...
+    MEAN = typing___cast(TileAggregationValue, 0)
+    MAX = typing___cast(TileAggregationValue, 1)
+
+MEAN = typing___cast(TileAggregationValue, 0)
+MAX = typing___cast(TileAggregationValue, 1)
+type___TileAggregation = TileAggregation
+
+CoordinatesEncodingValue = typing___NewType("CoordinatesEncodingValue", builtin___int)
+type___CoordinatesEncodingValue = CoordinatesEncodingValue
+CoordinatesEncoding: _CoordinatesEncoding
+
+class _CoordinatesEncoding(
+    google___protobuf___internal___enum_type_wrapper____EnumTypeWrapper[CoordinatesEncodingValue]
+):
+    DESCRIPTOR: google___protobuf___descriptor___EnumDescriptor = ...
+    FLOAT_LIST = typing___cast(CoordinatesEncodingValue, 0)
+    FLOAT32 = typing___cast(CoordinatesEncodingValue, 1)
+    UINT16 = typing___cast(CoordinatesEncodingValue, 2)
+
+FLOAT_LIST = typing___cast(CoordinatesEncodingValue, 0)
+FLOAT32 = typing___cast(CoordinatesEncodingValue, 1)
+UINT16 = typing___cast(CoordinatesEncodingValue, 2)
+type___CoordinatesEncoding = CoordinatesEncoding
+
 class ErrorReply(google___protobuf___message___Message):
     DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
     type: typing___Text = ...
@@ -57,6 +109,8 @@ class CellColorByFeaturesRequest(google___protobuf___message___Message):
     vmax: google___protobuf___internal___containers___RepeatedScalarFieldContainer[builtin___float] = ...
     vmin: google___protobuf___internal___containers___RepeatedScalarFieldContainer[builtin___float] = ...
     logic: typing___Text = ...
+    colorEncoding: type___ColorEncodingValue = ...
+    cellIndices: google___protobuf___internal___containers___RepeatedScalarFieldContainer[builtin___int] = ...
     @property
     def annotation(
         self,
@@ -75,12 +129,18 @@ class CellColorByFeaturesRequest(google___protobuf___message___Message):
         vmax: typing___Optional[typing___Iterable[builtin___float]] = None,
         vmin: typing___Optional[typing___Iterable[builtin___float]] = None,
         logic: typing___Optional[typing___Text] = None,
+        colorEncoding: typing___Optional[type___ColorEncodingValue] = None,
+        cellIndices: typing___Optional[typing___Iterable[builtin___int]] = None,
     ) -> None: ...
     def ClearField(
         self,
         field_name: typing_extensions___Literal[
             "annotation",
             b"annotation",
+            "cellIndices",
+            b"cellIndices",
+            "colorEncoding",
+            b"colorEncoding",
             "feature",
             b"feature",
             "featureType",
@@ -128,6 +188,8 @@ class CellColorByFeaturesReply(google___protobuf___message___Message):
     vmax: google___protobuf___internal___containers___RepeatedScalarFieldContainer[builtin___float] = ...
     maxVmax: google___protobuf___internal___containers___RepeatedScalarFieldContainer[builtin___float] = ...
     cellIndices: google___protobuf___internal___containers___RepeatedScalarFieldContainer[builtin___int] = ...
+    colorEncoding: type___ColorEncodingValue = ...
+    palette: google___protobuf___internal___containers___RepeatedScalarFieldContainer[typing___Text] = ...
     @property
     def legend(self) -> type___ColorLegend: ...
     @property
@@ -143,6 +205,8 @@ class CellColorByFeaturesReply(google___protobuf___message___Message):
         cellIndices: typing___Optional[typing___Iterable[builtin___int]] = None,
         legend: typing___Optional[type___ColorLegend] = None,
         error: typing___Optional[type___ErrorReply] = None,
+        colorEncoding: typing___Optional[type___ColorEncodingValue] = None,
+        palette: typing___Optional[typing___Iterable[typing___Text]] = None,
     ) -> None: ...
     def HasField(
         self, field_name: typing_extensions___Literal["error", b"error", "legend", b"legend"]
@@ -154,6 +218,8 @@ class CellColorByFeaturesReply(google___protobuf___message___Message):
             b"cellIndices",
             "color",
             b"color",
+            "colorEncoding",
+            b"colorEncoding",
             "compressedColor",
             b"compressedColor",
             "error",
@@ -164,6 +230,8 @@ class CellColorByFeaturesReply(google___protobuf___message___Message):
             b"legend",
             "maxVmax",
             b"maxVmax",
+            "palette",
+            b"palette",
             "vmax",
             b"vmax",
         ],
@@ -171,6 +239,70 @@ class CellColorByFeaturesReply(google___protobuf___message___Message):
 
 type___CellColorByFeaturesReply = CellColorByFeaturesReply
 
+class EmbeddingTileRequest(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    loomFilePath: typing___Text = ...
+    coordinatesID: builtin___int = ...
+    zoom: builtin___int = ...
+    tileX: builtin___int = ...
+    tileY: builtin___int = ...
+    tileSize: builtin___int = ...
+    aggregation: type___TileAggregationValue = ...
+    @property
+    def colors(self) -> type___CellColorByFeaturesRequest: ...
+    def __init__(
+        self,
+        *,
+        loomFilePath: typing___Optional[typing___Text] = None,
+        coordinatesID: typing___Optional[builtin___int] = None,
+        colors: typing___Optional[type___CellColorByFeaturesRequest] = None,
+        zoom: typing___Optional[builtin___int] = None,
+        tileX: typing___Optional[builtin___int] = None,
+        tileY: typing___Optional[builtin___int] = None,
+        tileSize: typing___Optional[builtin___int] = None,
+        aggregation: typing___Optional[type___TileAggregationValue] = None,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions___Literal["colors", b"colors"]) -> builtin___bool: ...
+    def ClearField(
+        self,
+        field_name: typing_extensions___Literal[
+            "aggregation",
+            b"aggregation",
+            "colors",
+            b"colors",
+            "coordinatesID",
+            b"coordinatesID",
+            "loomFilePath",
+            b"loomFilePath",
+            "tileSize",
+            b"tileSize",
+            "tileX",
+            b"tileX",
+            "tileY",
+            b"tileY",
+            "zoom",
+            b"zoom",
+        ],
+    ) -> None: ...
+
+type___EmbeddingTileRequest = EmbeddingTileRequest
+
+class EmbeddingTileReply(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    png: builtin___bytes = ...
+    @property
+    def error(self) -> type___ErrorReply: ...
+    def __init__(
+        self,
+        *,
+        png: typing___Optional[builtin___bytes] = None,
+        error: typing___Optional[type___ErrorReply] = None,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions___Literal["error", b"error"]) -> builtin___bool: ...
+    def ClearField(self, field_name: typing_extensions___Literal["error", b"error", "png", b"png"]) -> None: ...
+
+type___EmbeddingTileReply = EmbeddingTileReply
+
 class CellAUCValuesByFeaturesRequest(google___protobuf___message___Message):
     DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
     loomFilePath: typing___Text = ...
@@ -208,14 +340,17 @@ class FeatureRequest(google___protobuf___message___Message):
     DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
     loomFilePath: typing___Text = ...
     query: typing___Text = ...
+    limit: builtin___int = ...
     def __init__(
         self,
         *,
         loomFilePath: typing___Optional[typing___Text] = None,
         query: typing___Optional[typing___Text] = None,
+        limit: typing___Optional[builtin___int] = None,
     ) -> None: ...
     def ClearField(
-        self, field_name: typing_extensions___Literal["loomFilePath", b"loomFilePath", "query", b"query"]
+        self,
+        field_name: typing_extensions___Literal["limit", b"limit", "loomFilePath", b"loomFilePath", "query", b"query"],
     ) -> None: ...
 
 type___FeatureRequest = FeatureRequest
@@ -287,15 +422,90 @@ class FeatureReply(google___protobuf___message___Message):
 
 type___FeatureReply = FeatureReply
 
+class GlobalFeatureRequest(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    query: typing___Text = ...
+    limit: builtin___int = ...
+    def __init__(
+        self,
+        *,
+        query: typing___Optional[typing___Text] = None,
+        limit: typing___Optional[builtin___int] = None,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions___Literal["limit", b"limit", "query", b"query"]) -> None: ...
+
+type___GlobalFeatureRequest = GlobalFeatureRequest
+
+class GlobalFeatureReply(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class GlobalFeature(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        feature: typing___Text = ...
+        featureType: typing___Text = ...
+        loomFilePaths: google___protobuf___internal___containers___RepeatedScalarFieldContainer[typing___Text] = ...
+        def __init__(
+            self,
+            *,
+            feature: typing___Optional[typing___Text] = None,
+            featureType: typing___Optional[typing___Text] = None,
+            loomFilePaths: typing___Optional[typing___Iterable[typing___Text]] = None,
+        ) -> None: ...
+        def ClearField(
+            self,
+            field_name: typing_extensions___Literal[
+                "feature", b"feature", "featureType", b"featureType", "loomFilePaths", b"loomFilePaths"
+            ],
+        ) -> None: ...
+    type___GlobalFeature = GlobalFeature
+    @property
+    def features(
+        self,
+    ) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[
+        type___GlobalFeatureReply.GlobalFeature
+    ]: ...
+    def __init__(
+        self,
+        *,
+        features: typing___Optional[typing___Iterable[type___GlobalFeatureReply.GlobalFeature]] = None,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions___Literal["features", b"features"]) -> None: ...
+
+type___GlobalFeatureReply = GlobalFeatureReply
+
+class Viewport(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    xMin: builtin___float = ...
+    xMax: builtin___float = ...
+    yMin: builtin___float = ...
+    yMax: builtin___float = ...
+    def __init__(
+        self,
+        *,
+        xMin: typing___Optional[builtin___float] = None,
+        xMax: typing___Optional[builtin___float] = None,
+        yMin: typing___Optional[builtin___float] = None,
+        yMax: typing___Optional[builtin___float] = None,
+    ) -> None: ...
+    def ClearField(
+        self,
+        field_name: typing_extensions___Literal["xMax", b"xMax", "xMin", b"xMin", "yMax", b"yMax", "yMin", b"yMin"],
+    ) -> None: ...
+
+type___Viewport = Viewport
+
 class CoordinatesRequest(google___protobuf___message___Message):
     DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
     loomFilePath: typing___Text = ...
     coordinatesID: builtin___int = ...
     logic: typing___Text = ...
+    maxCells: builtin___int = ...
+    encoding: type___CoordinatesEncodingValue = ...
     @property
     def annotation(
         self,
     ) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[type___Annotation]: ...
+    @property
+    def viewport(self) -> type___Viewport: ...
     def __init__(
         self,
         *,
@@ -303,7 +513,11 @@ class CoordinatesRequest(google___protobuf___message___Message):
         coordinatesID: typing___Optional[builtin___int] = None,
         annotation: typing___Optional[typing___Iterable[type___Annotation]] = None,
         logic: typing___Optional[typing___Text] = None,
+        maxCells: typing___Optional[builtin___int] = None,
+        viewport: typing___Optional[type___Viewport] = None,
+        encoding: typing___Optional[type___CoordinatesEncodingValue] = None,
     ) -> None: ...
+    def HasField(self, field_name: typing_extensions___Literal["viewport", b"viewport"]) -> builtin___bool: ...
     def ClearField(
         self,
         field_name: typing_extensions___Literal[
@@ -311,10 +525,16 @@ class CoordinatesRequest(google___protobuf___message___Message):
             b"annotation",
             "coordinatesID",
             b"coordinatesID",
+            "encoding",
+            b"encoding",
             "logic",
             b"logic",
             "loomFilePath",
             b"loomFilePath",
+            "maxCells",
+            b"maxCells",
+            "viewport",
+            b"viewport",
         ],
     ) -> None: ...
 
@@ -325,15 +545,59 @@ class CoordinatesReply(google___protobuf___message___Message):
     x: google___protobuf___internal___containers___RepeatedScalarFieldContainer[builtin___float] = ...
     y: google___protobuf___internal___containers___RepeatedScalarFieldContainer[builtin___float] = ...
     cellIndices: google___protobuf___internal___containers___RepeatedScalarFieldContainer[builtin___int] = ...
+    totalCells: builtin___int = ...
+    encoding: type___CoordinatesEncodingValue = ...
+    packedX: builtin___bytes = ...
+    packedY: builtin___bytes = ...
+    xMin: builtin___float = ...
+    xMax: builtin___float = ...
+    yMin: builtin___float = ...
+    yMax: builtin___float = ...
+    allCells: builtin___bool = ...
     def __init__(
         self,
         *,
         x: typing___Optional[typing___Iterable[builtin___float]] = None,
         y: typing___Optional[typing___Iterable[builtin___float]] = None,
         cellIndices: typing___Optional[typing___Iterable[builtin___int]] = None,
+        totalCells: typing___Optional[builtin___int] = None,
+        encoding: typing___Optional[type___CoordinatesEncodingValue] = None,
+        packedX: typing___Optional[builtin___bytes] = None,
+        packedY: typing___Optional[builtin___bytes] = None,
+        xMin: typing___Optional[builtin___float] = None,
+        xMax: typing___Optional[builtin___float] = None,
+        yMin: typing___Optional[builtin___float] = None,
+        yMax: typing___Optional[builtin___float] = None,
+        allCells: typing___Optional[builtin___bool] = None,
     ) -> None: ...
     def ClearField(
-        self, field_name: typing_extensions___Literal["cellIndices", b"cellIndices", "x", b"x", "y", b"y"]
+        self,
+        field_name: typing_extensions___Literal[
+            "allCells",
+            b"allCells",
+            "cellIndices",
+            b"cellIndices",
+            "encoding",
+            b"encoding",
+            "packedX",
+            b"packedX",
+            "packedY",
+            b"packedY",
+            "totalCells",
+            b"totalCells",
+            "x",
+            b"x",
+            "xMax",
+            b"xMax",
+            "xMin",
+            b"xMin",
+            "y",
+            b"y",
+            "yMax",
+            b"yMax",
+            "yMin",
+            b"yMin",
+        ],
     ) -> None: ...
 
 type___CoordinatesReply = CoordinatesReply
@@ -155,6 +155,36 @@ class MainStub(object):
             request_serializer=s__pb2.FeatureLabelRequest.SerializeToString,
             response_deserializer=s__pb2.FeatureLabelReply.FromString,
         )
+        self.getEmbeddingTile = channel.unary_unary(
+            "/scope.Main/getEmbeddingTile",
+            request_serializer=s__pb2.EmbeddingTileRequest.SerializeToString,
+            response_deserializer=s__pb2.EmbeddingTileReply.FromString,
+        )
+        self.getCoordinatesStream = channel.unary_stream(
+            "/scope.Main/getCoordinatesStream",
+            request_serializer=s__pb2.CoordinatesRequest.SerializeToString,
+            response_deserializer=s__pb2.CoordinatesReply.FromString,
+        )
+        self.getCellColorByFeaturesStream = channel.unary_stream(
+            "/scope.Main/getCellColorByFeaturesStream",
+            request_serializer=s__pb2.CellColorByFeaturesRequest.SerializeToString,
+            response_deserializer=s__pb2.CellColorByFeaturesReply.FromString,
+        )
+        self.getCellMetaDataStream = channel.unary_stream(
+            "/scope.Main/getCellMetaDataStream",
+            request_serializer=s__pb2.CellMetaDataRequest.SerializeToString,
+            response_deserializer=s__pb2.CellMetaDataReply.FromString,
+        )
+        self.getCellAUCValuesByFeaturesStream = channel.unary_stream(
+            "/scope.Main/getCellAUCValuesByFeaturesStream",
+            request_serializer=s__pb2.CellAUCValuesByFeaturesRequest.SerializeToString,
+            response_deserializer=s__pb2.CellAUCValuesByFeaturesReply.FromString,
+        )
+        self.getGlobalFeatures = channel.unary_unary(
+            "/scope.Main/getGlobalFeatures",
+            request_serializer=s__pb2.GlobalFeatureRequest.SerializeToString,
+            response_deserializer=s__pb2.GlobalFeatureReply.FromString,
+        )
 
 
 class MainServicer(object):
@@ -328,6 +358,44 @@ class MainServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def getEmbeddingTile(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def getCoordinatesStream(self, request, context):
+        """Streaming variants of the RPCs above returning one value per cell, in consecutive chunks of cells"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def getCellColorByFeaturesStream(self, request, context):
+        """The first reply holds all fields, the next ones only the colours and cellIndices of the next cells. Every
+        compressedColor is compressed on its own.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def getCellMetaDataStream(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def getCellAUCValuesByFeaturesStream(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def getGlobalFeatures(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_MainServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -471,6 +539,36 @@ def add_MainServicer_to_server(servicer, server):
             request_deserializer=s__pb2.FeatureLabelRequest.FromString,
             response_serializer=s__pb2.FeatureLabelReply.SerializeToString,
         ),
+        "getEmbeddingTile": grpc.unary_unary_rpc_method_handler(
+            servicer.getEmbeddingTile,
+            request_deserializer=s__pb2.EmbeddingTileRequest.FromString,
+            response_serializer=s__pb2.EmbeddingTileReply.SerializeToString,
+        ),
+        "getCoordinatesStream": grpc.unary_stream_rpc_method_handler(
+            servicer.getCoordinatesStream,
+            request_deserializer=s__pb2.CoordinatesRequest.FromString,
+            response_serializer=s__pb2.CoordinatesReply.SerializeToString,
+        ),
+        "getCellColorByFeaturesStream": grpc.unary_stream_rpc_method_handler(
+            servicer.getCellColorByFeaturesStream,
+            request_deserializer=s__pb2.CellColorByFeaturesRequest.FromString,
+            response_serializer=s__pb2.CellColorByFeaturesReply.SerializeToString,
+        ),
+        "getCellMetaDataStream": grpc.unary_stream_rpc_method_handler(
+            servicer.getCellMetaDataStream,
+            request_deserializer=s__pb2.CellMetaDataRequest.FromString,
+            response_serializer=s__pb2.CellMetaDataReply.SerializeToString,
+        ),
+        "getCellAUCValuesByFeaturesStream": grpc.unary_stream_rpc_method_handler(
+            servicer.getCellAUCValuesByFeaturesStream,
+            request_deserializer=s__pb2.CellAUCValuesByFeaturesRequest.FromString,
+            response_serializer=s__pb2.CellAUCValuesByFeaturesReply.SerializeToString,
+        ),
+        "getGlobalFeatures": grpc.unary_unary_rpc_method_handler(
+            servicer.getGlobalFeatures,
+            request_deserializer=s__pb2.GlobalFeatureRequest.FromString,
+            response_serializer=s__pb2.GlobalFeatureReply.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler("scope.Main", rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
@@ -1291,3 +1389,177 @@ class Main(object):
             timeout,
             metadata,
         )
+
+    @staticmethod
+    def getEmbeddingTile(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/scope.Main/getEmbeddingTile",
+            s__pb2.EmbeddingTileRequest.SerializeToString,
+            s__pb2.EmbeddingTileReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
+    @staticmethod
+    def getCoordinatesStream(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/scope.Main/getCoordinatesStream",
+            s__pb2.CoordinatesRequest.SerializeToString,
+            s__pb2.CoordinatesReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
+    @staticmethod
+    def getCellColorByFeaturesStream(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/scope.Main/getCellColorByFeaturesStream",
+            s__pb2.CellColorByFeaturesRequest.SerializeToString,
+            s__pb2.CellColorByFeaturesReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
+    @staticmethod
+    def getCellMetaDataStream(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/scope.Main/getCellMetaDataStream",
+            s__pb2.CellMetaDataRequest.SerializeToString,
+            s__pb2.CellMetaDataReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
+    @staticmethod
+    def getCellAUCValuesByFeaturesStream(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/scope.Main/getCellAUCValuesByFeaturesStream",
+            s__pb2.CellAUCValuesByFeaturesRequest.SerializeToString,
+            s__pb2.CellAUCValuesByFeaturesReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
+    @staticmethod
+    def getGlobalFeatures(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/scope.Main/getGlobalFeatures",
+            s__pb2.GlobalFeatureRequest.SerializeToString,
+            s__pb2.GlobalFeatureReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
@@ -0,0 +1,79 @@
+"""
+Versioned binary files of named NumPy arrays, read by memory map.
+
+A file starts with a magic string, its format version and the length of a JSON header giving the dtype,
+shape and offset of every array. Arrays are 8-byte aligned, so reading a file only maps it and creates
+views of the arrays, without copying them or creating a Python object per element.
+"""
+
+from pathlib import Path
+from typing import Dict, Optional
+import json
+import os
+import struct
+
+import numpy as np
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"SCOPEARR"
+PREFIX = struct.Struct("<8sII")  # magic, version, header length
+ALIGNMENT = 8
+
+
+def _aligned(n_bytes: int) -> int:
+    return -(-n_bytes // ALIGNMENT) * ALIGNMENT
+
+
+def write(path: Path, version: int, arrays: Dict[str, np.ndarray]) -> None:
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+    header = {}
+    offset = 0
+    for name, array in arrays.items():
+        header[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        offset += _aligned(array.nbytes)
+    header_bytes = json.dumps(header).encode("utf-8")
+    data_start = _aligned(PREFIX.size + len(header_bytes))
+
+    # Files are replaced atomically, so readers never map a partially written file
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as fh:
+        fh.write(PREFIX.pack(MAGIC, version, len(header_bytes)))
+        fh.write(header_bytes.ljust(data_start - PREFIX.size, b" "))
+        for array in arrays.values():
+            fh.write(array.tobytes())
+            fh.write(b"\0" * (_aligned(array.nbytes) - array.nbytes))
+    os.replace(tmp_path, path)
+
+
+def read(path: Path, version: int) -> Optional[Dict[str, np.ndarray]]:
+    """ Map the arrays of a file, or get None if the file does not exist or has another format version. """
+    try:
+        with open(path, "rb") as fh:
+            magic, file_version, header_length = PREFIX.unpack(fh.read(PREFIX.size))
+            if magic != MAGIC or file_version != version:
+                logger.debug(f"{path} is not an array file of version {version}.")
+                return None
+            header = json.loads(fh.read(header_length))
+    except (FileNotFoundError, struct.error, ValueError):
+        return None
+
+    data_start = _aligned(PREFIX.size + header_length)
+    mapped: np.ndarray = np.memmap(path, dtype=np.uint8, mode="r")
+    arrays = {}
+    for name, spec in header.items():
+        dtype = np.dtype(spec["dtype"])
+        count = int(np.prod(spec["shape"], dtype=np.int64))
+        arrays[name] = np.frombuffer(mapped, dtype=dtype, count=count, offset=data_start + spec["offset"]).reshape(
+            spec["shape"]
+        )
+    return arrays
+
+
+def remove(path: Path) -> None:
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
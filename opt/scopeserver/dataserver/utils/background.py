@@ -0,0 +1,44 @@
+"""
+Background jobs computing data that SCope derives from a loom (expression store, nUMI, vmax table).
+
+Every kind of job has a single worker, so the jobs of several looms opened at the same time run one after the
+other, and a loom has at most one job of each kind queued or running. Jobs read the loom one block at a time
+while holding its connection lock. The loom file handler takes the same lock to replace the connection when
+SCope writes metadata, so running jobs pause for the switch and carry on with the new connection.
+"""
+
+from concurrent import futures
+from pathlib import Path
+from typing import Callable, Dict, Optional
+import threading
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundJobs:
+    def __init__(self, name: str):
+        self._worker = futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+        self._jobs: Dict[Path, futures.Future] = {}
+        self._lock = threading.Lock()
+
+    def get(self, abs_file_path: Path) -> Optional[futures.Future]:
+        """ Get the job of a loom that is queued or running, if any. """
+        with self._lock:
+            return self._jobs.get(abs_file_path)
+
+    def submit(self, abs_file_path: Path, job: Callable[[], object]) -> futures.Future:
+        """ Queue a job for a loom, or return the job of that loom that is already queued or running. """
+
+        def forget(_: futures.Future) -> None:
+            with self._lock:
+                del self._jobs[abs_file_path]
+
+        with self._lock:
+            if abs_file_path in self._jobs:
+                return self._jobs[abs_file_path]
+            future = self._worker.submit(job)
+            self._jobs[abs_file_path] = future
+        future.add_done_callback(forget)
+        return future
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 import re
 import itertools
 import time
@@ -18,17 +18,25 @@ logger = logging.getLogger(__name__)
 
 RGB_COLORS: int = 255 * 255 * 255
 
+# ASCII hex digits of every byte value, HEX_DIGITS[b] are the two characters of "{:02x}".format(b)
+HEX_DIGITS = np.frombuffer(b"".join(b"%02x" % i for i in range(256)), dtype=np.uint8).reshape(256, 2)
+NO_COLOUR = np.frombuffer(b"XXXXXX", dtype=np.uint8)
+
 
 class CellColorByFeatures:
-    def __init__(self, loom):
+    def __init__(self, loom, cell_indices: Optional[np.ndarray] = None):
+        """ Colour all cells of a loom, or only the cells in cell_indices if given. """
         self.loom = loom
         self.meta_data = loom.get_meta_data()
         self.n_cells = loom.get_nb_cells()
-        self.features = []
-        self.hex_vec = []
+        self.features: List[np.ndarray] = []
+        self.hex_vec: List[str] = []
         self.v_max = np.zeros(3)
         self.max_v_max = np.zeros(3)
-        self.cell_indices = list(range(self.n_cells))
+        self.selected_cells = cell_indices
+        self.cell_indices = list(range(self.n_cells)) if cell_indices is None else cell_indices.tolist()
+        self.palette: Optional[np.ndarray] = None
+        self.colour_codes: Optional[np.ndarray] = None
         self.reply = None
 
     @staticmethod
@@ -36,7 +44,7 @@ class CellColorByFeatures:
         logger.debug("Compressing colour data... ")
         str_array_size = sys.getsizeof(str_arr)
         str_array_joint = bytes("".join(str_arr), "utf-8")
-        str_array_joint_compressed = zlib.compress(str_array_joint, 1)
+        str_array_joint_compressed = zlib.compress(str_array_joint, constant.COLOR_COMPRESSION_LEVEL)
         str_array_joint_compressed_size = sys.getsizeof(str_array_joint_compressed)
         savings_percent = 1 - str_array_joint_compressed_size / str_array_size
         logger.debug("Saving " + "{:.2%} of space".format(savings_percent))
@@ -45,22 +53,87 @@ class CellColorByFeatures:
     def get_features(self):
         return self.features
 
-    def get_hex_vec(self):
+    def get_channels(self) -> List[np.ndarray]:
+        """ Get the red, green and blue features, filling missing channels with empty features. """
         for _ in itertools.repeat(None, 3 - len(self.features)):
             self.addEmptyFeature()
-        if len(self.features) > 0 and len(self.hex_vec) == 0:
-            self.hex_vec = [
-                "XXXXXX" if r == g == b == 0 else "{0:02x}{1:02x}{2:02x}".format(int(r), int(g), int(b))
-                for r, g, b in zip(self.features[0], self.features[1], self.features[2])
-            ]
+        return [np.asarray(feature) for feature in self.features[:3]]
+
+    def get_n_coloured_cells(self) -> int:
+        """
+        Get the number of coloured cells: the selected cells if a selection was given, otherwise the cells present
+        in all features (filtered and unfiltered features differ in length).
+        """
+        if self.selected_cells is not None:
+            return len(self.selected_cells)
+        return min(len(feature) for feature in self.get_channels())
+
+    def get_rgb(self, start: int = 0, end: Optional[int] = None) -> np.ndarray:
+        """
+        Get the colour of the coloured cells start to end (all of them by default) as a (3, n_cells) uint8 array
+        of red, green and blue intensities.
+        """
+        channels = self.get_channels()
+        n_cells = self.get_n_coloured_cells()
+        end = n_cells if end is None else min(end, n_cells)
+        if self.selected_cells is not None:
+            cells = self.selected_cells[start:end]
+            return np.stack([feature[cells].astype(np.uint8) for feature in channels])
+        return np.stack([feature[start:end].astype(np.uint8) for feature in channels])
+
+    @staticmethod
+    def rgb_to_hex_bytes(rgb: np.ndarray) -> bytes:
+        """ Encode a (3, n_cells) uint8 colour array as 6 hex characters per cell, "XXXXXX" for black cells. """
+        hex_chars = HEX_DIGITS[rgb.T].reshape(-1, 6)
+        hex_chars[~rgb.any(axis=0)] = NO_COLOUR
+        return hex_chars.tobytes()
+
+    def get_hex_vec(self):
+        if len(self.hex_vec) == 0:
+            self.hex_vec = np.frombuffer(self.rgb_to_hex_bytes(self.get_rgb()), dtype="S6").astype(str).tolist()
         return self.hex_vec
 
-    def get_compressed_hex_vec(self):
+    def get_compressed_hex_vec(self, start: int = 0, end: Optional[int] = None):
         comp_start_time = time.time()
-        hex_vec_compressed = CellColorByFeatures.compress_str_array(str_arr=self.get_hex_vec())
+        if len(self.hex_vec) > 0:
+            hex_vec_compressed = CellColorByFeatures.compress_str_array(str_arr=self.hex_vec[start:end])
+        else:
+            logger.debug("Compressing colour data... ")
+            hex_vec_compressed = zlib.compress(
+                self.rgb_to_hex_bytes(self.get_rgb(start, end)), constant.COLOR_COMPRESSION_LEVEL
+            )
         logger.debug("{0:.5f} seconds elapsed (compression) ---".format(time.time() - comp_start_time))
         return hex_vec_compressed
 
+    def get_compressed_rgb(self, start: int = 0, end: Optional[int] = None) -> bytes:
+        """ Pack the colours of the cells start to end as 3 bytes (red, green, blue) per cell and compress them. """
+        return zlib.compress(self.get_rgb(start, end).T.tobytes(), constant.COLOR_COMPRESSION_LEVEL)
+
+    def get_compressed_colours(self, encoding: int, start: int = 0, end: Optional[int] = None) -> Tuple[bytes, int]:
+        """
+        Get the compressed colours of the cells start to end (all cells by default) in the requested encoding.
+
+        A palette cannot hold the colours of continuous features, RGB is used instead.
+
+        Returns:
+            Tuple[bytes, int]: The compressed colours and the encoding that was used.
+        """
+        if encoding == s_pb2.HEX:
+            return self.get_compressed_hex_vec(start, end), s_pb2.HEX
+        return self.get_compressed_rgb(start, end), s_pb2.RGB
+
+    @staticmethod
+    def hex_to_palette(hex_vec) -> Tuple[List[str], np.ndarray]:
+        """ Split a list of hex colours into the distinct colours and the index of the colour of every cell. """
+        palette, codes = np.unique(np.asarray(hex_vec, dtype=str), return_inverse=True)
+        return palette.tolist(), codes
+
+    @staticmethod
+    def palette_to_rgb(palette: List[str]) -> np.ndarray:
+        """ Convert hex colours to a (n_colours, 3) uint8 array, "XXXXXX" (no colour) becomes black. """
+        rgb = b"".join(bytes.fromhex("000000" if colour == "XXXXXX" else colour) for colour in palette)
+        return np.frombuffer(rgb, dtype=np.uint8).reshape(-1, 3)
+
     def get_v_max(self):
         return self.v_max
 
@@ -72,6 +145,8 @@ class CellColorByFeatures:
 
     @staticmethod
     def normalise_vals(vals: np.ndarray, v_max: int, v_min: int) -> np.ndarray:
+        # Expression vectors may be shared read-only arrays from the expression cache
+        vals = vals.copy()
         if len(vals[vals != 0]) == 0:
             return vals
         if v_max <= np.amin(vals[vals != 0]):
@@ -105,6 +180,10 @@ class CellColorByFeatures:
             )
             if request.vmax[n] != 0.0:
                 self.v_max[n] = request.vmax[n]
+            elif annotations is None:
+                self.v_max[n], self.max_v_max[n] = self.loom.get_vmax(
+                    "gene", feature, log_transform=request.hasLogTransform, cpm_normalise=request.hasCpmTransform
+                )
             else:
                 self.v_max[n], self.max_v_max[n] = data.get_99_and_100_percentiles(vals)
 
@@ -125,33 +204,47 @@ class CellColorByFeatures:
             )
             if request.vmax[n] != 0.0:
                 self.v_max[n] = request.vmax[n]
+            elif annotations is None:
+                self.v_max[n], self.max_v_max[n] = self.loom.get_vmax("regulon", feature)
             else:
                 self.v_max[n], self.max_v_max[n] = data.get_99_and_100_percentiles(vals)
             if request.scaleThresholded:
-                vals = np.array([auc if auc >= request.threshold[n] else 0 for auc in vals])
+                vals = np.where(vals >= request.threshold[n], vals, 0)
 
                 vals = CellColorByFeatures.normalise_vals(vals, self.v_max[n], request.vmin[n])
                 self.features.append(vals)
             else:
-                self.features.append([constant.UPPER_LIMIT_RGB if auc >= request.threshold[n] else 0 for auc in vals])
+                self.features.append(np.where(vals >= request.threshold[n], constant.UPPER_LIMIT_RGB, 0))
         else:
             self.features.append(np.zeros(self.n_cells))
 
+    def set_categorical_colours(
+        self, palette: np.ndarray, codes: np.ndarray, annotations: Optional[List[Annotation]], logic: str
+    ):
+        """
+        Colour every cell by the palette colour its code indexes, keeping only the annotated cells if given.
+
+        The colours themselves are only looked up when the replies are built, see get_replies.
+        """
+        if annotations is not None:
+            codes = codes[self.loom.get_anno_cells(annotations=annotations, logic=logic)]
+        if self.selected_cells is not None:
+            codes = codes[self.selected_cells]
+        self.palette = palette
+        self.colour_codes = codes
+
     def setAnnotationFeature(self, feature: str, annotations: Optional[List[Annotation]] = None, logic: str = "OR"):
         md_annotation = self.loom.get_meta_data_annotation_by_name(name=feature)
         md_annotation_values = md_annotation["values"]
-        ca_annotation = self.loom.get_ca_attr_by_name(name=feature)
-        ca_annotation_as_int = list(map(lambda x: md_annotation_values.index(str(x)), ca_annotation))
-        self.hex_vec = to_colours(
-            ca_annotation_as_int, color_list=md_annotation["colors"] if "colors" in md_annotation else None
+        value_codes, codes = self.loom.cell_filter.get_codes(feature)
+        # Colour of every distinct value of the column, in the order of its codes
+        md_indices = [md_annotation_values.index(value) for value in value_codes]
+        palette = np.array(
+            to_colours(md_indices, color_list=md_annotation["colors"] if "colors" in md_annotation else None)
         )
-
-        if annotations is not None:
-            cellIndices = self.loom.get_anno_cells(annotations=annotations, logic=logic)
-            self.hex_vec = np.array(self.hex_vec)[cellIndices]
+        self.set_categorical_colours(palette, codes, annotations=annotations, logic=logic)
 
         reply = s_pb2.CellColorByFeaturesReply(
-            color=self.hex_vec,
             vmax=self.v_max,
             legend=s_pb2.ColorLegend(
                 values=md_annotation_values,
@@ -179,6 +272,10 @@ class CellColorByFeatures:
             )
             if request.vmax[n] != 0.0:
                 self.v_max[n] = request.vmax[n]
+            elif annotations is None:
+                self.v_max[n], self.max_v_max[n] = self.loom.get_vmax(
+                    "metric", feature, log_transform=request.hasLogTransform, cpm_normalise=request.hasCpmTransform
+                )
             else:
                 self.v_max[n], self.max_v_max[n] = data.get_99_and_100_percentiles(vals)
 
@@ -207,23 +304,26 @@ class CellColorByFeatures:
                         logger.warning(f"Not enough custom colors defined. Falling back to BIG_COLOR_LIST")
                         colour_list = constant.BIG_COLOR_LIST
 
-                    for i in self.loom.get_clustering_by_id(clusteringID):
-                        if i == -1:
-                            self.hex_vec.append("XX" * 3)
+                    value_codes, codes = self.loom.cell_filter.get_codes(f"Clustering_{clusteringID}")
+                    palette = []
+                    for cluster_id in map(int, value_codes):
+                        if cluster_id == -1:
+                            palette.append("XX" * 3)
                             continue
-                        colour = colour_list[i % len(colour_list)]
-                        self.hex_vec.append(colour)
-                        legend.add((cluster_names_dict[i], colour))
+                        colour = colour_list[cluster_id % len(colour_list)]
+                        palette.append(colour)
+                        legend.add((cluster_names_dict[cluster_id], colour))
                     values, colors = zip(*legend)
                     self.legend = s_pb2.ColorLegend(values=values, colors=colors)
 
                     if len(request.annotation) > 0:
                         annotations = [Annotation(name=ann.name, values=ann.values) for ann in request.annotation]
-                        cellIndices = self.loom.get_anno_cells(annotations=annotations, logic=request.logic)
-                        self.hex_vec = np.array(self.hex_vec)[cellIndices]
+                    else:
+                        annotations = None
+                    self.set_categorical_colours(np.array(palette), codes, annotations=annotations, logic=request.logic)
 
                     # Set the reply and break the for loop
-                    reply = s_pb2.CellColorByFeaturesReply(color=self.hex_vec, vmax=self.v_max, legend=self.legend)
+                    reply = s_pb2.CellColorByFeaturesReply(vmax=self.v_max, legend=self.legend)
                     self.setReply(reply=reply)
                     break
                 else:
@@ -240,8 +340,8 @@ class CellColorByFeatures:
             )
 
         if clusteringID is not None and clusterID is not None:
-            clusterIndices = self.loom.get_clustering_by_id(clusteringID) == clusterID
-            clusterCol = np.array([constant.UPPER_LIMIT_RGB if x else 0 for x in clusterIndices])
+            clusterIndices = self.loom.get_cluster_index(clusteringID).get_mask(clusterID)
+            clusterCol = np.where(clusterIndices, constant.UPPER_LIMIT_RGB, 0)
             if len(request.annotation) > 0:
                 annotations = [Annotation(name=ann.name, values=ann.values) for ann in request.annotation]
                 cellIndices = self.loom.get_anno_cells(annotations=annotations, logic=request.logic)
@@ -249,7 +349,7 @@ class CellColorByFeatures:
             self.features.append(clusterCol)
 
     def addEmptyFeature(self):
-        self.features.append([constant.LOWER_LIMIT_RGB for n in range(self.n_cells)])
+        self.features.append(np.full(self.n_cells, constant.LOWER_LIMIT_RGB))
 
     def hasReply(self):
         if self.reply is not None:
@@ -260,5 +360,68 @@ class CellColorByFeatures:
     def setReply(self, reply):
         self.reply = reply
 
-    def getReply(self):
-        return self.reply
+    def getReply(self, encoding: int = s_pb2.HEX):
+        """ Get the colours of all cells in a single reply, see get_replies. """
+        return next(self.get_replies(encoding=encoding))
+
+    def get_replies(self, encoding: int = s_pb2.HEX, chunk_size: int = 0) -> Iterator[s_pb2.CellColorByFeaturesReply]:
+        """
+        Yield the colours in replies of at most chunk_size cells, or in a single reply if chunk_size is 0.
+
+        The colours of a chunk are only computed and compressed when it is reached, the compressed colours of
+        every reply are decompressed on their own. The first reply also holds the colour scale, the legend and
+        the palette.
+        """
+        if self.reply is not None and self.reply.HasField("error"):
+            yield self.reply
+            return
+
+        header = s_pb2.CellColorByFeaturesReply()
+        if self.reply is not None:
+            header.CopyFrom(self.reply)
+        else:
+            header.vmax[:] = self.get_v_max()
+            header.maxVmax[:] = self.get_max_v_max()
+
+        if self.palette is not None and self.colour_codes is not None:
+            yield from self.get_categorical_replies(header, self.palette, self.colour_codes, encoding, chunk_size)
+            return
+
+        colour_encoding = s_pb2.HEX if encoding == s_pb2.HEX else s_pb2.RGB
+        header.hasAddCompressionLayer = True
+        header.colorEncoding = colour_encoding
+        n_cells = self.get_n_coloured_cells()
+        for n, (start, end) in enumerate(data.get_chunks(n_cells, chunk_size)):
+            reply = header if n == 0 else s_pb2.CellColorByFeaturesReply()
+            reply.compressedColor, _ = self.get_compressed_colours(colour_encoding, start, end)
+            # The last reply holds the remaining cell indices, they may outnumber the coloured cells
+            reply.cellIndices.extend(self.cell_indices[start : end if end < n_cells else None])
+            yield reply
+
+    @staticmethod
+    def get_categorical_replies(
+        header, palette: np.ndarray, codes: np.ndarray, encoding: int, chunk_size: int
+    ) -> Iterator[s_pb2.CellColorByFeaturesReply]:
+        """
+        Yield the colours of a categorical colouring as hex colours, or packed as palette codes (at most 256
+        colours) or RGB colours, see get_replies.
+        """
+        colour_palette = palette.tolist()
+        if encoding == s_pb2.PALETTE and len(colour_palette) <= 256:
+            header.palette.extend(colour_palette)
+        elif encoding != s_pb2.HEX:
+            encoding = s_pb2.RGB
+        if encoding != s_pb2.HEX:
+            header.hasAddCompressionLayer = True
+            header.colorEncoding = encoding
+        palette_rgb = CellColorByFeatures.palette_to_rgb(colour_palette)
+
+        for n, (start, end) in enumerate(data.get_chunks(len(codes), chunk_size)):
+            reply = header if n == 0 else s_pb2.CellColorByFeaturesReply()
+            chunk_codes = codes[start:end]
+            if encoding == s_pb2.HEX:
+                reply.color.extend(palette[chunk_codes])
+            else:
+                packed = chunk_codes.astype(np.uint8) if encoding == s_pb2.PALETTE else palette_rgb[chunk_codes]
+                reply.compressedColor = zlib.compress(packed.tobytes(), constant.COLOR_COMPRESSION_LEVEL)
+            yield reply
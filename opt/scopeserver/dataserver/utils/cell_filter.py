@@ -0,0 +1,90 @@
+"""
+Vectorised filtering of cells on annotation and clustering values.
+
+Every column that is filtered on is encoded once into integer codes (clusterings reuse the codes of their
+cluster index), and the boolean mask of each requested (annotation, value) pair is kept in a bounded LRU cache.
+Filters combine the masks with NumPy AND/OR reductions and return the selected cells as an index array.
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+import threading
+
+import numpy as np
+
+from scopeserver.dataserver.utils import constant
+from scopeserver.dataserver.utils.annotation import Annotation
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class CellFilter:
+    """ Cached annotation masks of a single loom. """
+
+    def __init__(self, loom, max_masks: int = constant.CELL_FILTER_MAX_MASKS):
+        self.loom = loom
+        self.max_masks = max_masks
+        self._codes: Dict[str, Tuple[Dict[str, int], np.ndarray]] = {}
+        self._masks: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_column(self, anno_name: str) -> np.ndarray:
+        if anno_name.startswith("Clustering_"):
+            return self.loom.loom_connection.ca.Clusterings[str(anno_name.split("_")[1])]
+        return self.loom.loom_connection.ca[anno_name]
+
+    def get_codes(self, anno_name: str) -> Tuple[Dict[str, int], np.ndarray]:
+        """
+        Encode an annotation column as integer codes.
+
+        Returns:
+            Tuple[Dict[str, int], np.ndarray]: The code of every value (as string) and the code of every cell.
+        """
+        if anno_name.startswith("Clustering_"):
+            cluster_index = self.loom.get_cluster_index(int(anno_name.split("_")[1]))
+            return cluster_index.value_codes, cluster_index.codes
+        with self._lock:
+            if anno_name in self._codes:
+                return self._codes[anno_name]
+        values, codes = np.unique(self.get_column(anno_name).astype(str), return_inverse=True)
+        encoded = ({value: code for code, value in enumerate(values)}, codes.astype(np.min_scalar_type(len(values))))
+        with self._lock:
+            self._codes[anno_name] = encoded
+        return encoded
+
+    def get_mask(self, anno_name: str, value) -> np.ndarray:
+        """ Get the read-only boolean mask of the cells having the given value for an annotation. """
+        key = (anno_name, str(value))
+        with self._lock:
+            mask = self._masks.get(key)
+            if mask is not None:
+                self._masks.move_to_end(key)
+                return mask
+
+        value_codes, codes = self.get_codes(anno_name)
+        if key[1] in value_codes:
+            mask = codes == value_codes[key[1]]
+        else:
+            mask = np.zeros(len(codes), dtype=bool)
+        mask.flags.writeable = False
+
+        with self._lock:
+            self._masks[key] = mask
+            while len(self._masks) > self.max_masks:
+                self._masks.popitem(last=False)
+        return mask
+
+    def get_cells(self, annotations: List[Annotation], logic: str = "OR") -> np.ndarray:
+        """ Get the sorted indices of the cells matching any (OR) or all (AND) of the annotation values. """
+        masks = [self.get_mask(anno.name, value) for anno in annotations for value in anno.values]
+        if len(masks) == 0:
+            return np.array([], dtype=np.int64)
+        if logic == "AND":
+            return np.flatnonzero(np.logical_and.reduce(masks))
+        return np.flatnonzero(np.logical_or.reduce(masks))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._codes.clear()
+            self._masks.clear()
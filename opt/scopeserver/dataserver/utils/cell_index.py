@@ -0,0 +1,96 @@
+"""
+Lookup of cells by their CellID.
+
+Each loom gets a sorted copy of its cell IDs that is searched with ``np.searchsorted``, and the mapping of
+the cells of one loom onto the cells of another loom (used to carry lasso selections between looms) is
+cached per pair of looms.
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, NamedTuple
+import threading
+
+import numpy as np
+
+from scopeserver.dataserver.utils import constant
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class CellIndex:
+    """ Sorted index of the cell IDs of a loom. """
+
+    def __init__(self, cell_ids: np.ndarray):
+        cell_ids = np.asarray(cell_ids).astype(str)
+        # A stable sort keeps the first occurrence of duplicated IDs first, as list.index would find it
+        self.order = np.argsort(cell_ids, kind="stable")
+        self.sorted_ids = cell_ids[self.order]
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def lookup(self, cell_ids: Iterable[str]) -> np.ndarray:
+        """ Get the index of the first cell with each of the given IDs, or -1 if the ID does not exist. """
+        query = np.asarray(list(cell_ids), dtype=str)
+        if len(self) == 0 or len(query) == 0:
+            return np.full(len(query), -1, dtype=np.int64)
+        positions = np.minimum(np.searchsorted(self.sorted_ids, query), len(self) - 1)
+        found = self.sorted_ids[positions] == query
+        return np.where(found, self.order[positions], -1)
+
+
+class CellTranslation(NamedTuple):
+    """
+    The cells of a source loom matched onto a destination loom by CellID.
+
+    src_first is the first source cell with the same ID as each source cell, dest_to_src the first source
+    cell with the same ID as each destination cell (-1 if the source loom does not have the ID).
+    """
+
+    src_first: np.ndarray
+    dest_to_src: np.ndarray
+
+    def translate(self, src_cell_indices: Iterable[int]) -> np.ndarray:
+        """ Get the destination cells sharing their CellID with any of the given source cells. """
+        selected = np.zeros(len(self.src_first) + 1, dtype=bool)
+        selected[self.src_first[np.asarray(list(src_cell_indices), dtype=np.int64)]] = True
+        # dest_to_src is -1 for unknown cells, which points at the last element that is never selected
+        return np.flatnonzero(selected[self.dest_to_src])
+
+
+class CellTranslationKey(NamedTuple):
+    src_loom_path: Path
+    src_mtime: int
+    dest_loom_path: Path
+    dest_mtime: int
+
+
+_translations: "OrderedDict[CellTranslationKey, CellTranslation]" = OrderedDict()
+_translations_lock = threading.Lock()
+
+
+def get_translation(src_loom, dest_loom) -> CellTranslation:
+    key = CellTranslationKey(
+        src_loom.abs_file_path, src_loom.get_mtime(), dest_loom.abs_file_path, dest_loom.get_mtime()
+    )
+    with _translations_lock:
+        if key in _translations:
+            _translations.move_to_end(key)
+            return _translations[key]
+
+    src_index = src_loom.get_cell_index()
+    translation = CellTranslation(
+        src_first=src_index.lookup(src_loom.get_cell_ids()),
+        dest_to_src=src_index.lookup(dest_loom.get_cell_ids()),
+    )
+    with _translations_lock:
+        _translations[key] = translation
+        while len(_translations) > constant.CELL_INDEX_MAX_TRANSLATIONS:
+            _translations.popitem(last=False)
+    return translation
+
+
+def translate(src_loom, dest_loom, src_cell_indices: Iterable[int]) -> np.ndarray:
+    return get_translation(src_loom, dest_loom).translate(src_cell_indices)
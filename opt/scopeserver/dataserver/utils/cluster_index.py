@@ -0,0 +1,69 @@
+"""
+Cluster membership index of the clusterings of a loom.
+
+Every clustering is indexed once, when the loom is opened or modified, in CSR layout: the cells sorted by
+cluster, the offset of each cluster in that order and the size of each cluster. The cells of a cluster are
+then a slice instead of a scan of the whole clustering column, and overlaps are a single bincount.
+"""
+
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ClusterIndex:
+    """ CSR index of the cells of every cluster of a clustering. """
+
+    def __init__(self, clustering: np.ndarray):
+        self.cluster_ids, codes, self.sizes = np.unique(
+            np.asarray(clustering).astype(np.int64), return_inverse=True, return_counts=True
+        )
+        self.codes = codes.astype(np.min_scalar_type(len(self.cluster_ids)))
+        # A stable sort keeps the cells of each cluster in ascending order
+        self.cells = np.argsort(self.codes, kind="stable")
+        self.offsets = np.concatenate([[0], np.cumsum(self.sizes)])
+        self.value_codes = {str(cluster_id): code for code, cluster_id in enumerate(self.cluster_ids)}
+        for array in (self.cluster_ids, self.codes, self.sizes, self.cells, self.offsets):
+            array.flags.writeable = False
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def get_code(self, cluster_id: int) -> Optional[int]:
+        code = int(np.searchsorted(self.cluster_ids, cluster_id))
+        if code < len(self.cluster_ids) and self.cluster_ids[code] == cluster_id:
+            return code
+        return None
+
+    def get_cells(self, cluster_id: int) -> np.ndarray:
+        """ Get the sorted indices of the cells of a cluster (empty if the cluster does not exist). """
+        code = self.get_code(cluster_id)
+        if code is None:
+            return self.cells[:0]
+        return self.cells[self.offsets[code] : self.offsets[code + 1]]
+
+    def get_size(self, cluster_id: int) -> int:
+        code = self.get_code(cluster_id)
+        return 0 if code is None else int(self.sizes[code])
+
+    def get_mask(self, cluster_id: int) -> np.ndarray:
+        mask = np.zeros(len(self), dtype=bool)
+        mask[self.get_cells(cluster_id)] = True
+        return mask
+
+    def count(self, cell_indices: Iterable[int]) -> np.ndarray:
+        """ Get the number of the given cells in each cluster, in the order of cluster_ids. """
+        cell_indices = np.asarray(list(cell_indices), dtype=np.int64)
+        return np.bincount(self.codes[cell_indices], minlength=len(self.cluster_ids))
+
+
+def build(loom) -> Dict[int, ClusterIndex]:
+    """ Index every clustering of a loom by its ID. """
+    if "Clusterings" not in loom.loom_connection.ca.keys():
+        return {}
+    clusterings = loom.loom_connection.ca.Clusterings
+    return {int(clustering_id): ClusterIndex(clusterings[clustering_id]) for clustering_id in clusterings.dtype.names}
@@ -0,0 +1,105 @@
+"""
+Process-wide caches of getCellColorByFeatures and getEmbeddingTile replies.
+
+Users of a public dataset tend to colour it by the same few features at the same time. Replies are cached
+under a byte budget, keyed by the versions of the expression matrix and of the metadata of the loom and by a
+fingerprint of the request. Identical requests that arrive while a reply is being computed wait for that
+computation instead of starting their own.
+"""
+
+from concurrent import futures
+from pathlib import Path
+from typing import Callable, Dict, NamedTuple, Optional
+import hashlib
+
+from google.protobuf.message import Message
+
+from scopeserver.dataserver.utils import constant
+from scopeserver.dataserver.utils.sized_lru import SizedLRUCache
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ColourCacheKey(NamedTuple):
+    loom_path: Path
+    matrix_stamp: int
+    meta_data_version: int
+    fingerprint: bytes
+
+
+def fingerprint(request) -> bytes:
+    """ Hash every field of a request except the loom path, which may differ between users of the same loom. """
+    canonical = type(request)()
+    canonical.CopyFrom(request)
+    canonical.ClearField("loomFilePath")
+    return hashlib.sha256(canonical.SerializeToString(deterministic=True)).digest()
+
+
+def make_key(loom, request) -> ColourCacheKey:
+    return ColourCacheKey(loom.abs_file_path, loom.matrix_stamp, loom.meta_data_version, fingerprint(request))
+
+
+def discard_outdated(loom) -> None:
+    """ Drop the replies computed from previous metadata of a loom, which can no longer be requested. """
+
+    def outdated(key: ColourCacheKey) -> bool:
+        return key.loom_path == loom.abs_file_path and key.meta_data_version != loom.meta_data_version
+
+    COLOUR_CACHE.discard(outdated)
+    TILE_CACHE.discard(outdated)
+
+
+class ColourCache(SizedLRUCache[ColourCacheKey, Message]):
+    """ A cache of replies (with an error field) bounded by their serialised size in bytes. """
+
+    def __init__(self, max_bytes: int):
+        super().__init__(max_bytes)
+        self.coalesced = 0
+        self._in_flight: Dict[ColourCacheKey, futures.Future] = {}
+
+    def size_of(self, reply: Message) -> int:
+        return reply.ByteSize()
+
+    def get_or_compute(self, key: ColourCacheKey, compute: Callable[[], Optional[Message]]) -> Optional[Message]:
+        """
+        Get a cached reply or compute it, sharing a single computation between concurrent identical requests.
+
+        Replies must not be modified by the caller once they are returned. Error replies are not cached.
+        """
+        with self._lock:
+            reply = self._lookup(key)
+            if reply is not None:
+                self.hits += 1
+                return reply
+            job = self._in_flight.get(key)
+            computing = job is None
+            if job is None:
+                self.misses += 1
+                job = futures.Future()
+                self._in_flight[key] = job
+            else:
+                self.coalesced += 1
+
+        if not computing:
+            return job.result()
+
+        try:
+            reply = compute()
+            if reply is not None and not reply.HasField("error"):
+                self.put(key, reply)
+            job.set_result(reply)
+            return reply
+        except Exception as err:
+            job.set_exception(err)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def stats(self) -> Dict[str, int]:
+        return {**super().stats(), "coalesced": self.coalesced}
+
+
+COLOUR_CACHE = ColourCache(max_bytes=constant.COLOUR_CACHE_MAX_BYTES)
+TILE_CACHE = ColourCache(max_bytes=constant.TILE_CACHE_MAX_BYTES)
@@ -11,6 +11,20 @@ LOWER_LIMIT_RGB = 0
 UPPER_LIMIT_RGB = 225
 NO_EXPR_RGB = 166
 COUNTS_PER_MILLION = 1000000
+EXPRESSION_STORE_BLOCK_SIZE = 2 ** 24
+EXPRESSION_STORE_MAX_DENSITY = 0.25
+EXPRESSION_CACHE_MAX_BYTES = 512 * 1024 * 1024
+COLOUR_CACHE_MAX_BYTES = 128 * 1024 * 1024
+TILE_CACHE_MAX_BYTES = 128 * 1024 * 1024
+NUMI_BATCH_SIZE = 1024
+CELL_FILTER_MAX_MASKS = 256
+CELL_INDEX_MAX_TRANSLATIONS = 16
+VMAX_BLOCK_SIZE = 2 ** 24
+COLOR_COMPRESSION_LEVEL = 1
+LOD_GRID_SIZE = 256
+TILE_SIZE = 256
+STREAM_CHUNK_SIZE = 2 ** 16
+SS_JOURNAL_MAX_CHANGES = 1024
 
 
 @unique
@@ -279,12 +293,14 @@ BIG_COLOR_LIST = [
 
 def to_colours(index: Iterable[int], color_list=None) -> List[str]:
     """Convert indexes (`index`) into pre-determined HTML hex colour values.
-    `index` can be a `range(some_number)` or any iterable collection of numbers.
+    `index` can be a `range(some_number)`, a list or an array of numbers.
     """
 
+    indices = np.asarray(index, dtype=np.int64)
+
     if color_list is None:
         final_color_list = BIG_COLOR_LIST
-    elif len(np.unique(index)) > len(color_list):
+    elif len(np.unique(indices)) > len(color_list):
         logger.warning(f"Not enough custom colors defined. Falling back to BIG_COLOR_LIST")
         final_color_list = BIG_COLOR_LIST
     else:
@@ -292,4 +308,4 @@ def to_colours(index: Iterable[int], color_list=None) -> List[str]:
 
     num_colours = len(final_color_list)
 
-    return [final_color_list[i % num_colours] for i in index]
+    return np.asarray(final_color_list)[indices % num_colours].tolist()
@@ -0,0 +1,64 @@
+"""
+Packed binary encodings of embedding coordinates.
+
+Coordinates are sent either as little-endian float32 or as uint16 quantised to the bounding box of the
+cells, instead of one protobuf float per value. The encoding of the coordinates of all cells of an
+embedding is cached by the Loom.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from scopeserver.dataserver.modules.gserver import s_pb2
+import logging
+
+logger = logging.getLogger(__name__)
+
+UINT16_MAX = np.iinfo(np.uint16).max
+
+
+class PackedCoordinates(NamedTuple):
+    encoding: "s_pb2.CoordinatesEncodingValue"
+    x: bytes
+    y: bytes
+    x_min: float
+    x_max: float
+    y_min: float
+    y_max: float
+
+    @property
+    def itemsize(self) -> int:
+        return 2 if self.encoding == s_pb2.UINT16 else 4
+
+    def get_cells(self, start: int, end: int) -> "PackedCoordinates":
+        """ Get the coordinates of the cells start to end, keeping the bounding box of all cells. """
+        return self._replace(
+            x=self.x[start * self.itemsize : end * self.itemsize], y=self.y[start * self.itemsize : end * self.itemsize]
+        )
+
+
+def quantise(values: np.ndarray, low: float, high: float) -> np.ndarray:
+    if high <= low:
+        return np.zeros(len(values), dtype="<u2")
+    return np.round((values - low) / (high - low) * UINT16_MAX).astype("<u2")
+
+
+def dequantise(values: np.ndarray, low: float, high: float) -> np.ndarray:
+    return low + values.astype(np.float64) * (high - low) / UINT16_MAX
+
+
+def pack(x, y, encoding: "s_pb2.CoordinatesEncodingValue") -> PackedCoordinates:
+    """ Encode coordinates as float32 (FLOAT32) or uint16 quantised to their bounding box (UINT16). """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    x_min, x_max = (float(x.min()), float(x.max())) if len(x) > 0 else (0.0, 0.0)
+    y_min, y_max = (float(y.min()), float(y.max())) if len(y) > 0 else (0.0, 0.0)
+    if encoding == s_pb2.UINT16:
+        packed_x = quantise(x, x_min, x_max).tobytes()
+        packed_y = quantise(y, y_min, y_max).tobytes()
+    else:
+        encoding = s_pb2.FLOAT32
+        packed_x = x.astype("<f4").tobytes()
+        packed_y = y.astype("<f4").tobytes()
+    return PackedCoordinates(encoding, packed_x, packed_y, x_min, x_max, y_min, y_max)
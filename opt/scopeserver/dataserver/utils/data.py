@@ -2,7 +2,7 @@
 General purpose utility functions for working with data.
 """
 
-from typing import Tuple, Iterable, List, TypeVar
+from typing import Tuple, Iterable, Iterator, List, TypeVar
 
 import numpy as np
 
@@ -20,6 +20,16 @@ def get_99_and_100_percentiles(values: np.ndarray) -> Tuple[np.float, np.float]:
     return (np.clip(_99_percentile, 0.01, _100_percentile), _100_percentile)
 
 
+def get_99_and_100_percentiles_by_row(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the clamped 99th and the 100th percentiles of every row of a 2D array,
+    matching get_99_and_100_percentiles applied to each row.
+    """
+    _100_percentile = np.amax(values, axis=1)
+    _99_percentile = np.percentile(values, 99, axis=1)
+    return (np.clip(_99_percentile, 0.01, _100_percentile), _100_percentile)
+
+
 def uniq(data: Iterable[T]) -> List[T]:
     """
     Extract unique values from a container while preserving
@@ -35,3 +45,15 @@ def uniq(data: Iterable[T]) -> List[T]:
             result.append(x)
 
     return result
+
+
+def get_chunks(n: int, chunk_size: int) -> Iterator[Tuple[int, int]]:
+    """
+    Split range(n) in consecutive (start, end) chunks of at most chunk_size elements, or in a single chunk if
+    chunk_size is 0. At least one (possibly empty) chunk is returned.
+    """
+    if chunk_size <= 0 or n == 0:
+        yield 0, n
+        return
+    for start in range(0, n, chunk_size):
+        yield start, min(start + chunk_size, n)
@@ -0,0 +1,46 @@
+"""
+Process-wide cache of transformed expression vectors.
+
+Public datasets get the same handful of marker genes requested by many users. The cache keeps the
+log/CPM transformed vector of a gene as float32 under a byte budget, evicting the least recently used
+vectors first, so repeated requests skip the HDF5 read and the transform.
+"""
+
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from scopeserver.dataserver.utils import constant
+from scopeserver.dataserver.utils.sized_lru import SizedLRUCache
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ExpressionCacheKey(NamedTuple):
+    loom_path: Path
+    matrix_stamp: int
+    gene_row: int
+    log_transform: bool
+    cpm_normalise: bool
+
+
+class ExpressionCache(SizedLRUCache[ExpressionCacheKey, np.ndarray]):
+    """ A cache of read-only float32 vectors bounded by their total size in bytes. """
+
+    def put(self, key: ExpressionCacheKey, vals: np.ndarray) -> np.ndarray:
+        """
+        Store a vector and return the read-only float32 version that was cached.
+
+        Vectors larger than the whole budget are converted but not cached.
+        """
+        vals = np.array(vals, dtype=np.float32)
+        vals.flags.writeable = False
+        return super().put(key, vals)
+
+    def size_of(self, vals: np.ndarray) -> int:
+        return vals.nbytes
+
+
+EXPRESSION_CACHE = ExpressionCache(max_bytes=constant.EXPRESSION_CACHE_MAX_BYTES)
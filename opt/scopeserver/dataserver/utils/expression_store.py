@@ -0,0 +1,209 @@
+"""
+Gene-major compressed sparse (CSR) sidecar store for loom expression matrices.
+
+Looms keep their main matrix dense in HDF5 and the chunking is frequently cell-major, so reading the
+expression of one gene touches every chunk along that row. The store keeps the non-zero values of each
+gene next to each other in memory-mappable ``.npy`` files beside the loom, so a gene lookup only reads
+the non-zeros of that gene.
+
+Building a store scans and copies the whole matrix, so stores are only built and used when they are enabled
+in the server configuration (expressionStore). Otherwise expression is read from the loom itself.
+"""
+
+from concurrent import futures
+from pathlib import Path
+from typing import Optional, Tuple
+import json
+import shutil
+import time
+
+import numpy as np
+
+from scopeserver.dataserver.utils import constant
+from scopeserver.dataserver.utils.background import BackgroundJobs
+import logging
+
+logger = logging.getLogger(__name__)
+
+STORE_SUFFIX = ".expr_csr"
+STORE_VERSION = 2
+
+_BUILDER = BackgroundJobs("expression-store")
+_enabled = False
+
+
+def set_enabled(enabled: bool) -> None:
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+class ExpressionStore:
+    """ Read access to a gene-major CSR matrix backed by memory-mapped arrays. """
+
+    def __init__(self, path: Path, data: np.ndarray, indices: np.ndarray, indptr: np.ndarray, shape: Tuple[int, int]):
+        self.path = path
+        self.data = data
+        self.indices = indices
+        self.indptr = indptr
+        self.shape = shape
+
+    @property
+    def nnz(self) -> int:
+        return int(self.indptr[-1])
+
+    def get_row(self, row: int) -> np.ndarray:
+        """ Densify the expression of the gene at the given row. """
+        start, end = self.indptr[row], self.indptr[row + 1]
+        expression = np.zeros(self.shape[1], dtype=self.data.dtype)
+        expression[self.indices[start:end]] = self.data[start:end]
+        return expression
+
+
+def get_store_path(abs_file_path: Path) -> Path:
+    return abs_file_path.with_suffix(STORE_SUFFIX)
+
+
+def _read_meta(store_path: Path) -> Optional[dict]:
+    try:
+        with open(store_path / "meta.json", "r") as fh:
+            return json.load(fh)
+    except (FileNotFoundError, NotADirectoryError, json.decoder.JSONDecodeError):
+        return None
+
+
+def _write_meta(store_path: Path, meta: dict) -> None:
+    with open(store_path / "meta.json.tmp", "w") as fh:
+        json.dump(meta, fh)
+    (store_path / "meta.json.tmp").replace(store_path / "meta.json")
+
+
+def load(loom) -> Optional[ExpressionStore]:
+    """
+    Memory-map the store of the given loom, if one exists and was built by this version of SCope from the
+    current loom (same shape and modification time, see sidecar).
+    """
+    store_path = get_store_path(loom.abs_file_path)
+    meta = _read_meta(store_path)
+    if meta is None:
+        return None
+
+    shape = tuple(meta["shape"])
+    if (
+        meta.get("version") != STORE_VERSION
+        or shape != tuple(loom.loom_connection.shape)
+        or meta.get("mtime") != loom.get_mtime()
+    ):
+        logger.info(f"Expression store {store_path} is outdated for {loom.file_path}. Ignoring it.")
+        return None
+
+    logger.debug(f"Loading expression store for {loom.file_path} from {store_path}")
+    return ExpressionStore(
+        path=store_path,
+        data=np.load(store_path / "data.npy", mmap_mode="r"),
+        indices=np.load(store_path / "indices.npy", mmap_mode="r"),
+        indptr=np.load(store_path / "indptr.npy", mmap_mode="r"),
+        shape=(shape[0], shape[1]),
+    )
+
+
+def _raw_to_npy(raw_path: Path, npy_path: Path, dtype: np.dtype, length: int) -> None:
+    with open(npy_path, "wb") as out, open(raw_path, "rb") as raw:
+        np.lib.format.write_array_header_1_0(
+            out, {"descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False, "shape": (length,)}
+        )
+        shutil.copyfileobj(raw, out)
+    raw_path.unlink()
+
+
+def build(
+    loom,
+    block_size: int = constant.EXPRESSION_STORE_BLOCK_SIZE,
+    max_density: float = constant.EXPRESSION_STORE_MAX_DENSITY,
+) -> Optional[ExpressionStore]:
+    """
+    Convert the main matrix of a loom to a gene-major CSR store on disk.
+
+    The matrix is read in blocks of genes of at most block_size values and the non-zeros are streamed to
+    disk, so memory use is bounded by the block size whatever the number of cells. Building is abandoned
+    when the matrix turns out to be denser than ``max_density``, in which case reading the dense rows is as
+    cheap as the store would be.
+
+    Returns:
+        Optional[ExpressionStore]: The memory-mapped store or None if the loom is too dense.
+    """
+    build_start_time = time.time()
+    with loom.connection_lock:
+        n_genes, n_cells = loom.loom_connection.shape
+        dtype = loom.loom_connection.layers[""].dtype
+    max_nnz = int(max_density * n_genes * n_cells)
+    batch_size = max(1, block_size // max(n_cells, 1))
+
+    store_path = get_store_path(loom.abs_file_path)
+    tmp_path = store_path.with_suffix(STORE_SUFFIX + ".tmp")
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    tmp_path.mkdir()
+
+    indptr = np.zeros(n_genes + 1, dtype=np.int64)
+    nnz = 0
+    with open(tmp_path / "data.raw", "wb") as data_fh, open(tmp_path / "indices.raw", "wb") as indices_fh:
+        for start in range(0, n_genes, batch_size):
+            end = min(start + batch_size, n_genes)
+            with loom.connection_lock:
+                block = loom.loom_connection[start:end, :]
+            nz_rows, nz_cols = np.nonzero(block)
+            data_fh.write(block[nz_rows, nz_cols].astype(dtype, copy=False).tobytes())
+            indices_fh.write(nz_cols.astype(np.int32).tobytes())
+            indptr[start + 1 : end + 1] = nnz + np.cumsum(np.bincount(nz_rows, minlength=end - start))
+            nnz += len(nz_rows)
+            if nnz > max_nnz:
+                logger.info(f"{loom.file_path} is denser than {max_density:.0%}. Not building an expression store.")
+                shutil.rmtree(tmp_path)
+                return None
+
+    _raw_to_npy(tmp_path / "data.raw", tmp_path / "data.npy", dtype, nnz)
+    _raw_to_npy(tmp_path / "indices.raw", tmp_path / "indices.npy", np.dtype(np.int32), nnz)
+    np.save(tmp_path / "indptr.npy", indptr)
+    _write_meta(
+        tmp_path, {"version": STORE_VERSION, "shape": [n_genes, n_cells], "nnz": nnz, "mtime": loom.get_mtime()}
+    )
+
+    remove(loom.abs_file_path)
+    tmp_path.rename(store_path)
+    logger.debug(
+        "{0:.5f} seconds elapsed (building expression store for {1}) ---".format(
+            time.time() - build_start_time, loom.file_path
+        )
+    )
+    return load(loom)
+
+
+def build_in_background(loom) -> futures.Future:
+    """ Queue the build of a store for the given loom and attach it to the loom once it is ready. """
+
+    def build_and_attach() -> None:
+        try:
+            store = build(loom)
+        except Exception as err:
+            logger.error(f"Could not build expression store for {loom.file_path}: {err}")
+            shutil.rmtree(get_store_path(loom.abs_file_path).with_suffix(STORE_SUFFIX + ".tmp"), ignore_errors=True)
+            return
+        if store is not None:
+            loom.expression_store = store
+
+    return _BUILDER.submit(loom.abs_file_path, build_and_attach)
+
+
+def restamp(loom, previous_mtime: int) -> None:
+    """ Mark the store as valid after a write of SCope if it was valid before the write, see sidecar.restamp. """
+    store_path = get_store_path(loom.abs_file_path)
+    meta = _read_meta(store_path)
+    if meta is not None and meta.get("mtime") == previous_mtime:
+        _write_meta(store_path, {**meta, "mtime": loom.get_mtime()})
+
+
+def remove(abs_file_path: Path) -> None:
+    shutil.rmtree(get_store_path(abs_file_path), ignore_errors=True)
@@ -0,0 +1,179 @@
+"""
+Feature search across all global looms.
+
+The global search index tells which global looms have a key (element and type) of their search space, so that
+a single search tells which datasets have a gene, a regulon or a cluster annotated as some cell type. It has a
+segment per loom: the keys of the loom search space, in the packed layout of a search space, written to a
+segment directory next to the index file. The index file holds the stamp (modification times of the loom and of
+its search space) of every loom. Refreshing the index only reads the search spaces of the looms whose stamp
+changed, and replaces their segments, leaving the others as they are.
+
+Segments are built from the search spaces written next to the looms, without opening the looms. A loom that was
+never opened since it was added has no search space yet and is not searchable globally: getMyLooms opens every
+global loom, building their search spaces, and then refreshes the index.
+"""
+
+from concurrent import futures
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import heapq
+import threading
+
+import numpy as np
+
+from scopeserver.dataserver.utils import array_file
+from scopeserver.dataserver.utils import search_space as ss
+from scopeserver.dataserver.utils.search import match_result_cost, match_result_type_cost
+from scopeserver.dataserver.utils.search_space import PackedSearchSpace, SSKey
+from scopeserver.dataserver.utils.string_table import StringTable
+import logging
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_SEARCH_FILE_NAME = "SCope_global_search.ss"
+CURRENT_GLOBAL_SEARCH_VERSION = 3
+
+_WORKER = futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="global-search")
+
+LoomStamp = Tuple[int, ...]
+
+
+def get_stamp(abs_file_path: Path) -> LoomStamp:
+    """ Get the modification times of a loom, its search space and its search space journal (0 if missing). """
+    stamp = []
+    for path in (abs_file_path, ss.get_path(abs_file_path), ss.get_journal_path(abs_file_path)):
+        try:
+            stamp.append(path.stat().st_mtime_ns)
+        except FileNotFoundError:
+            stamp.append(0)
+    return tuple(stamp)
+
+
+class GlobalSearchIndex:
+    def __init__(self, path: Path):
+        self.path = path
+        self.segment_dir = path.with_name(f"{path.stem}_segments")
+        # Replaced, never modified, so that searches do not need a lock
+        self.segments: Dict[str, PackedSearchSpace] = {}
+        self.stamps: Dict[str, LoomStamp] = {}
+        self._lock = threading.Lock()
+        self._pending: Optional[futures.Future] = None
+        self._pending_looms: Dict[str, Path] = {}
+        self._pending_lock = threading.Lock()
+
+        arrays = array_file.read(path, CURRENT_GLOBAL_SEARCH_VERSION)
+        if arrays is None:
+            return
+        for loom, times in zip(StringTable.from_arrays(arrays, "looms"), arrays["stamps"].tolist()):
+            stamp: LoomStamp = tuple(times)
+            segment = self._read_segment(loom)
+            if segment is not None:
+                self.segments[loom] = segment
+            elif stamp[1] != 0:
+                # The segment of a loom having a search space is missing, it is built again on the next refresh
+                continue
+            self.stamps[loom] = stamp
+
+    def get_segment_path(self, loom: str) -> Path:
+        return self.segment_dir / f"{hashlib.sha1(loom.encode()).hexdigest()}{ss.SS_SUFFIX}"
+
+    def _read_segment(self, loom: str) -> Optional[PackedSearchSpace]:
+        arrays = array_file.read(self.get_segment_path(loom), CURRENT_GLOBAL_SEARCH_VERSION)
+        return None if arrays is None else PackedSearchSpace.from_arrays(arrays)
+
+    def _write_segment(self, loom: str, abs_file_path: Path) -> Optional[PackedSearchSpace]:
+        """ Write the segment of a loom from its search space, or remove it if the loom has no search space. """
+        search_space = ss.read(abs_file_path)
+        if search_space is None:
+            logger.debug(f"No search space for {loom}, it is not searchable globally until it is opened.")
+            array_file.remove(self.get_segment_path(loom))
+            return None
+        segment = PackedSearchSpace.pack({key: [] for key in search_space.to_dict()})
+        self.segment_dir.mkdir(exist_ok=True)
+        array_file.write(self.get_segment_path(loom), CURRENT_GLOBAL_SEARCH_VERSION, segment.to_arrays())
+        mapped = self._read_segment(loom)
+        return segment if mapped is None else mapped
+
+    def _swap_segment(self, loom: str, segment: Optional[PackedSearchSpace]) -> None:
+        segments = dict(self.segments)
+        if segment is None:
+            segments.pop(loom, None)
+        else:
+            segments[loom] = segment
+        self.segments = segments
+
+    def refresh(self, looms: Dict[str, Path]) -> bool:
+        """
+        Update the segments of the looms that were added, changed or removed since the last refresh.
+
+        Args:
+            looms (Dict[str, Path]): The absolute path of every loom, by its loom file path.
+
+        Returns:
+            bool: Whether the index changed.
+        """
+        with self._lock:
+            stamps = {loom: get_stamp(abs_file_path) for loom, abs_file_path in looms.items()}
+            changed = sorted(loom for loom, stamp in stamps.items() if self.stamps.get(loom) != stamp)
+            removed = sorted(self.stamps.keys() - stamps.keys())
+            if len(changed) == 0 and len(removed) == 0:
+                return False
+
+            for loom in removed:
+                array_file.remove(self.get_segment_path(loom))
+                self._swap_segment(loom, None)
+            for loom in changed:
+                self._swap_segment(loom, self._write_segment(loom, looms[loom]))
+
+            loom_names = sorted(stamps)
+            array_file.write(
+                self.path,
+                CURRENT_GLOBAL_SEARCH_VERSION,
+                {
+                    **StringTable.from_strings(loom_names).to_arrays("looms"),
+                    "stamps": np.array([stamps[loom] for loom in loom_names], dtype=np.int64).reshape(-1, 3),
+                },
+            )
+            self.stamps = stamps
+            logger.info(f"Updated global search index for {len(changed)} looms, removed {len(removed)}")
+            return True
+
+    def refresh_in_background(self, looms: Dict[str, Path]) -> futures.Future:
+        """
+        Refresh the index in the background.
+
+        Calls made while a refresh is queued share it, and it uses the looms of the last call, so that a burst
+        of getMyLooms calls refreshes the index once. A call made while a refresh is running queues another one.
+        """
+        with self._pending_lock:
+            self._pending_looms = looms
+            if self._pending is None:
+                self._pending = _WORKER.submit(self._refresh_pending)
+            return self._pending
+
+    def _refresh_pending(self) -> Optional[bool]:
+        with self._pending_lock:
+            looms, self._pending = self._pending_looms, None
+        try:
+            return self.refresh(looms)
+        except Exception as err:
+            logger.error(f"Could not refresh the global search index: {err}")
+            return None
+
+    def find(self, term: str, limit: int = 0) -> List[Tuple[SSKey, List[str]]]:
+        """ Get the best ranked keys matching a term (see search.find_matches), with the looms having them. """
+        exact = len(term.casefold()) == 1
+        found: Dict[SSKey, List[str]] = {}
+        for loom, segment in sorted(self.segments.items()):
+            for i in segment.find_ids(term, exact=exact):
+                found.setdefault(segment.get_key(i), []).append(loom)
+        keys = list(found)
+
+        def cost(position: int) -> Tuple[int, int, int]:
+            key = keys[position]
+            return match_result_type_cost(key.element_type), match_result_cost(term, key.element), position
+
+        positions = range(len(keys))
+        ranked = heapq.nsmallest(limit, positions, key=cost) if limit > 0 else sorted(positions, key=cost)
+        return [(keys[i], found[keys[i]]) for i in ranked]
@@ -12,8 +12,6 @@ import numpy as np
 from scopeserver.dataserver.utils import constant
 from scopeserver.dataserver.utils.constant import to_colours
 from scopeserver.dataserver.utils.loom import Loom
-from scopeserver.dataserver.utils.annotation import Annotation
-from scopeserver.dataserver.utils.data import uniq
 
 logger = logging.getLogger(__name__)
 
@@ -42,17 +40,14 @@ def label_annotation(loom: Loom, embedding: int, feature: str) -> List[FeatureLa
     values = md_annotation["values"]
     colours = to_colours(range(len(values)), color_list=md_annotation["colors"] if "colors" in md_annotation else None)
 
+    centroids = loom.get_centroids(embedding, feature)
+
     def labels() -> Generator[FeatureLabel, None, None]:
         for i, annotation in enumerate(values):
-            coords = loom.get_coordinates(
-                coordinatesID=embedding, annotation=[Annotation(name=feature, values=[annotation])]
-            )
+            # Values without any cell have no barycentre
+            x, y = centroids.get(annotation, (np.nan, np.nan))
 
-            yield FeatureLabel(
-                label=annotation,
-                colour=colours[i],
-                coordinate=Coordinate(x=np.mean(coords["x"]), y=np.mean(coords["y"])),
-            )
+            yield FeatureLabel(label=annotation, colour=colours[i], coordinate=Coordinate(x=x, y=y))
 
     return [label for label in labels()]
 
@@ -80,7 +75,9 @@ def label_all_clusters(loom: Loom, embedding: int, feature: str) -> List[Feature
         logger.warning(f"Not enough custom colors defined. Falling back to BIG_COLOR_LIST")
         colour_list = constant.BIG_COLOR_LIST
 
-    for i in uniq(loom.get_clustering_by_id(int(clustering_id))):
+    centroids = loom.get_centroids(embedding, f"Clustering_{clustering_id}")
+
+    for i in map(int, centroids):
         if i == -1:
             label_set.add((i, "Unclustered", "XX" * 3))
             continue
@@ -90,14 +87,8 @@ def label_all_clusters(loom: Loom, embedding: int, feature: str) -> List[Feature
 
     def labels() -> Generator[FeatureLabel, None, None]:
         for i, cluster in enumerate(clusters):
-            coords = loom.get_coordinates(
-                coordinatesID=embedding, cluster_info=(int(clustering_id), int(cluster_ids[i]))
-            )
-
-            yield FeatureLabel(
-                label=cluster,
-                colour=colours[i],
-                coordinate=Coordinate(x=np.mean(coords["x"]), y=np.mean(coords["y"])),
-            )
+            x, y = centroids[str(cluster_ids[i])]
+
+            yield FeatureLabel(label=cluster, colour=colours[i], coordinate=Coordinate(x=x, y=y))
 
     return [label for label in labels()]
@@ -0,0 +1,116 @@
+"""
+Level-of-detail selection of the cells of an embedding.
+
+Every cell gets a fixed random rank. A view with a cell budget shows the lowest ranked cells inside its
+viewport, which is a uniform sample of those cells and so keeps the density of the embedding. Zooming in
+only adds cells to the ones already shown, so a client can refine a view progressively. The cells are
+bucketed in a regular grid over the embedding, sorted by rank within each bucket, so a viewport only
+visits the buckets it overlaps.
+"""
+
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from scopeserver.dataserver.utils import constant
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Viewport(NamedTuple):
+    x_min: float
+    x_max: float
+    y_min: float
+    y_max: float
+
+
+class LodIndex:
+    """ Grid of the cells of one embedding, ranked for level-of-detail selection. """
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, grid_size: int = constant.LOD_GRID_SIZE, seed: int = 0):
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        self.grid_size = grid_size
+        n_cells = len(self.x)
+
+        self.by_rank = np.random.default_rng(seed).permutation(n_cells)
+        self.rank = np.empty(n_cells, dtype=np.int64)
+        self.rank[self.by_rank] = np.arange(n_cells)
+
+        if n_cells > 0:
+            self.bounds = Viewport(self.x.min(), self.x.max(), self.y.min(), self.y.max())
+        else:
+            self.bounds = Viewport(0.0, 0.0, 0.0, 0.0)
+        buckets = self.get_row(self.y) * grid_size + self.get_column(self.x)
+        # Cells sorted by bucket, and by rank within a bucket
+        self.cells = np.lexsort((self.rank, buckets))
+        self.bucket_starts = np.concatenate([[0], np.cumsum(np.bincount(buckets, minlength=grid_size ** 2))])
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def _to_grid(self, values: np.ndarray, low: float, high: float) -> np.ndarray:
+        span = high - low if high > low else 1.0
+        return np.clip(((np.asarray(values) - low) / span * self.grid_size).astype(np.int64), 0, self.grid_size - 1)
+
+    def get_column(self, x) -> np.ndarray:
+        return self._to_grid(x, self.bounds.x_min, self.bounds.x_max)
+
+    def get_row(self, y) -> np.ndarray:
+        return self._to_grid(y, self.bounds.y_min, self.bounds.y_max)
+
+    def covers(self, viewport: Viewport) -> bool:
+        return (
+            viewport.x_min <= self.bounds.x_min
+            and viewport.x_max >= self.bounds.x_max
+            and viewport.y_min <= self.bounds.y_min
+            and viewport.y_max >= self.bounds.y_max
+        )
+
+    def get_cells_in(self, viewport: Viewport) -> np.ndarray:
+        """ Get the cells inside a viewport, bucket by bucket. """
+        first_column, last_column = self.get_column([viewport.x_min, viewport.x_max])
+        first_row, last_row = self.get_row([viewport.y_min, viewport.y_max])
+        rows = np.arange(first_row, last_row + 1) * self.grid_size
+        starts = self.bucket_starts[rows + first_column]
+        ends = self.bucket_starts[rows + last_column + 1]
+        # The buckets of a grid row overlapping the viewport are contiguous in self.cells
+        candidates = np.concatenate([self.cells[start:end] for start, end in zip(starts, ends)])
+        inside = (
+            (self.x[candidates] >= viewport.x_min)
+            & (self.x[candidates] <= viewport.x_max)
+            & (self.y[candidates] >= viewport.y_min)
+            & (self.y[candidates] <= viewport.y_max)
+        )
+        return candidates[inside]
+
+    def select(
+        self, viewport: Optional[Viewport] = None, max_cells: int = 0, mask: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Select at most max_cells cells (all cells if 0) inside a viewport (the whole embedding if None),
+        only considering the cells set in mask if given.
+
+        Returns:
+            Tuple[np.ndarray, int]: The sorted indices of the selected cells and the number of cells the
+            selection was sampled from.
+        """
+        if len(self) == 0 or (
+            viewport is not None and (viewport.x_min > viewport.x_max or viewport.y_min > viewport.y_max)
+        ):
+            return np.array([], dtype=np.int64), 0
+
+        if viewport is None or self.covers(viewport):
+            candidates = self.by_rank if mask is None else self.by_rank[mask[self.by_rank]]
+            selected = candidates if max_cells <= 0 else candidates[:max_cells]
+            return np.sort(selected), len(candidates)
+
+        candidates = self.get_cells_in(viewport)
+        if mask is not None:
+            candidates = candidates[mask[candidates]]
+        if 0 < max_cells < len(candidates):
+            selected = candidates[np.argpartition(self.rank[candidates], max_cells - 1)[:max_cells]]
+        else:
+            selected = candidates
+        return np.sort(selected), len(candidates)
@@ -4,17 +4,30 @@ import zlib
 import base64
 from methodtools import lru_cache
 import pandas as pd
-import time
 import hashlib
 import functools
-from collections import Counter
+import copy
+import threading
+from itertools import compress
 from pathlib import Path
-from typing import Tuple, Dict, Any, Union, List, Set, Optional
+from typing import Tuple, Dict, Any, Union, List, Set, Optional, NamedTuple
 from loompy.loompy import LoomConnection
 from typing_extensions import TypedDict
 from google.protobuf.internal.containers import RepeatedScalarFieldContainer
 
+from scopeserver.dataserver.utils import cell_filter as cf
+from scopeserver.dataserver.utils import cell_index as ci
+from scopeserver.dataserver.utils import cluster_index as cli
+from scopeserver.dataserver.utils import coordinates
 from scopeserver.dataserver.utils import data_file_handler as dfh
+from scopeserver.dataserver.utils import colour_cache
+from scopeserver.dataserver.utils import expression_store as es
+from scopeserver.dataserver.utils import expression_cache as ec
+from scopeserver.dataserver.utils import lod
+from scopeserver.dataserver.utils import numi
+from scopeserver.dataserver.utils import sidecar
+from scopeserver.dataserver.utils import vmax
+from scopeserver.dataserver.utils import data
 from scopeserver.dataserver.utils import search_space as ss
 from scopeserver.dataserver.modules.gserver import s_pb2
 from scopeserver.dataserver.utils import constant
@@ -38,6 +51,17 @@ Clustering = TypedDict(
     "Clustering", {"id": int, "group": str, "name": str, "clusters": Clusters, "clusterMarkerMetrics": Any}
 )
 
+# Column attributes holding the AUC values of each regulon type, in the order regulon names are resolved
+REGULON_AUC_ATTRIBUTES = {"motif": "MotifRegulonsAUC", "track": "TrackRegulonsAUC", "legacy": "RegulonsAUC"}
+
+
+class RegulonField(NamedTuple):
+    """ Location of the AUC values of a regulon. """
+
+    regulon_type: str
+    attribute: str
+    field: str
+
 
 class Loom:
     def __init__(
@@ -51,14 +75,28 @@ class Loom:
         self.file_path = file_path
         self.abs_file_path = abs_file_path
         self.loom_connection = loom_connection
+        # Held by background jobs while they read the loom and by the loom file handler to replace the connection
+        self.connection_lock = threading.RLock()
         self.dfh = dfh.DataFileHandler()
 
         logger.info(f"New Loom object created for {file_path}")
         # Metrics
-        self.nUMI = None
+        self.nUMI: Optional[np.ndarray] = None
+        # Parsed MetaData attribute, shared by all readers until SCope writes new metadata
+        self.meta_data = None
+        self.meta_data_version = 0
+        self.meta_data_lock = threading.Lock()
+        self.cell_filter = cf.CellFilter(self)
+        self.cluster_indices = cli.build(self)
         self.species, self.gene_mappings = self.infer_species()
-        self.ss_pickle_name = self.abs_file_path.with_suffix(".ss_pkl")
+        self.gene_index = self.build_gene_index()
+        # SCope only writes attributes, so the modification time of the loom when it is opened identifies the
+        # version of its expression matrix until the loom is replaced
+        self.matrix_stamp = self.get_mtime()
+        self.mtime_before_write = self.matrix_stamp
         self.ss = ss.load_ss(self)
+        self.expression_store = es.load(self) if es.is_enabled() else None
+        self.vmax_table = vmax.load(self)
 
     def get_connection(self):
         return self.loom_connection
@@ -69,6 +107,26 @@ class Loom:
     def get_abs_file_path(self) -> Path:
         return self.abs_file_path
 
+    def get_mtime(self) -> int:
+        return self.abs_file_path.stat().st_mtime_ns
+
+    def reopen_writable(self) -> None:
+        # Sidecars computed from the loom as it is before SCope writes are still valid after the write
+        self.mtime_before_write = self.get_mtime()
+        self.loom_connection = self.lfh.change_loom_mode(self.file_path, mode="r+")
+
+    def reopen_read_only(self) -> None:
+        # Only attributes the sidecars do not depend on are written by SCope, so they are still valid.
+        self.loom_connection = self.lfh.change_loom_mode(self.file_path, mode="r")
+        for suffix in [numi.NUMI_SUFFIX, vmax.VMAX_SUFFIX]:
+            sidecar.restamp(self, suffix, self.mtime_before_write)
+        es.restamp(self, self.mtime_before_write)
+        # Clusterings may have been added or changed
+        self.cluster_indices = cli.build(self)
+        self.cell_filter.clear()
+        # Jobs that could not finish on the previous connection are queued again
+        self.lfh.schedule_background_jobs(self)
+
     def get_global_attribute_by_name(self, name):
         if name not in self.loom_connection.attrs.keys():
             raise AttributeError("The global attribute {0} does not exist in the .loom file.".format(name))
@@ -95,6 +153,10 @@ class Loom:
     def get_cell_ids(self) -> np.ndarray:
         return self.loom_connection.ca["CellID"]
 
+    @lru_cache(maxsize=1)
+    def get_cell_index(self) -> ci.CellIndex:
+        return ci.CellIndex(self.get_cell_ids())
+
     #############
     # Meta Data #
     #############
@@ -108,17 +170,18 @@ class Loom:
             return json.loads(zlib.decompress(base64.b64decode(meta.encode("ascii"))).decode("ascii"))
 
     def update_metadata(self, meta):
-        self.loom_connection = self.lfh.change_loom_mode(self.file_path, mode="r+")
+        self.reopen_writable()
         orig_metaJson = self.get_meta_data()
         self.loom_connection.attrs["MetaData"] = json.dumps(meta)
-        self.loom_connection = self.lfh.change_loom_mode(self.file_path, mode="r")
+        self.reopen_read_only()
+        self.invalidate_meta_data()
         new_metaJson = self.get_meta_data()
         return orig_metaJson != new_metaJson
 
     def rename_annotation(self, clustering_id: int, cluster_id: int, new_annotation_name: str) -> bool:
         logger.info("Changing annotation name for {0}".format(self.get_abs_file_path()))
 
-        metaJson = self.get_meta_data()
+        metaJson = self.get_meta_data_copy()
 
         for n, clustering in enumerate(metaJson["clusterings"]):
             if clustering["id"] == clustering_id:
@@ -127,10 +190,11 @@ class Loom:
             if cluster["id"] == cluster_id:
                 cluster_n = n
 
+        old_clustering = copy.deepcopy(metaJson["clusterings"][clustering_n])
         metaJson["clusterings"][clustering_n]["clusters"][cluster_n]["description"] = new_annotation_name
         self.update_metadata(metaJson)
 
-        self.ss = ss.update(self, update="clusterings")
+        ss.update_clustering(self, old_clustering, metaJson["clusterings"][clustering_n])
 
         if (
             self.get_meta_data()["clusterings"][clustering_n]["clusters"][cluster_n]["description"]
@@ -149,7 +213,7 @@ class Loom:
     def add_collab_annotation(self, request, secret: str) -> Tuple[bool, str]:
         logger.info("Adding collaborative annotation for {0}".format(self.get_abs_file_path()))
 
-        metaJson = self.get_meta_data()
+        metaJson = self.get_meta_data_copy()
 
         cell_type_annotation: Dict[str, Any] = {
             "data": {
@@ -195,6 +259,7 @@ class Loom:
             if cluster["id"] == request.clusterID:
                 cluster_n = n
 
+        old_clustering = copy.deepcopy(metaJson["clusterings"][clustering_n])
         if "cell_type_annotation" in metaJson["clusterings"][clustering_n]["clusters"][cluster_n].keys():
             current_annos = [
                 f"{x['data']['annotation_label']}__{x['data']['obo_id']}".casefold()
@@ -211,8 +276,7 @@ class Loom:
             ]
 
         self.update_metadata(metaJson)
-        self.get_meta_data_clustering_by_id.cache_clear()
-        self.ss = ss.update(self, update="cluster_annotations")
+        ss.update_clustering(self, old_clustering, metaJson["clusterings"][clustering_n])
 
         if (
             cell_type_annotation
@@ -227,7 +291,7 @@ class Loom:
     def annotation_vote(self, request, secret: str) -> Tuple[bool, str]:
         logger.info("Adding vote annotation for {0}".format(self.get_abs_file_path()))
 
-        metaJson = self.get_meta_data()
+        metaJson = self.get_meta_data_copy()
 
         for n, clustering in enumerate(metaJson["clusterings"]):
             if clustering["id"] == request.clusteringID:
@@ -298,7 +362,6 @@ class Loom:
 
         try:
             self.update_metadata(metaJson)
-            self.get_meta_data_clustering_by_id.cache_clear()
         except OSError as e:
             logger.error(e)
             return (False, "Couldn't write metadata!")
@@ -353,25 +416,19 @@ class Loom:
     def get_cells_overlap(
         self, cluster_info: s_pb2.NewClusterInfo, cluster_mapping: Dict[str, int]
     ) -> Tuple[List[int], List[int], Set[str]]:
-        chosen_cells = []
-        new_cluster_ids = []
-        missing_cells = set()
+        cell_indices = self.get_cell_index().lookup(cluster_info.cellIDs)
+        found = cell_indices >= 0
 
-        cellIDs = list(self.get_cell_ids())
-
-        for cell, cluster in zip(cluster_info.cellIDs, cluster_info.clusterIDs):
-            try:
-                chosen_cells.append(cellIDs.index(cell))
-                new_cluster_ids.append(cluster_mapping[cluster])
-            except ValueError:
-                missing_cells.add(cell)
+        chosen_cells = cell_indices[found].tolist()
+        new_cluster_ids = [cluster_mapping[cluster] for cluster in compress(cluster_info.clusterIDs, found)]
+        missing_cells = set(compress(cluster_info.cellIDs, ~found))
 
         return chosen_cells, new_cluster_ids, missing_cells
 
     def add_user_clustering(self, request) -> Tuple[bool, str]:
         logger.info("Adding user clustering for {0}".format(self.get_abs_file_path()))
 
-        metaJson = self.get_meta_data()
+        metaJson = self.get_meta_data_copy()
 
         new_clustering_meta, cluster_mapping = Loom.create_new_clustering_meta(metaJson, request)
 
@@ -392,13 +449,14 @@ class Loom:
 
         new_clusterings = Loom.dfToNamedMatrix(clusterings)
 
-        self.loom_connection = self.lfh.change_loom_mode(self.file_path, mode="r+")
+        self.reopen_writable()
         loom = self.loom_connection
         loom.ca.Clusterings = new_clusterings
         loom.attrs["MetaData"] = json.dumps(metaJson)
-        self.loom_connection = self.lfh.change_loom_mode(self.file_path, mode="r")
+        self.reopen_read_only()
+        self.invalidate_meta_data()
 
-        self.ss = ss.update(self, update="clusterings")
+        ss.update_clustering(self, None, new_clustering_meta)
 
         if new_clustering_meta["id"] in self.loom_connection.ca.Clusterings.dtype.names:
             logger.debug("Success")
@@ -424,21 +482,21 @@ class Loom:
         for clustering_meta in metadata["clusterings"]:
             clustering_name = clustering_meta["name"]
             clustering_id = clustering_meta["id"]
-            clustering = self.get_clustering_by_id(clustering_id)
+            cluster_index = self.get_cluster_index(clustering_id)
             cluster_names_dict = self.get_cluster_names(int(clustering_id))
-            counts: Counter = Counter(clustering[cell_idxs])
-            all_counts: Counter = Counter(clustering)
-            for cluster_id in counts:
+            counts = cluster_index.count(cell_idxs)
+            for code in np.flatnonzero(counts):
+                cluster_id = int(cluster_index.cluster_ids[code])
                 if cluster_id == -1:
                     continue
-                cluster_name = cluster_names_dict[int(cluster_id)]
+                n_cells = int(counts[code])
                 cluster_overlap_data.append(
                     {
                         "clustering_name": clustering_name,
-                        "cluster_name": cluster_name,
-                        "n_cells": counts[cluster_id],
-                        "cells_in_cluster": (counts[cluster_id] / len(cell_idxs)) * 100,
-                        "cluster_in_cells": (counts[cluster_id] / all_counts[cluster_id]) * 100,
+                        "cluster_name": cluster_names_dict[cluster_id],
+                        "n_cells": n_cells,
+                        "cells_in_cluster": (n_cells / len(cell_idxs)) * 100,
+                        "cluster_in_cells": (n_cells / cluster_index.sizes[code]) * 100,
                     }
                 )
         return cluster_overlap_data
@@ -480,7 +538,7 @@ class Loom:
     def set_hierarchy(self, L1: str, L2: str, L3: str) -> bool:
         logger.info("Changing hierarchy name for {0}".format(self.get_abs_file_path()))
 
-        self.loom_connection = self.lfh.change_loom_mode(self.file_path, mode="r+")
+        self.reopen_writable()
         loom = self.loom_connection
         attrs = self.loom_connection.attrs
 
@@ -489,7 +547,7 @@ class Loom:
         attrs["SCopeTreeL3"] = L3
 
         loom.attrs = attrs
-        self.loom_connection = self.lfh.change_loom_mode(self.file_path, mode="r")
+        self.reopen_read_only()
         loom = self.loom_connection
         newAttrs = self.loom_connection.attrs
 
@@ -505,7 +563,7 @@ class Loom:
         logger.info("Making metadata for {0}".format(self.get_abs_file_path()))
         metaJson = {}
 
-        self.loom_connection = self.lfh.change_loom_mode(self.file_path, mode="r+")
+        self.reopen_writable()
         loom = self.loom_connection
         col_attrs = loom.ca.keys()
 
@@ -567,7 +625,10 @@ class Loom:
         logger.debug(f'\tFinal Clusterings for {self.file_path} - {metaJson["clusterings"]}')
 
         loom.attrs["MetaData"] = json.dumps(metaJson)
-        self.loom_connection = self.lfh.change_loom_mode(self.file_path, mode="r")
+        self.reopen_read_only()
+        self.invalidate_meta_data()
+        # A compaction of the previous search space would overwrite the files written by the new one
+        self.ss.wait_for_compaction()
         self.ss = ss.build(self)
 
     def get_file_metadata(self):
@@ -645,11 +706,7 @@ class Loom:
     def get_meta_data_by_key(self, key):
         meta_data = self.get_meta_data()
         if key in meta_data.keys():
-            md = meta_data[key]
-            if key == "embeddings":
-                for e in md:  # Fix for malformed embeddings json (R problem)
-                    e["id"] = int(e["id"])
-            return md
+            return meta_data[key]
         return []
 
     @staticmethod
@@ -682,14 +739,42 @@ class Loom:
     def has_meta_data(self) -> bool:
         return "MetaData" in self.loom_connection.attrs.keys()
 
-    def get_meta_data(self):
+    def read_meta_data(self):
         md = self.loom_connection.attrs.MetaData
         if type(md) is np.ndarray:
             md = self.loom_connection.attrs.MetaData[0]
         try:
-            return json.loads(md)
+            meta_data = json.loads(md)
         except json.decoder.JSONDecodeError:
-            return Loom.decompress_meta(meta=md)
+            meta_data = Loom.decompress_meta(meta=md)
+        for e in meta_data.get("embeddings", []):  # Fix for malformed embeddings json (R problem)
+            e["id"] = int(e["id"])
+        return meta_data
+
+    def get_meta_data(self):
+        """
+        Get the parsed MetaData attribute of the loom.
+
+        The parsed metadata is shared between all callers and must be treated as read-only,
+        use get_meta_data_copy to build modified metadata.
+        """
+        with self.meta_data_lock:
+            if self.meta_data is None:
+                self.meta_data = self.read_meta_data()
+            return self.meta_data
+
+    def get_meta_data_copy(self):
+        return copy.deepcopy(self.get_meta_data())
+
+    def invalidate_meta_data(self) -> None:
+        with self.meta_data_lock:
+            self.meta_data = None
+            self.meta_data_version += 1
+        self.get_meta_data_clustering_by_id.cache_clear()
+        # Writing metadata may also write the embeddings (see generate_meta_data)
+        self.get_packed_coordinates.cache_clear()
+        self.get_lod_index.cache_clear()
+        colour_cache.discard_outdated(self)
 
     def get_nb_cells(self) -> int:
         return self.loom_connection.shape[1]
@@ -713,27 +798,10 @@ class Loom:
             return "Unknown", {}
         return maxSpecies, mappings[maxSpecies]
 
-    def get_anno_cells(self, annotations: List[Annotation], logic: str = "OR"):
-        loom = self.loom_connection
-        cell_indices = []
-        for anno in annotations:
-            anno_name = anno.name
-            for annotation_value in anno.values:
-                anno_set = set()
-                if anno_name.startswith("Clustering_"):
-                    clustering_id = str(anno_name.split("_")[1])
-                    for x in np.where(loom.ca.Clusterings[clustering_id] == annotation_value)[0]:
-                        anno_set.add(x)
-                else:
-                    for x in np.where(loom.ca[anno_name].astype(str) == str(annotation_value))[0]:
-                        anno_set.add(x)
-                cell_indices.append(anno_set)
+    def get_anno_cells(self, annotations: List[Annotation], logic: str = "OR") -> np.ndarray:
         if logic not in ["AND", "OR"]:
             logic = "OR"
-        if logic == "AND":
-            return sorted(list(set.intersection(*cell_indices)))
-        elif logic == "OR":
-            return sorted(list(set.union(*cell_indices)))
+        return self.cell_filter.get_cells(annotations=annotations, logic=logic)
 
     @lru_cache(maxsize=8)
     def get_gene_names(self) -> Dict[str, str]:
@@ -753,6 +821,22 @@ class Loom:
                 logger.error("Gene: {0} is not in the mapping table!".format(gene))
         return conversion
 
+    def build_gene_index(self) -> Dict[str, int]:
+        """Map every gene symbol, and every mapped synonym, to its row index in the loom.
+
+        Symbols present in the loom take precedence over synonyms and the first row wins for duplicated symbols,
+        which matches the previous mask based lookup.
+        """
+        gene_index: Dict[str, int] = {}
+        for row, gene in enumerate(self.get_genes()):
+            gene_index.setdefault(gene, row)
+        for synonym, gene in self.get_gene_names().items():
+            gene_index.setdefault(synonym, gene_index[gene])
+        return gene_index
+
+    def get_gene_row(self, gene_symbol: str) -> Optional[int]:
+        return self.gene_index.get(gene_symbol)
+
     ##############
     # Expression #
     ##############
@@ -764,17 +848,33 @@ class Loom:
             return self.loom_connection.ca.nUMI
         if self.has_ca_attr(name="n_counts"):
             return self.loom_connection.ca.n_counts
-        # Compute nUMI on the fly
-        # TODO: Add case here for large files. Sum across 1mio rows takes a very long time to compute
-        # Possibly faster fix totals = ds.map([np.sum], axis=1)[0]
-
-        calc_nUMI_start_time = time.time()
-        self.nUMI = self.loom_connection.map([np.sum], axis=1)[0]
-        logger.debug("{0:.5f} seconds elapsed (calculating nUMI) ---".format(time.time() - calc_nUMI_start_time))
+        # Computed in chunks by a background job when the loom was opened, wait for it if it is still running
+        self.nUMI = numi.get(self)
         return self.nUMI
 
+    def get_gene_expression_by_row(self, row: int) -> np.ndarray:
+        if self.expression_store is not None:
+            return self.expression_store.get_row(row)
+        return self.loom_connection[row, :]
+
+    def get_gene_expression_by_rows(self, rows: List[int]) -> np.ndarray:
+        """ Read the expression of several genes, given by increasing row numbers, in a single read. """
+        if self.expression_store is not None:
+            return np.stack([self.expression_store.get_row(row) for row in rows])
+        return self.loom_connection[rows, :]
+
     def get_gene_expression_by_gene_symbol(self, gene_symbol: str) -> np.ndarray:
-        return self.loom_connection[self.get_genes() == gene_symbol, :][0]
+        return self.get_gene_expression_by_row(self.gene_index[gene_symbol])
+
+    def transform_expression(self, gene_expr: np.ndarray, log_transform: bool, cpm_normalise: bool) -> np.ndarray:
+        """ CPM normalise and/or log transform the expression of one gene or of a block of genes (one per row). """
+        if cpm_normalise:
+            logger.debug("Debug: CPM normalising gene expression...")
+            gene_expr = (gene_expr / self.get_nUMI()) * constant.COUNTS_PER_MILLION
+        if log_transform:
+            logger.debug("Debug: log-transforming gene expression...")
+            gene_expr = np.log2(gene_expr + 1)
+        return gene_expr
 
     def get_gene_expression(
         self,
@@ -783,31 +883,149 @@ class Loom:
         cpm_normalise: bool = False,
         annotation: Optional[List[Annotation]] = None,
         logic: str = "OR",
-    ) -> Tuple[np.ndarray, list]:
-        if gene_symbol not in set(self.get_genes()):
-            try:
-                gene_symbol = self.get_gene_names()[gene_symbol]
-            except KeyError:
-                # No gene is present, likely ATAC data, return 0's
-                cell_indices = list(range(self.get_nb_cells()))
-                gene_expr = np.zeros(self.get_nb_cells())
-                return gene_expr, cell_indices
-
-        logger.debug("Debug: getting expression of {0} ...".format(gene_symbol))
-        gene_expr = self.get_gene_expression_by_gene_symbol(gene_symbol=gene_symbol)
-        if cpm_normalise:
-            logger.debug("Debug: CPM normalising gene expression...")
-            gene_expr = (gene_expr / self.get_nUMI()) * constant.COUNTS_PER_MILLION
-        if log_transform:
-            logger.debug("Debug: log-transforming gene expression...")
-            gene_expr = np.log2(gene_expr + 1)
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        gene_row = self.get_gene_row(gene_symbol)
+        if gene_row is None:
+            # No gene is present, likely ATAC data, return 0's
+            cell_indices = np.arange(self.get_nb_cells())
+            gene_expr = np.zeros(self.get_nb_cells())
+            return gene_expr, cell_indices
+
+        cache_key = ec.ExpressionCacheKey(self.abs_file_path, self.matrix_stamp, gene_row, log_transform, cpm_normalise)
+        cached = ec.EXPRESSION_CACHE.get(cache_key)
+        if cached is None:
+            logger.debug("Debug: getting expression of {0} ...".format(gene_symbol))
+            cached = ec.EXPRESSION_CACHE.put(
+                cache_key,
+                self.transform_expression(self.get_gene_expression_by_row(gene_row), log_transform, cpm_normalise),
+            )
+        gene_expr = cached
         if annotation is not None:
             cell_indices = self.get_anno_cells(annotations=annotation, logic=logic)
             gene_expr = gene_expr[cell_indices]
         else:
-            cell_indices = list(range(self.get_nb_cells()))
+            cell_indices = np.arange(self.get_nb_cells())
         return gene_expr, cell_indices
 
+    def get_genes_expression(
+        self, gene_symbols: List[str], log_transform: bool = True, cpm_normalise: bool = False
+    ) -> np.ndarray:
+        """
+        Get the expression of several genes as one float32 array with a row per gene, see
+        get_genes_expression_vectors.
+        """
+        vectors = self.get_genes_expression_vectors(gene_symbols, log_transform, cpm_normalise)
+        if len(vectors) == 0:
+            return np.zeros((0, self.get_nb_cells()), dtype=np.float32)
+        return np.stack(vectors).astype(np.float32, copy=False)
+
+    def get_genes_expression_vectors(
+        self, gene_symbols: List[str], log_transform: bool = True, cpm_normalise: bool = False
+    ) -> List[np.ndarray]:
+        """
+        Get the expression vector of several genes, as the shared read-only vectors of the expression cache.
+
+        Genes that are not in the expression cache are read in a single sorted read and transformed together.
+        Unknown genes get a vector of zeros, like get_gene_expression.
+        """
+        gene_expr = [np.zeros(self.get_nb_cells(), dtype=np.float32) for _ in gene_symbols]
+        uncached_rows: Dict[int, List[int]] = {}
+        for n, gene_symbol in enumerate(gene_symbols):
+            gene_row = self.get_gene_row(gene_symbol)
+            if gene_row is None:
+                continue
+            cache_key = ec.ExpressionCacheKey(
+                self.abs_file_path, self.matrix_stamp, gene_row, log_transform, cpm_normalise
+            )
+            cached = ec.EXPRESSION_CACHE.get(cache_key)
+            if cached is None:
+                uncached_rows.setdefault(gene_row, []).append(n)
+            else:
+                gene_expr[n] = cached
+
+        if len(uncached_rows) > 0:
+            rows = sorted(uncached_rows.keys())
+            logger.debug(f"Debug: getting expression of {len(rows)} genes ...")
+            block = self.transform_expression(self.get_gene_expression_by_rows(rows), log_transform, cpm_normalise)
+            for gene_row, vals in zip(rows, block):
+                cache_key = ec.ExpressionCacheKey(
+                    self.abs_file_path, self.matrix_stamp, gene_row, log_transform, cpm_normalise
+                )
+                cached = ec.EXPRESSION_CACHE.put(cache_key, vals)
+                for n in uncached_rows[gene_row]:
+                    gene_expr[n] = cached
+        return gene_expr
+
+    def get_features_values(
+        self,
+        features: List[Tuple[str, str]],
+        log_transform: bool = True,
+        cpm_normalise: bool = False,
+        annotation: Optional[List[Annotation]] = None,
+        logic: str = "OR",
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the values of several genes, regulons and metrics as one float32 array with a row per feature.
+
+        Args:
+            features (List[Tuple[str, str]]): (feature type, feature name) pairs, with feature type one of
+                "gene", "regulon" or "metric".
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The values of the features in the selected cells and the selected cells.
+        """
+        values = np.zeros((len(features), self.get_nb_cells()), dtype=np.float32)
+        genes = [(n, feature) for n, (feature_type, feature) in enumerate(features) if feature_type == "gene"]
+        if len(genes) > 0:
+            gene_positions, gene_symbols = zip(*genes)
+            values[list(gene_positions)] = self.get_genes_expression(
+                list(gene_symbols), log_transform=log_transform, cpm_normalise=cpm_normalise
+            )
+        for n, (feature_type, feature) in enumerate(features):
+            if feature_type == "regulon":
+                auc_vals, _ = self.get_auc_values(regulon=feature)
+                if auc_vals.size > 0:
+                    values[n] = auc_vals
+            elif feature_type == "metric":
+                values[n], _ = self.get_metric(
+                    metric_name=feature, log_transform=log_transform, cpm_normalise=cpm_normalise
+                )
+            elif feature_type != "gene":
+                raise ValueError(f"Cannot get values of feature type {feature_type}")
+
+        if annotation is not None:
+            cell_indices = self.get_anno_cells(annotations=annotation, logic=logic)
+            values = values[:, cell_indices]
+        else:
+            cell_indices = np.arange(self.get_nb_cells())
+        return values, cell_indices
+
+    def get_vmax(
+        self, feature_type: str, feature: str, log_transform: bool = True, cpm_normalise: bool = False
+    ) -> Tuple[float, float]:
+        """
+        Get the 99th (clamped) and 100th percentiles of a gene, regulon or metric over all cells.
+
+        Answered from the precomputed vmax table when it has the feature, computed from the values otherwise.
+        """
+        if feature_type == "regulon":
+            log_transform = cpm_normalise = False
+        if self.vmax_table is not None:
+            percentiles = self.vmax_table.lookup(self, feature_type, feature, log_transform, cpm_normalise)
+            if percentiles is not None:
+                return percentiles
+        if feature_type == "gene":
+            vals, _ = self.get_gene_expression(
+                gene_symbol=feature, log_transform=log_transform, cpm_normalise=cpm_normalise
+            )
+        elif feature_type == "regulon":
+            vals, _ = self.get_auc_values(regulon=feature)
+        elif feature_type == "metric":
+            vals, _ = self.get_metric(metric_name=feature, log_transform=log_transform, cpm_normalise=cpm_normalise)
+        else:
+            raise ValueError(f"No vmax for feature type {feature_type}")
+        return data.get_99_and_100_percentiles(vals)
+
     ############
     # Regulons #
     ############
@@ -856,38 +1074,57 @@ class Loom:
         else:
             return np.empty((0, 0), dtype=[("none", None)])
 
+    @lru_cache(maxsize=3)
+    def get_regulon_fields(self, regulon_type: str) -> Tuple[str, ...]:
+        attribute = REGULON_AUC_ATTRIBUTES[regulon_type]
+        if attribute not in self.loom_connection.ca:
+            return ()
+        return self.loom_connection._file["col_attrs"][attribute].dtype.names
+
+    def get_regulon_names(self, regulon_type: str) -> Tuple[str, ...]:
+        return tuple(field.replace(" ", "_") for field in self.get_regulon_fields(regulon_type=regulon_type))
+
+    @lru_cache(maxsize=1)
+    def get_regulon_registry(self) -> Dict[str, RegulonField]:
+        """ Map every regulon name to the attribute and field holding its AUC values. """
+        registry: Dict[str, RegulonField] = {}
+        for regulon_type, attribute in REGULON_AUC_ATTRIBUTES.items():
+            for field in self.get_regulon_fields(regulon_type=regulon_type):
+                registry.setdefault(field.replace(" ", "_"), RegulonField(regulon_type, attribute, field))
+        return registry
+
+    @lru_cache(maxsize=64)
+    def get_regulon_auc(self, regulon: str) -> Optional[np.ndarray]:
+        """ Read the AUC values of a single regulon, without loading the AUC values of the other regulons. """
+        regulon_field = self.get_regulon_registry().get(regulon)
+        if regulon_field is None:
+            return None
+        vals = self.loom_connection._file["col_attrs"][regulon_field.attribute][regulon_field.field]
+        vals.flags.writeable = False
+        return vals
+
     def get_auc_values(
         self, regulon: str, annotation: Optional[List[Annotation]] = None, logic: str = "OR"
-    ) -> Tuple[np.ndarray, list]:
+    ) -> Tuple[np.ndarray, np.ndarray]:
         logger.debug("Getting AUC values for {0} ...".format(regulon))
-        cellIndices = list(range(self.get_nb_cells()))
-        # Get the regulon type
-        if regulon in self.get_regulons_AUC(regulon_type="motif").dtype.names:
-            regulon_type = "motif"
-        elif regulon in self.get_regulons_AUC(regulon_type="track").dtype.names:
-            regulon_type = "track"
-        elif regulon in self.get_regulons_AUC(regulon_type="legacy").dtype.names:
-            regulon_type = "legacy"
-        else:
+        cellIndices = np.arange(self.get_nb_cells())
+        vals = self.get_regulon_auc(regulon)
+        if vals is None:
             logger.debug(
                 f"AUC values were requested but not found.\n\tLoom: {self.file_path}\n\tColumn attributes present: {self.loom_connection.ca.keys()}"
             )
             return np.empty((0, 0)), cellIndices
 
-        if regulon in self.get_regulons_AUC(regulon_type=regulon_type).dtype.names:
-            vals = self.get_regulons_AUC(regulon_type=regulon_type)[regulon]
-            if annotation is not None:
-                cellIndices = self.get_anno_cells(annotations=annotation, logic=logic)
-                vals = vals[cellIndices]
-            return vals, cellIndices
-        return np.empty((0, 0)), cellIndices
+        if annotation is not None:
+            cellIndices = self.get_anno_cells(annotations=annotation, logic=logic)
+            vals = vals[cellIndices]
+        return vals, cellIndices
 
     def get_regulon_target_gene_metric(self, regulon: str, metric_accessor: str):
+        regulon_field = self.get_regulon_registry().get(regulon)
         regulon_type = ""
-        if regulon in self.get_regulons_AUC(regulon_type="motif").dtype.names:
-            regulon_type = "motif"
-        elif regulon in self.get_regulons_AUC(regulon_type="track").dtype.names:
-            regulon_type = "track"
+        if regulon_field is not None and regulon_field.regulon_type in ["motif", "track"]:
+            regulon_type = regulon_field.regulon_type
         loom_attribute = self.loom_connection.row_attrs[f"{regulon_type.capitalize()}Regulon{metric_accessor}"]
         if str(regulon) in loom_attribute.dtype.names:
             regulon = str(regulon)
@@ -940,16 +1177,67 @@ class Loom:
             y = y[cellIndices]
         elif cluster_info is not None:
             clustering_id, cluster_id = cluster_info
-            cellIndices = set()
-            for c in np.where(loom.ca.Clusterings[str(clustering_id)].astype(str) == str(cluster_id))[0]:
-                cellIndices.add(c)
-            cellIndices = list(cellIndices)
+            cellIndices = self.get_cluster_index(clustering_id).get_cells(cluster_id)
             x = x[cellIndices]
             y = y[cellIndices]
         else:
-            cellIndices = list(range(self.get_nb_cells()))
+            cellIndices = np.arange(self.get_nb_cells())
         return {"x": x, "y": -y, "cellIndices": cellIndices}
 
+    @lru_cache(maxsize=8)
+    def get_packed_coordinates(
+        self, coordinatesID: int, encoding: "s_pb2.CoordinatesEncodingValue"
+    ) -> coordinates.PackedCoordinates:
+        """ Get the coordinates of all cells of an embedding in a packed encoding, see coordinates.pack. """
+        coords = self.get_coordinates(coordinatesID=coordinatesID)
+        return coordinates.pack(coords["x"], coords["y"], encoding)
+
+    @lru_cache(maxsize=4)
+    def get_lod_index(self, coordinatesID: int) -> lod.LodIndex:
+        coords = self.get_coordinates(coordinatesID=coordinatesID)
+        return lod.LodIndex(coords["x"], coords["y"])
+
+    def get_lod_coordinates(
+        self,
+        coordinatesID: int,
+        max_cells: int,
+        viewport: Optional[lod.Viewport] = None,
+        annotation: Optional[List[Annotation]] = None,
+        logic: str = "OR",
+    ):
+        """ Get the coordinates of a level-of-detail sample of the cells of an embedding, see lod.LodIndex.select. """
+        mask = None
+        if annotation is not None:
+            mask = np.zeros(self.get_nb_cells(), dtype=bool)
+            mask[self.get_anno_cells(annotations=annotation, logic=logic)] = True
+        lod_index = self.get_lod_index(coordinatesID)
+        cellIndices, total_cells = lod_index.select(viewport=viewport, max_cells=max_cells, mask=mask)
+        return {
+            "x": lod_index.x[cellIndices],
+            "y": lod_index.y[cellIndices],
+            "cellIndices": cellIndices,
+            "totalCells": total_cells,
+        }
+
+    def get_centroids(self, coordinatesID: int, anno_name: str) -> Dict[str, Tuple[float, float]]:
+        """
+        Get the barycentre, in the coordinates returned by get_coordinates, of the cells having each value of an
+        annotation or clustering ("Clustering_<id>").
+        """
+        return self.get_centroids_by_version(coordinatesID, anno_name, self.meta_data_version)
+
+    @lru_cache(maxsize=64)
+    def get_centroids_by_version(
+        self, coordinatesID: int, anno_name: str, meta_data_version: int
+    ) -> Dict[str, Tuple[float, float]]:
+        coords = self.get_coordinates(coordinatesID=coordinatesID)
+        value_codes, codes = self.cell_filter.get_codes(anno_name)
+        # One pass over the cells sums the coordinates of every value at once
+        counts = np.bincount(codes, minlength=len(value_codes))
+        x = np.bincount(codes, weights=coords["x"], minlength=len(value_codes)) / counts
+        y = np.bincount(codes, weights=coords["y"], minlength=len(value_codes)) / counts
+        return {value: (x[code], y[code]) for value, code in value_codes.items()}
+
     ##############
     # Annotation #
     ##############
@@ -991,7 +1279,7 @@ class Loom:
             cell_indices = self.get_anno_cells(annotations=annotation, logic=logic)
             metric_vals = metric_vals[cell_indices]
         else:
-            cell_indices = list(range(self.get_nb_cells()))
+            cell_indices = np.arange(self.get_nb_cells())
         return metric_vals, cell_indices
 
     ###############
@@ -1001,6 +1289,9 @@ class Loom:
     def get_clustering_by_id(self, clustering_id: int):
         return self.loom_connection.ca.Clusterings[str(clustering_id)]
 
+    def get_cluster_index(self, clustering_id: int) -> cli.ClusterIndex:
+        return self.cluster_indices[int(clustering_id)]
+
     # def get_cluster_IDs(self, loom_file_path, clustering_id):
     #     loom = self.lfh.get_loom_connection(loom_file_path)
     #     return loom.ca.Clusterings[str(clustering_id)]
@@ -7,6 +7,9 @@ from pathlib import Path
 from typing import Optional
 
 from scopeserver.dataserver.utils import data_file_handler as dfh
+from scopeserver.dataserver.utils import expression_store as es
+from scopeserver.dataserver.utils import numi
+from scopeserver.dataserver.utils import vmax
 from scopeserver.dataserver.utils.loom import Loom
 import logging
 
@@ -27,8 +30,18 @@ class LoomFileHandler:
             loom_file_handler=self,
         )
         self.active_looms[abs_file_path] = loom
+        self.schedule_background_jobs(loom)
         return loom
 
+    @staticmethod
+    def schedule_background_jobs(loom: Loom) -> None:
+        """ Queue the computation of the data derived from a loom that is neither attached nor persisted yet. """
+        if es.is_enabled() and loom.expression_store is None:
+            es.build_in_background(loom)
+        numi.schedule(loom)
+        if loom.vmax_table is None:
+            vmax.build_in_background(loom)
+
     def load_loom_file(self, file_path: Path, abs_file_path: Path, mode: str = "r") -> Optional[Loom]:
         try:
             loom_connection = lp.connect(abs_file_path.as_posix(), mode=mode, validate=False)
@@ -53,19 +66,17 @@ class LoomFileHandler:
         if not os.path.exists(abs_file_path):
             raise ValueError(f"The file located at {abs_file_path} does not exist.")
 
+        mode = "r+" if mode == "r+" else "r"
+        logger.debug(f"Reopening file as {mode}")
         if abs_file_path in self.active_looms:
-            self.active_looms[abs_file_path].get_connection().close()
-
-        if mode == "r+":
-            logger.debug(f"Reopening file as {mode}")
-            self.active_looms[abs_file_path] = self.get_loom(loom_file_path=loom_file_path, mode="r+")
-            logger.info(f"{loom_file_path} now {self.active_looms[abs_file_path].get_connection().mode}")
-
+            loom = self.active_looms[abs_file_path]
+            # Background jobs wait for the new connection instead of failing on the closed one
+            with loom.connection_lock:
+                loom.get_connection().close()
+                self.active_looms[abs_file_path] = self.get_loom(loom_file_path=loom_file_path, mode=mode)
         else:
-            logger.debug(f"Reopening file as r")
-            self.active_looms[abs_file_path] = self.get_loom(loom_file_path=loom_file_path)
-            logger.info(f"{loom_file_path} now {self.active_looms[abs_file_path].get_connection().mode}")
-
+            self.active_looms[abs_file_path] = self.get_loom(loom_file_path=loom_file_path, mode=mode)
+        logger.info(f"{loom_file_path} now {self.active_looms[abs_file_path].get_connection().mode}")
         return self.active_looms[abs_file_path].get_connection()
 
     def get_loom_absolute_file_path(self, loom_file_path: Path) -> Path:
@@ -0,0 +1,101 @@
+"""
+Computing and persisting the number of UMIs per cell for looms that do not store it.
+
+Summing the whole matrix takes a very long time on big files, so it is done once in chunks by a
+background worker when the loom is first opened and the result is pickled in a sidecar next to the loom.
+Requests that need nUMI before the computation is finished wait for the running job instead of starting
+another scan, and compute it themselves if the job failed.
+"""
+
+from concurrent import futures
+from pathlib import Path
+from typing import Optional
+import time
+
+import numpy as np
+
+from scopeserver.dataserver.utils import constant
+from scopeserver.dataserver.utils import sidecar
+from scopeserver.dataserver.utils.background import BackgroundJobs
+import logging
+
+logger = logging.getLogger(__name__)
+
+NUMI_SUFFIX = ".nUMI_pkl"
+CURRENT_NUMI_VERSION = 1
+
+_JOBS = BackgroundJobs("nUMI")
+
+
+def has_numi_attr(loom) -> bool:
+    return loom.has_ca_attr(name="nUMI") or loom.has_ca_attr(name="n_counts")
+
+
+def compute(loom, batch_size: int = constant.NUMI_BATCH_SIZE) -> np.ndarray:
+    """ Sum the expression of every cell, reading the matrix one block of cells at a time. """
+    calc_nUMI_start_time = time.time()
+    with loom.connection_lock:
+        n_cells = loom.get_nb_cells()
+    nUMI = np.zeros(n_cells)
+    store = loom.expression_store
+    if store is not None:
+        for start in range(0, store.nnz, batch_size * 1024):
+            end = min(start + batch_size * 1024, store.nnz)
+            nUMI += np.bincount(store.indices[start:end], weights=store.data[start:end], minlength=n_cells)
+    else:
+        for start in range(0, n_cells, batch_size):
+            end = min(start + batch_size, n_cells)
+            with loom.connection_lock:
+                nUMI[start:end] = loom.loom_connection[:, start:end].sum(axis=0)
+    logger.debug(
+        "{0:.5f} seconds elapsed (calculating nUMI for {1}) ---".format(
+            time.time() - calc_nUMI_start_time, loom.file_path
+        )
+    )
+    return nUMI
+
+
+def load(loom) -> Optional[np.ndarray]:
+    """ Load the persisted nUMI of a loom if it was computed for the current version of the file. """
+    return sidecar.load(loom, NUMI_SUFFIX, CURRENT_NUMI_VERSION)
+
+
+def write(loom, nUMI: np.ndarray) -> None:
+    sidecar.write(loom, NUMI_SUFFIX, CURRENT_NUMI_VERSION, nUMI)
+
+
+def compute_in_background(loom) -> futures.Future:
+    """ Start computing nUMI for a loom, or return the job that is already computing it. """
+
+    def compute_and_write() -> np.ndarray:
+        nUMI = compute(loom)
+        write(loom, nUMI)
+        return nUMI
+
+    return _JOBS.submit(loom.abs_file_path, compute_and_write)
+
+
+def schedule(loom) -> None:
+    """ Compute nUMI in the background if the loom neither stores it nor has it persisted. """
+    if not has_numi_attr(loom) and load(loom) is None:
+        logger.info(f"Computing nUMI for {loom.file_path} in the background")
+        compute_in_background(loom)
+
+
+def get(loom) -> np.ndarray:
+    """ Get the persisted nUMI of a loom, waiting for the background job if it is still running. """
+    job = _JOBS.get(loom.abs_file_path)
+    if job is None:
+        nUMI = load(loom)
+        if nUMI is not None:
+            return nUMI
+        job = compute_in_background(loom)
+    try:
+        return job.result()
+    except Exception as err:
+        logger.error(f"Could not compute nUMI for {loom.file_path} in the background: {err}. Computing it now.")
+        return compute(loom)
+
+
+def remove(abs_file_path: Path) -> None:
+    sidecar.remove(abs_file_path, NUMI_SUFFIX)
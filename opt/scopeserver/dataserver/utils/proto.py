@@ -14,10 +14,12 @@ from scopeserver.dataserver.modules.gserver import s_pb2
 def protoize_cell_type_annotation(clusterings_metadata, secret: str):
     """
     Confirm hashes of, and convert cell type annotations in the provided clusterings metadata
-    dictionary into protobuf objects.
+    dictionary into protobuf objects. The provided metadata is left untouched.
     """
-    for n, clustering in enumerate(clusterings_metadata.copy()):
-        for m, cluster in enumerate(clustering["clusters"]):
+    protoized_clusterings = []
+    for clustering in clusterings_metadata:
+        clusters = []
+        for cluster in clustering["clusters"]:
             if "cell_type_annotation" in cluster:
                 proto_cell_type_annotations = []
                 ctas = cluster["cell_type_annotation"]
@@ -34,8 +36,9 @@ def protoize_cell_type_annotation(clusterings_metadata, secret: str):
                         for v in cta["votes"][i]["voters"]:
                             hash_data = json.dumps(cta["data"]) + v["voter_id"] + secret
                             user_hash = hashlib.sha256(hash_data.encode()).hexdigest()
-                            v["voter_hash"] = user_hash == v["voter_hash"]
-                            votes[i]["voters"].append(s_pb2.CollabAnnoVoter(**v))
+                            votes[i]["voters"].append(
+                                s_pb2.CollabAnnoVoter(**{**v, "voter_hash": user_hash == v["voter_hash"]})
+                            )
                             votes[i]["total"] += 1
                         votes[i] = s_pb2.CollabAnnoVotes(**votes[i])
 
@@ -46,8 +49,10 @@ def protoize_cell_type_annotation(clusterings_metadata, secret: str):
                         votes_against=votes["votes_against"],
                     )
                     proto_cell_type_annotations.append(cta_proto)
-                clusterings_metadata[n]["clusters"][m]["cell_type_annotation"] = proto_cell_type_annotations
-    return clusterings_metadata
+                cluster = {**cluster, "cell_type_annotation": proto_cell_type_annotations}
+            clusters.append(cluster)
+        protoized_clusterings.append({**clustering, "clusters": clusters})
+    return protoized_clusterings
 
 
 def protoize_cluster_marker_metric(metric: Dict, cluster_marker_metrics: DataFrame):
@@ -1,8 +1,9 @@
 import sys
+import heapq
 import logging
 import operator
 
-from typing import Dict, NamedTuple, Tuple, List, Optional, Type, Union
+from typing import Dict, NamedTuple, Set, Tuple, List, Optional, Type, Union
 from collections import OrderedDict, defaultdict
 from contextlib import suppress
 from scopeserver.dataserver.utils import data_file_handler
@@ -10,7 +11,7 @@ from scopeserver.dataserver.utils.constant import Species
 
 from scopeserver.dataserver.utils.loom import Loom
 from scopeserver.dataserver.utils import constant
-from scopeserver.dataserver.utils.search_space import SSKey, SearchSpaceDict
+from scopeserver.dataserver.utils.search_space import SSKey, JournaledSearchSpace
 
 logger = logging.getLogger(__name__)
 
@@ -97,32 +98,59 @@ def sort_results(search_term: str, results: List[MatchResult]) -> List[MatchResu
     return [MatchResult(match, result) for _, match, result in sorted_costs]
 
 
-def find_matches(search_term: str, search_space: SearchSpaceDict) -> List[MatchResult]:
+def find_top_matches(search_term: str, search_space: JournaledSearchSpace, limit: int) -> List[MatchResult]:
+    """
+    Search for the matches of the limit best results (feature and type) in the search space.
+
+    The search space is walked in tiers of increasing cost (see JournaledSearchSpace.find_tiers), the keys of
+    a tier popped from a heap by match cost and position: matches are visited in the order of sort_results, so
+    results are selected at their best match. The walk stops as soon as the limit-th result is selected, so
+    the later matches of the selected results (e.g. a synonym containing the term) are not returned.
+    """
+
+    top: Set[ResultTypePair] = set()
+    match_results: List[MatchResult] = []
+    tiers = search_space.find_tiers(search_term, match_result_type_cost, exact=len(search_term.casefold()) == 1)
+    for tier in tiers:
+        # Keys are only ordered as far as the walk goes
+        heap = [(match_result_cost(search_term, found.key.element), found.position, i) for i, found in enumerate(tier)]
+        heapq.heapify(heap)
+        while len(heap) > 0:
+            found = tier[heapq.heappop(heap)[2]]
+            for element in found.get_values():
+                top.add(ResultTypePair(element, found.key.element_type))
+                match_results.append(MatchResult(found.key, element))
+                if len(top) == limit:
+                    return match_results
+    return match_results
+
+
+def find_matches(search_term: str, search_space: JournaledSearchSpace, limit: int = 0) -> List[MatchResult]:
     """
     Search for matches in the search space.
 
     Find keys in the search space where the search term matches (casefolded)
-    the searchable element. Return the match, the matches category and relationship.
+    the searchable element, using the search index of the search space.
+    Return the match, the matches category and relationship.
 
     Args:
         search_term (str): Term the user typed
-        search_space (SearchSpace): Search space from loom object
+        search_space (JournaledSearchSpace): Search space from loom object
+        limit (int): Only return the matches of the limit best results, 0 for all (see find_top_matches)
 
     Returns:
         List[SearchMatch]: A sorted list of the matches to the users search term
     """
 
-    casefold_term = search_term.casefold()
+    if limit > 0:
+        return find_top_matches(search_term, search_space, limit)
 
-    if len(casefold_term) == 1:
-        matches = (x for x in search_space if casefold_term == x.element.casefold())
-    else:
-        matches = (x for x in search_space if casefold_term in x.element.casefold())
+    matches = search_space.find(search_term, exact=len(search_term.casefold()) == 1)
 
     match_results: List[MatchResult] = []
 
-    for ss_match in matches:
-        for element in search_space[ss_match]:
+    for ss_match, elements in matches:
+        for element in elements:
             match_results.append(MatchResult(ss_match, element))
     return sort_results(search_term, match_results)
 
@@ -252,19 +280,19 @@ def get_final_feature_and_type(
     return features, feature_types
 
 
-def get_search_results(search_term: str, loom: Loom) -> Dict[str, List[str]]:
+def get_search_results(search_term: str, loom: Loom, limit: int = 0) -> Dict[str, List[str]]:
     """Take a user search term and a loom file and extract the results to display to the user
 
     Args:
         search_term (str): Search term from the user
         loom (Loom): Loom file to be searched
-        data_file_handler (DataFileHandler): The data file handler object from the Gserver
+        limit (int): Maximum number of best ranked results, 0 for all
 
     Returns:
         Dict[str, List[str]]: A dict of the compiled results
     """
 
-    matches = find_matches(search_term, loom.ss.search_space_dict)
+    matches = find_matches(search_term, loom.ss, limit=limit)
     aggregated_matches = aggregate_matches(matches)
     features, feature_types = get_final_feature_and_type(loom, aggregated_matches)
     descriptions, features, feature_types = create_feature_description(aggregated_matches, features, feature_types)
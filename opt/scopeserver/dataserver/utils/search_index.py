@@ -0,0 +1,119 @@
+"""
+Inverted index of the elements of a search space.
+
+Elements are casefolded once. Exact queries are binary searches in the sorted elements, and substring
+queries intersect the posting lists of the characters, bigrams or trigrams of the query, so the cost of a
+query depends on the number of candidate elements instead of the size of the search space. The index is
+made of string tables and arrays only, so that it can be memory mapped.
+"""
+
+from collections import defaultdict
+from typing import Dict, List
+
+import numpy as np
+
+from scopeserver.dataserver.utils.string_table import StringTable
+import logging
+
+logger = logging.getLogger(__name__)
+
+NGRAM_SIZES = (1, 2, 3)
+NO_ELEMENTS = np.array([], dtype=np.int32)
+
+
+def get_ngrams(text: str, n: int) -> List[str]:
+    return [text[i : i + n] for i in range(len(text) - n + 1)]
+
+
+class SearchIndex:
+    """ Casefolded exact and substring lookup of a list of elements by their position in the list. """
+
+    def __init__(
+        self,
+        folded: StringTable,
+        order: np.ndarray,
+        ngrams: StringTable,
+        posting_offsets: np.ndarray,
+        postings: np.ndarray,
+    ):
+        self.folded = folded
+        self.order = order
+        self.ngrams = ngrams
+        self.posting_offsets = posting_offsets
+        self.postings = postings
+
+    @classmethod
+    def build(cls, elements: List[str]) -> "SearchIndex":
+        folded = [element.casefold() for element in elements]
+        order = np.array(sorted(range(len(folded)), key=folded.__getitem__), dtype=np.int32)
+
+        postings: Dict[str, List[int]] = defaultdict(list)
+        for element_id, element in enumerate(folded):
+            for n in NGRAM_SIZES:
+                for ngram in set(get_ngrams(element, n)):
+                    postings[ngram].append(element_id)
+        # Element IDs are appended in increasing order, so every posting list is sorted
+        ngrams = sorted(postings)
+        posting_offsets = np.zeros(len(ngrams) + 1, dtype=np.int64)
+        np.cumsum([len(postings[ngram]) for ngram in ngrams], out=posting_offsets[1:])
+        flat_postings = np.array([i for ngram in ngrams for i in postings[ngram]], dtype=np.int32)
+        return cls(
+            StringTable.from_strings(folded), order, StringTable.from_strings(ngrams), posting_offsets, flat_postings
+        )
+
+    def __len__(self) -> int:
+        return len(self.folded)
+
+    def _get_range(self, low: int, high: int) -> np.ndarray:
+        return np.sort(self.order[low:high])
+
+    def get_postings(self, ngram: str) -> np.ndarray:
+        encoded = ngram.encode("utf-8")
+        position = self.ngrams.bisect(encoded)
+        if position < len(self.ngrams) and self.ngrams.get_bytes(position) == encoded:
+            return self.postings[self.posting_offsets[position] : self.posting_offsets[position + 1]]
+        return NO_ELEMENTS
+
+    def exact(self, term: str) -> np.ndarray:
+        """ Get the sorted IDs of the elements equal to the (casefolded) term. """
+        encoded = term.casefold().encode("utf-8")
+        return self._get_range(
+            self.folded.bisect(encoded, self.order), self.folded.bisect(encoded, self.order, right=True)
+        )
+
+    def substring(self, term: str) -> np.ndarray:
+        """ Get the sorted IDs of the elements containing the (casefolded) term. """
+        term = term.casefold()
+        if len(term) == 0:
+            return np.arange(len(self), dtype=np.int32)
+
+        n = min(len(term), NGRAM_SIZES[-1])
+        postings = sorted((self.get_postings(ngram) for ngram in set(get_ngrams(term, n))), key=len)
+        candidates = postings[0]
+        for posting in postings[1:]:
+            if len(candidates) == 0:
+                break
+            candidates = np.intersect1d(candidates, posting, assume_unique=True)
+        if len(term) == n:
+            return candidates
+        # The n-grams of the term may appear in an element in another order
+        return np.array([i for i in candidates if term in self.folded[i]], dtype=np.int32)
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        return {
+            **self.folded.to_arrays("index_folded"),
+            "index_order": self.order,
+            **self.ngrams.to_arrays("index_ngrams"),
+            "index_posting_offsets": self.posting_offsets,
+            "index_postings": self.postings,
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "SearchIndex":
+        return cls(
+            StringTable.from_arrays(arrays, "index_folded"),
+            arrays["index_order"],
+            StringTable.from_arrays(arrays, "index_ngrams"),
+            arrays["index_posting_offsets"],
+            arrays["index_postings"],
+        )
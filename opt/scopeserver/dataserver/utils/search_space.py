@@ -1,15 +1,41 @@
-from copy import deepcopy
+"""
+The search space of a loom: every searchable element with its type and the features it resolves to.
+
+A SearchSpace is built from the loom in a dictionary, then packed into a PackedSearchSpace: an interned
+string table, type codes and offset arrays, with the search index of its elements. The packed search space
+is written next to the loom in a versioned array file, and loaded by memory map when the loom is opened.
+
+Changes of the clusterings made through SCope are not packed right away: the added and removed entries are
+appended to a journal next to the packed search space, replayed on load, and packed in the background once
+the journal grows long (see JournaledSearchSpace).
+"""
+
+from concurrent import futures
 from pathlib import Path
-import pickle
+import functools
+import json
+import os
 import re
-from typing import Any, Dict, NamedTuple, Optional, List
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, NamedTuple, Optional, List, Set, Tuple
 
+import numpy as np
+
+from scopeserver.dataserver.utils import array_file
+from scopeserver.dataserver.utils import constant
 from scopeserver.dataserver.utils import data_file_handler as dfh
+from scopeserver.dataserver.utils import search_index as si
+from scopeserver.dataserver.utils.string_table import StringTable
 import logging
 
 logger = logging.getLogger(__name__)
 
-CURRENT_SS_VERISON = 3
+CURRENT_SS_VERISON = 6
+SS_SUFFIX = ".ss"
+JOURNAL_SUFFIX = ".ss_journal"
+LEGACY_SS_SUFFIX = ".ss_pkl"
+
+_COMPACTOR = futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="search-space")
 
 
 class SSKey(NamedTuple):
@@ -21,6 +47,23 @@ SSValue = List[str]
 SearchSpaceDict = Dict[SSKey, SSValue]
 
 
+class SSChange(NamedTuple):
+    """ A value added to or removed from the values of a key. Keys without values are removed. """
+
+    element: str
+    element_type: str
+    value: str
+    added: bool
+
+
+class FoundKey(NamedTuple):
+    """ A key found in a search space, at its position in the results of find, with a getter of its values. """
+
+    position: int
+    key: SSKey
+    get_values: Callable[[], SSValue]
+
+
 class SearchSpace:
 
     """
@@ -35,7 +78,6 @@ class SearchSpace:
     def __init__(self, loom) -> None:
         self.loom = loom
         self.search_space_dict: SearchSpaceDict = {}
-        self.search_space_version: int = CURRENT_SS_VERISON
         self.species: str
         self.gene_mappings: Dict[str, str]
         self.species, self.gene_mappings = loom.infer_species()
@@ -117,18 +159,18 @@ class SearchSpace:
     def add_regulons(self) -> None:
         if self.loom.has_legacy_regulons():
             self.add_elements(
-                elements=self.loom.get_regulons_AUC(regulon_type="legacy").dtype.names,
+                elements=self.loom.get_regulon_names(regulon_type="legacy"),
                 element_type="regulon",
             )
         else:
             if self.loom.has_motif_regulons():
                 self.add_elements(
-                    elements=self.loom.get_regulons_AUC(regulon_type="motif").dtype.names,
+                    elements=self.loom.get_regulon_names(regulon_type="motif"),
                     element_type="regulon",
                 )
             if self.loom.has_track_regulons():
                 self.add_elements(
-                    elements=self.loom.get_regulons_AUC(regulon_type="track").dtype.names,
+                    elements=self.loom.get_regulon_names(regulon_type="track"),
                     element_type="regulon",
                 )
         self.add_markers(element_type="regulon_target")
@@ -138,12 +180,12 @@ class SearchSpace:
         if element_type == "regulon_target":
             regulons = []
             if self.loom.has_legacy_regulons():
-                regulons = self.loom.get_regulons_AUC(regulon_type="legacy").dtype.names
+                regulons = self.loom.get_regulon_names(regulon_type="legacy")
             else:
                 if self.loom.has_motif_regulons():
-                    regulons += self.loom.get_regulons_AUC(regulon_type="motif").dtype.names
+                    regulons += self.loom.get_regulon_names(regulon_type="motif")
                 if self.loom.has_track_regulons():
-                    regulons += self.loom.get_regulons_AUC(regulon_type="track").dtype.names
+                    regulons += self.loom.get_regulon_names(regulon_type="track")
 
             for regulon in regulons:
                 genes = self.loom.get_regulon_genes(regulon=regulon)
@@ -196,51 +238,368 @@ class SearchSpace:
         self.add_elements(elements=metrics, element_type="metric")
 
 
-def load_ss(loom) -> SearchSpace:
-    ss_pickle_name: Path = loom.ss_pickle_name
-    try:
-        with open(ss_pickle_name, "rb") as fh:
-            logger.debug(f"Loading prebuilt SS for {loom.file_path} from {ss_pickle_name}")
-            ss = pickle.load(fh)
-            ss.loom = loom
-            ss.dfh = dfh.DataFileHandler()
-            if not hasattr(ss, "search_space_version"):
-                logger.error(f"Search space has no version key and is likely legacy. Rebuilding search space...")
-                ss = build(loom)
-            elif ss.search_space_version != CURRENT_SS_VERISON:
-                logger.error(
-                    f"Cached search space version {ss.search_space_version} is not {CURRENT_SS_VERISON}. Rebuilding search space..."
+class PackedSearchSpace:
+    """
+    Read-only search space made of arrays.
+
+    Elements, types and values are IDs in a table of the distinct strings of the search space. The values of
+    key i are values[value_offsets[i] : value_offsets[i + 1]].
+    """
+
+    def __init__(
+        self,
+        strings: StringTable,
+        types: np.ndarray,
+        key_elements: np.ndarray,
+        key_types: np.ndarray,
+        value_offsets: np.ndarray,
+        values: np.ndarray,
+        search_index: si.SearchIndex,
+    ):
+        self.strings = strings
+        self.types = types
+        self.key_elements = key_elements
+        self.key_types = key_types
+        self.value_offsets = value_offsets
+        self.values = values
+        self.search_index = search_index
+
+    @classmethod
+    def pack(cls, search_space_dict: SearchSpaceDict) -> "PackedSearchSpace":
+        string_ids: Dict[str, int] = {}
+        type_codes: Dict[str, int] = {}
+        key_elements: List[int] = []
+        key_types: List[int] = []
+        value_offsets: List[int] = [0]
+        values: List[int] = []
+        for key, key_values in search_space_dict.items():
+            key_elements.append(string_ids.setdefault(key.element, len(string_ids)))
+            key_types.append(type_codes.setdefault(key.element_type, len(type_codes)))
+            values.extend(string_ids.setdefault(value, len(string_ids)) for value in key_values)
+            value_offsets.append(len(values))
+        types = [string_ids.setdefault(element_type, len(string_ids)) for element_type in type_codes]
+        return cls(
+            StringTable.from_strings(string_ids),
+            np.array(types, dtype=np.int32),
+            np.array(key_elements, dtype=np.int32),
+            np.array(key_types, dtype=np.uint16),
+            np.array(value_offsets, dtype=np.int64),
+            np.array(values, dtype=np.int32),
+            si.SearchIndex.build([key.element for key in search_space_dict]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.key_elements)
+
+    def get(self, key: SSKey) -> Optional[SSValue]:
+        for i in self.search_index.exact(key.element):
+            if self.get_key(i) == key:
+                return self.get_values(i)
+        return None
+
+    def get_key(self, i: int) -> SSKey:
+        return SSKey(self.strings[self.key_elements[i]], self.strings[self.types[self.key_types[i]]])
+
+    def get_values(self, i: int) -> SSValue:
+        return [self.strings[value] for value in self.values[self.value_offsets[i] : self.value_offsets[i + 1]]]
+
+    def find_ids(self, term: str, exact: bool = False) -> np.ndarray:
+        """ Get the IDs of the keys whose element is equal to (exact) or contains the casefolded term. """
+        return self.search_index.exact(term) if exact else self.search_index.substring(term)
+
+    def find(self, term: str, exact: bool = False) -> List[Tuple[SSKey, SSValue]]:
+        """ Get the keys whose element is equal to (exact) or contains the casefolded term, with their values. """
+        return [(self.get_key(i), self.get_values(i)) for i in self.find_ids(term, exact=exact)]
+
+    def get_type_costs(self, key_ids: np.ndarray, type_cost: Callable[[str], int]) -> np.ndarray:
+        """ Get the cost of the type of some keys, computing it once per type. """
+        costs = np.array([type_cost(self.strings[string_id]) for string_id in self.types], dtype=np.int64)
+        return costs[self.key_types[key_ids]]
+
+    def to_dict(self) -> SearchSpaceDict:
+        return {self.get_key(i): self.get_values(i) for i in range(len(self))}
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        return {
+            **self.strings.to_arrays("strings"),
+            "types": self.types,
+            "key_elements": self.key_elements,
+            "key_types": self.key_types,
+            "value_offsets": self.value_offsets,
+            "values": self.values,
+            **self.search_index.to_arrays(),
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "PackedSearchSpace":
+        return cls(
+            StringTable.from_arrays(arrays, "strings"),
+            arrays["types"],
+            arrays["key_elements"],
+            arrays["key_types"],
+            arrays["value_offsets"],
+            arrays["values"],
+            si.SearchIndex.from_arrays(arrays),
+        )
+
+
+def get_known_values(values: SSValue) -> Callable[[], SSValue]:
+    return lambda: values
+
+
+def apply_change(values: Optional[SSValue], change: SSChange) -> Optional[SSValue]:
+    """ Get the values of a key (None if it does not exist) after a change. """
+    values = values or []
+    if change.added and change.value not in values:
+        values = values + [change.value]
+    elif not change.added:
+        values = [value for value in values if value != change.value]
+    return values if len(values) > 0 else None
+
+
+class JournaledSearchSpace:
+    """
+    A packed search space and the changes journaled since it was packed.
+
+    The changed keys are kept in a dictionary that is replaced, never modified, so that searches do not need
+    a lock. Once the journal holds constant.SS_JOURNAL_MAX_CHANGES changes, the search space is packed again
+    in the background and the journal is emptied.
+    """
+
+    def __init__(self, abs_file_path: Path, packed: PackedSearchSpace, journal: Iterable[SSChange] = ()):
+        self.abs_file_path = abs_file_path
+        self.packed = packed
+        self.journal: List[SSChange] = []
+        self.changed: Dict[SSKey, Optional[SSValue]] = {}
+        self.compaction: Optional[futures.Future] = None
+        self._lock = threading.Lock()
+        self._replay(journal)
+
+    def _replay(self, journal: Iterable[SSChange]) -> None:
+        changed = dict(self.changed)
+        for change in journal:
+            key = SSKey(change.element, change.element_type)
+            changed[key] = apply_change(changed[key] if key in changed else self.packed.get(key), change)
+            self.journal.append(change)
+        self.changed = changed
+
+    def get(self, key: SSKey) -> Optional[SSValue]:
+        changed = self.changed
+        return changed[key] if key in changed else self.packed.get(key)
+
+    def find(self, term: str, exact: bool = False) -> List[Tuple[SSKey, SSValue]]:
+        """ Get the keys whose element is equal to (exact) or contains the casefolded term, with their values. """
+        packed, changed = self.packed, self.changed
+        results = []
+        for key, values in packed.find(term, exact=exact):
+            current = changed[key] if key in changed else values
+            if current is not None:
+                results.append((key, current))
+        found = {key for key, _ in results}
+        folded = term.casefold()
+        for key, current in changed.items():
+            element = key.element.casefold()
+            if current is not None and key not in found and (element == folded if exact else folded in element):
+                results.append((key, current))
+        return results
+
+    def find_tiers(self, term: str, type_cost: Callable[[str], int], exact: bool = False) -> Iterator[List[FoundKey]]:
+        """
+        Find the keys of find in tiers of increasing cost.
+
+        Tiers go by the cost of the key types. Within a type cost, the keys whose element is equal to the
+        casefolded term come before the ones only containing it. The keys of a tier are only decoded when it
+        is reached, and their values when asked for, so that a search can stop after the first tiers.
+        """
+        packed, changed = self.packed, self.changed
+        folded = term.casefold()
+        key_ids = packed.find_ids(term, exact=exact)
+        is_equal = np.ones(len(key_ids), dtype=bool) if exact else np.isin(key_ids, packed.search_index.exact(term))
+        key_costs = packed.get_type_costs(key_ids, type_cost)
+        added = [
+            (
+                FoundKey(len(packed) + position, key, get_known_values(values)),
+                type_cost(key.element_type),
+            )
+            for position, (key, values) in enumerate(changed.items())
+            if values is not None
+            and (key.element.casefold() == folded if exact else folded in key.element.casefold())
+            and packed.get(key) is None
+        ]
+
+        for cost in sorted(set(key_costs.tolist()) | {cost for _, cost in added}):
+            for equal in (True, False):
+                tier = []
+                for i in key_ids[(key_costs == cost) & (is_equal == equal)]:
+                    key = packed.get_key(i)
+                    values = changed.get(key) if key in changed else None
+                    if key not in changed:
+                        tier.append(FoundKey(int(i), key, functools.partial(packed.get_values, i)))
+                    elif values is not None:
+                        tier.append(FoundKey(int(i), key, get_known_values(values)))
+                tier.extend(
+                    found
+                    for found, found_cost in added
+                    if found_cost == cost and (found.key.element.casefold() == folded) == equal
                 )
-                ss = build(loom)
-    except (EOFError, FileNotFoundError, TypeError):
-        ss = build(loom)
+                if len(tier) > 0:
+                    yield tier
+
+    def to_dict(self) -> SearchSpaceDict:
+        return self._to_dict(self.packed, self.changed)
+
+    @staticmethod
+    def _to_dict(packed: PackedSearchSpace, changed: Dict[SSKey, Optional[SSValue]]) -> SearchSpaceDict:
+        search_space_dict = packed.to_dict()
+        for key, values in changed.items():
+            if values is None:
+                search_space_dict.pop(key, None)
+            else:
+                search_space_dict[key] = values
+        return search_space_dict
+
+    def apply(self, changes: List[SSChange]) -> None:
+        """ Journal and apply changes, and compact the search space in the background if needed. """
+        with self._lock:
+            append_journal(get_journal_path(self.abs_file_path), changes)
+            self._replay(changes)
+            if len(self.journal) >= constant.SS_JOURNAL_MAX_CHANGES and self.compaction is None:
+                self.compaction = _COMPACTOR.submit(self.compact)
+
+    def compact(self) -> None:
+        """ Pack the journaled changes into a new search space file and drop them from the journal. """
+        try:
+            with self._lock:
+                n_changes, packed, changed = len(self.journal), self.packed, self.changed
+            packed = write(self.abs_file_path, self._to_dict(packed, changed))
+            with self._lock:
+                # Changes journaled while packing are kept for the next compaction
+                remaining = self.journal[n_changes:]
+                write_journal(get_journal_path(self.abs_file_path), remaining)
+                self.packed, self.journal, self.changed = packed, [], {}
+                self._replay(remaining)
+            logger.debug(f"Compacted search space of {self.abs_file_path}")
+        except Exception as err:
+            logger.error(f"Could not compact search space of {self.abs_file_path}: {err}")
+        finally:
+            with self._lock:
+                self.compaction = None
+
+    def wait_for_compaction(self) -> None:
+        """ Wait for the running compaction, if any, e.g. before the search space files are written again. """
+        with self._lock:
+            compaction = self.compaction
+        if compaction is not None:
+            futures.wait([compaction])
+
+
+def get_clustering_entries(clustering: Mapping[str, Any]) -> Set[Tuple[SSKey, str]]:
+    """
+    Get the (key, value) pairs of the search space built from the meta data of a clustering, see
+    SearchSpace.add_clusterings. Marker genes only depend on the IDs of the clustering and its clusters.
+    """
+    element_type = "Clustering: {0}".format(clustering["name"])
+    entries = {(SSKey("All Clusters", element_type), "All Clusters")}
+    for cluster in clustering["clusters"]:
+        entries.add((SSKey(cluster["description"], element_type), cluster["description"]))
+        for annotation in cluster.get("cell_type_annotation") or []:
+            label = f'{annotation["data"]["annotation_label"]} ({annotation["data"]["obo_id"]})'
+            entries.add((SSKey(label, "cluster_annotation"), f'{int(clustering["id"])}_{cluster["id"]}'))
+    return entries
+
+
+def get_clustering_changes(
+    old_clustering: Optional[Mapping[str, Any]], new_clustering: Mapping[str, Any]
+) -> List[SSChange]:
+    old_entries = get_clustering_entries(old_clustering) if old_clustering is not None else set()
+    new_entries = get_clustering_entries(new_clustering)
+    return [
+        SSChange(key.element, key.element_type, value, False) for key, value in sorted(old_entries - new_entries)
+    ] + [SSChange(key.element, key.element_type, value, True) for key, value in sorted(new_entries - old_entries)]
+
+
+def get_path(abs_file_path: Path) -> Path:
+    return abs_file_path.with_suffix(SS_SUFFIX)
+
+
+def get_journal_path(abs_file_path: Path) -> Path:
+    return abs_file_path.with_suffix(JOURNAL_SUFFIX)
+
+
+def read_journal(path: Path) -> List[SSChange]:
+    changes = []
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    changes.append(SSChange(*json.loads(line)))
+                except (ValueError, TypeError):
+                    # The last change may have been partially written
+                    logger.warning(f"Ignoring invalid change in {path}")
+    except FileNotFoundError:
+        pass
+    return changes
+
+
+def append_journal(path: Path, changes: List[SSChange]) -> None:
+    with open(path, "a", encoding="utf-8") as fh:
+        fh.writelines(json.dumps(list(change)) + "\n" for change in changes)
+
+
+def write_journal(path: Path, changes: List[SSChange]) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        fh.writelines(json.dumps(list(change)) + "\n" for change in changes)
+    os.replace(tmp_path, path)
+
+
+def read(abs_file_path: Path) -> Optional[JournaledSearchSpace]:
+    """ Read the search space written next to a loom, without opening the loom. """
+    arrays = array_file.read(get_path(abs_file_path), CURRENT_SS_VERISON)
+    if arrays is None:
+        return None
+    return JournaledSearchSpace(
+        abs_file_path, PackedSearchSpace.from_arrays(arrays), read_journal(get_journal_path(abs_file_path))
+    )
+
+
+def load_ss(loom) -> JournaledSearchSpace:
+    ss = read(loom.abs_file_path)
+    if ss is None:
+        logger.info(f"No search space of version {CURRENT_SS_VERISON} for {loom.file_path}. Building search space...")
+        array_file.remove(loom.abs_file_path.with_suffix(LEGACY_SS_SUFFIX))
+        return build(loom)
+    logger.debug(f"Loaded prebuilt SS for {loom.file_path}")
+    if len(ss.journal) >= constant.SS_JOURNAL_MAX_CHANGES:
+        ss.compaction = _COMPACTOR.submit(ss.compact)
     return ss
 
 
-def build(loom) -> SearchSpace:
+def build(loom) -> JournaledSearchSpace:
     logger.debug(f"Building Search Spaces for {loom.file_path}")
     ss = SearchSpace(loom=loom).build()
     logger.debug(f"Built Search Space for {loom.file_path}")
-    write(loom, ss)
-    return ss
+    packed = write(loom.abs_file_path, ss.search_space_dict)
+    array_file.remove(get_journal_path(loom.abs_file_path))
+    return JournaledSearchSpace(loom.abs_file_path, packed)
 
 
-def write(loom, ss: SearchSpace) -> None:
-    ss.loom = None  # Remove loom connection to enable pickling
-    ss.dfh = None
-    cur_ss = deepcopy(ss)
-    with open(loom.ss_pickle_name, "wb") as fh:
-        logger.debug(f"Writing SS for {loom.file_path} to {loom.ss_pickle_name}")
-        pickle.dump(cur_ss, fh)
-
-
-def update(loom, update: str) -> SearchSpace:
-    ss = loom.ss
-    ss.loom = loom
-    ss.meta_data = loom.get_meta_data()
-    if update == "clusterings":
-        ss.add_clusterings()
-    elif update == "cluster_annotations":
-        ss.add_cluster_annotations()
-    write(loom, ss)
-    return ss
+def write(abs_file_path: Path, search_space_dict: SearchSpaceDict) -> PackedSearchSpace:
+    packed = PackedSearchSpace.pack(search_space_dict)
+    path = get_path(abs_file_path)
+    logger.debug(f"Writing SS for {abs_file_path} to {path}")
+    array_file.write(path, CURRENT_SS_VERISON, packed.to_arrays())
+    # Use the mapped file, so the search space is not kept in memory
+    arrays = array_file.read(path, CURRENT_SS_VERISON)
+    return packed if arrays is None else PackedSearchSpace.from_arrays(arrays)
+
+
+def update_clustering(loom, old_clustering: Optional[Mapping[str, Any]], new_clustering: Mapping[str, Any]) -> None:
+    """ Journal the changes of the search space made by adding (old_clustering is None) or editing a clustering. """
+    loom.ss.apply(get_clustering_changes(old_clustering, new_clustering))
+
+
+def remove(abs_file_path: Path) -> None:
+    array_file.remove(get_path(abs_file_path))
+    array_file.remove(get_journal_path(abs_file_path))
+    array_file.remove(abs_file_path.with_suffix(LEGACY_SS_SUFFIX))
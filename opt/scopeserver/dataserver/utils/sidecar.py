@@ -0,0 +1,63 @@
+"""
+Pickled sidecar files next to a loom, holding data SCope derived from the loom.
+
+A sidecar stores the modification time of the loom it was computed from and is ignored once the loom has
+changed. SCope itself only ever writes attributes that sidecars do not depend on, so after its own writes
+the sidecars that were valid before the write are re-stamped with the new modification time instead of being
+recomputed.
+"""
+
+from pathlib import Path
+from typing import Any, Optional
+import pickle
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def get_path(abs_file_path: Path, suffix: str) -> Path:
+    return abs_file_path.with_suffix(suffix)
+
+
+def _read(path: Path) -> Optional[dict]:
+    try:
+        with open(path, "rb") as fh:
+            return pickle.load(fh)
+    except (EOFError, FileNotFoundError, pickle.UnpicklingError):
+        return None
+
+
+def load(loom, suffix: str, version: int) -> Optional[Any]:
+    """ Load the data of a sidecar if it was computed by this version of SCope for the current loom. """
+    persisted = _read(get_path(loom.abs_file_path, suffix))
+    if persisted is None:
+        return None
+    if persisted["version"] != version or persisted["mtime"] != loom.get_mtime():
+        logger.debug(f"Sidecar {suffix} of {loom.file_path} is outdated.")
+        return None
+    return persisted["data"]
+
+
+def write(loom, suffix: str, version: int, data: Any) -> None:
+    path = get_path(loom.abs_file_path, suffix)
+    logger.debug(f"Writing sidecar for {loom.file_path} to {path}")
+    with open(path, "wb") as fh:
+        pickle.dump({"version": version, "mtime": loom.get_mtime(), "data": data}, fh)
+
+
+def restamp(loom, suffix: str, previous_mtime: int) -> None:
+    """
+    Mark a sidecar as valid for the current modification time of the loom after a write of SCope, if it was
+    computed from the loom as it was before the write. Outdated sidecars are left to be computed again.
+    """
+    persisted = _read(get_path(loom.abs_file_path, suffix))
+    if persisted is not None and persisted["mtime"] == previous_mtime:
+        write(loom, suffix, persisted["version"], persisted["data"])
+
+
+def remove(abs_file_path: Path, suffix: str) -> None:
+    try:
+        get_path(abs_file_path, suffix).unlink()
+    except FileNotFoundError:
+        pass
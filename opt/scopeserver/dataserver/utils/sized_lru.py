@@ -0,0 +1,92 @@
+"""
+A least recently used cache bounded by the total size of its values in bytes, shared by the process-wide caches
+of expression vectors and of colour replies.
+"""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+import threading
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SizedLRUCache(ABC, Generic[K, V]):
+    """ A thread-safe LRU cache evicting the least recently used values once their total size exceeds a budget. """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.n_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[K, Tuple[V, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            value = self._lookup(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def _lookup(self, key: K) -> Optional[V]:
+        """ Get a value and mark it as the most recently used one. The lock must be held. """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: K, value: V) -> V:
+        """ Store a value and return it. Values larger than the whole budget are not stored. """
+        size = self.size_of(value)
+        with self._lock:
+            if size > self.max_bytes:
+                return value
+            if key in self._entries:
+                self.n_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self.n_bytes += size
+            self._evict()
+        return value
+
+    @abstractmethod
+    def size_of(self, value: V) -> int:
+        """ Get the size of a value in bytes. """
+
+    def discard(self, outdated: Callable[[K], bool]) -> None:
+        """ Remove the values whose key is outdated, without waiting for them to be evicted. """
+        with self._lock:
+            for key in [key for key in self._entries if outdated(key)]:
+                self.n_bytes -= self._entries.pop(key)[1]
+
+    def _evict(self) -> None:
+        while self.n_bytes > self.max_bytes:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.n_bytes -= size
+            self.evictions += 1
+
+    def set_max_bytes(self, max_bytes: int) -> None:
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.n_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.n_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,63 @@
+"""
+Tables of strings stored as a single UTF-8 buffer and the offset of every string in it.
+
+A table holds no Python object per string: strings are decoded when they are accessed. The byte order of
+UTF-8 is the code point order of Python strings, so sorted tables are binary searched on the raw bytes.
+"""
+
+from typing import Dict, Iterable, Iterator, Optional
+
+import numpy as np
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class StringTable:
+    def __init__(self, data: np.ndarray, offsets: np.ndarray):
+        self.data = data
+        self.offsets = offsets
+
+    @classmethod
+    def from_strings(cls, strings: Iterable[str]) -> "StringTable":
+        encoded = [string.encode("utf-8") for string in strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(string) for string in encoded], out=offsets[1:])
+        return cls(np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def get_bytes(self, i: int) -> bytes:
+        return self.data[self.offsets[i] : self.offsets[i + 1]].tobytes()
+
+    def __getitem__(self, i: int) -> str:
+        return self.get_bytes(i).decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        return (self[i] for i in range(len(self)))
+
+    def bisect(self, value: bytes, order: Optional[np.ndarray] = None, right: bool = False) -> int:
+        """
+        Find where an encoded string would be inserted in the table, sorted directly or in the given order.
+
+        Returns:
+            int: The first position whose string is not lower (or, if right, not lower or equal) than value.
+        """
+        low, high = 0, len(self) if order is None else len(order)
+        while low < high:
+            middle = (low + high) // 2
+            current = self.get_bytes(middle if order is None else order[middle])
+            if current < value or (right and current == value):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def to_arrays(self, prefix: str) -> Dict[str, np.ndarray]:
+        return {f"{prefix}_data": self.data, f"{prefix}_offsets": self.offsets}
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray], prefix: str) -> "StringTable":
+        return cls(arrays[f"{prefix}_data"], arrays[f"{prefix}_offsets"])
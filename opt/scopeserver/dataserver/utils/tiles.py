@@ -0,0 +1,105 @@
+"""
+Rendering of coloured embeddings into fixed-size PNG tiles.
+
+At zoom level z the square around the embedding is split in 2^z x 2^z tiles, tile (0, 0) being the top left
+one. The colours of the cells falling in the same pixel are aggregated (mean or max per channel) with NumPy,
+and pixels without any cell are transparent, so the browser only has to download a few images instead of
+the coordinates and colours of every cell.
+"""
+
+from typing import NamedTuple
+import struct
+import zlib
+
+import numpy as np
+
+from scopeserver.dataserver.utils import constant
+from scopeserver.dataserver.utils.lod import LodIndex, Viewport
+import logging
+
+logger = logging.getLogger(__name__)
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+class Tile(NamedTuple):
+    zoom: int
+    x: int
+    y: int
+    size: int
+
+
+def get_tile_viewport(lod_index: LodIndex, tile: Tile) -> Viewport:
+    """ Get the part of the embedding covered by a tile. """
+    bounds = lod_index.bounds
+    side = max(bounds.x_max - bounds.x_min, bounds.y_max - bounds.y_min)
+    tile_side = (side if side > 0 else 1.0) / 2 ** tile.zoom
+    x_min = bounds.x_min + tile.x * tile_side
+    y_max = bounds.y_max - tile.y * tile_side
+    return Viewport(x_min, x_min + tile_side, y_max - tile_side, y_max)
+
+
+def rasterise(lod_index: LodIndex, rgb: np.ndarray, tile: Tile, aggregation: str = "mean") -> np.ndarray:
+    """
+    Aggregate the colours of the cells inside a tile into pixels.
+
+    Args:
+        rgb (np.ndarray): The (n_cells, 3) uint8 colour of every cell of the embedding, black for no colour.
+        aggregation (str): "mean" or "max" of every colour channel of the cells in a pixel.
+
+    Returns:
+        np.ndarray: A (size, size, 4) uint8 RGBA image.
+    """
+    image = np.zeros((tile.size, tile.size, 4), dtype=np.uint8)
+    if tile.zoom < 0 or not (0 <= tile.x < 2 ** tile.zoom and 0 <= tile.y < 2 ** tile.zoom):
+        return image
+
+    viewport = get_tile_viewport(lod_index, tile)
+    cells = lod_index.get_cells_in(viewport)
+    if len(cells) == 0:
+        return image
+
+    pixel_side = (viewport.x_max - viewport.x_min) / tile.size
+    columns = np.clip(((lod_index.x[cells] - viewport.x_min) / pixel_side).astype(np.int64), 0, tile.size - 1)
+    rows = np.clip(((viewport.y_max - lod_index.y[cells]) / pixel_side).astype(np.int64), 0, tile.size - 1)
+    pixels = rows * tile.size + columns
+    colours = rgb[cells]
+    # Cells without a colour (black) are shown in the grey of cells without expression, as in the viewer
+    colours[~colours.any(axis=1)] = constant.NO_EXPR_RGB
+
+    flat = image.reshape(-1, 4)
+    if aggregation == "max":
+        order = np.argsort(pixels, kind="stable")
+        pixels, colours = pixels[order], colours[order]
+        starts = np.flatnonzero(np.concatenate([[True], pixels[1:] != pixels[:-1]]))
+        flat[pixels[starts], :3] = np.maximum.reduceat(colours, starts, axis=0)
+        flat[pixels[starts], 3] = 255
+    else:
+        counts = np.bincount(pixels, minlength=tile.size ** 2)
+        filled = counts > 0
+        for channel in range(3):
+            sums = np.bincount(pixels, weights=colours[:, channel], minlength=tile.size ** 2)
+            flat[filled, channel] = np.round(sums[filled] / counts[filled])
+        flat[filled, 3] = 255
+    return image
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", zlib.crc32(chunk_type + data))
+
+
+def encode_png(image: np.ndarray) -> bytes:
+    """ Encode a (height, width, 4) uint8 RGBA image as PNG. """
+    height, width, _ = image.shape
+    # Every scanline starts with its filter type, 0 (none)
+    scanlines = np.concatenate([np.zeros((height, 1), dtype=np.uint8), image.reshape(height, -1)], axis=1)
+    return (
+        PNG_SIGNATURE
+        + _png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0))
+        + _png_chunk(b"IDAT", zlib.compress(scanlines.tobytes(), constant.COLOR_COMPRESSION_LEVEL))
+        + _png_chunk(b"IEND", b"")
+    )
+
+
+def render_tile(lod_index: LodIndex, rgb: np.ndarray, tile: Tile, aggregation: str = "mean") -> bytes:
+    return encode_png(rasterise(lod_index, rgb, tile, aggregation=aggregation))
@@ -0,0 +1,152 @@
+"""
+Precomputed 99th and 100th percentiles of every feature of a loom.
+
+The percentiles are used as default colour scale maximum (vmax) whenever a feature is shown. They are
+computed for every gene (under each log/CPM combination), regulon and metric by a background pass over
+the loom and pickled in a sidecar next to it, so requests for unfiltered features only need a lookup.
+"""
+
+from concurrent import futures
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple
+import time
+
+import numpy as np
+
+from scopeserver.dataserver.utils import constant
+from scopeserver.dataserver.utils import data
+from scopeserver.dataserver.utils import sidecar
+from scopeserver.dataserver.utils.background import BackgroundJobs
+import logging
+
+logger = logging.getLogger(__name__)
+
+VMAX_SUFFIX = ".vmax_pkl"
+CURRENT_VMAX_VERSION = 1
+
+_JOBS = BackgroundJobs("vmax")
+
+
+class VmaxTable(NamedTuple):
+    """
+    Percentiles of all features of a loom.
+
+    genes is indexed by [gene row, log_transform, cpm_normalise] and holds (99th, 100th) percentile pairs.
+    """
+
+    genes: np.ndarray
+    regulons: Dict[str, Tuple[float, float]]
+    metrics: Dict[Tuple[str, bool, bool], Tuple[float, float]]
+
+    def lookup(
+        self, loom, feature_type: str, feature: str, log_transform: bool, cpm_normalise: bool
+    ) -> Optional[Tuple[float, float]]:
+        if feature_type == "gene":
+            gene_row = loom.get_gene_row(feature)
+            if gene_row is None:
+                return None
+            v_max, max_v_max = self.genes[gene_row, int(log_transform), int(cpm_normalise)]
+            return v_max, max_v_max
+        if feature_type == "regulon":
+            return self.regulons.get(feature)
+        if feature_type == "metric":
+            return self.metrics.get((feature, log_transform, cpm_normalise))
+        return None
+
+
+def build_genes(loom, block_size: int = constant.VMAX_BLOCK_SIZE) -> np.ndarray:
+    with loom.connection_lock:
+        n_genes, n_cells = loom.loom_connection.shape
+    genes = np.zeros((n_genes, 2, 2, 2))
+    batch_size = max(1, block_size // max(n_cells, 1))
+    # nUMI may still be computed by its own background job, wait for it before taking the connection lock
+    loom.get_nUMI()
+    for start in range(0, n_genes, batch_size):
+        end = min(start + batch_size, n_genes)
+        with loom.connection_lock:
+            block = loom.loom_connection[start:end, :]
+        for log_transform in (False, True):
+            for cpm_normalise in (False, True):
+                # CPM normalisation reads nUMI from the loom when the loom stores it
+                with loom.connection_lock:
+                    # Expression vectors are served as float32 from the expression cache
+                    transformed = loom.transform_expression(block, log_transform, cpm_normalise).astype(np.float32)
+                v_max, max_v_max = data.get_99_and_100_percentiles_by_row(transformed)
+                genes[start:end, int(log_transform), int(cpm_normalise), 0] = v_max
+                genes[start:end, int(log_transform), int(cpm_normalise), 1] = max_v_max
+    return genes
+
+
+def build_regulons(loom, block_size: int = constant.VMAX_BLOCK_SIZE) -> Dict[str, Tuple[float, float]]:
+    regulons: Dict[str, Tuple[float, float]] = {}
+    fields_by_attribute: Dict[str, Dict[str, str]] = {}
+    with loom.connection_lock:
+        batch_size = max(1, block_size // max(loom.get_nb_cells(), 1))
+        for regulon, regulon_field in loom.get_regulon_registry().items():
+            fields_by_attribute.setdefault(regulon_field.attribute, {})[regulon_field.field] = regulon
+
+    for attribute, regulon_by_field in fields_by_attribute.items():
+        fields = list(regulon_by_field.keys())
+        for start in range(0, len(fields), batch_size):
+            batch = fields[start : start + batch_size]
+            # Reading several fields of the compound dataset at once only loads those fields
+            with loom.connection_lock:
+                block = loom.loom_connection._file["col_attrs"][attribute][tuple(batch)]
+            v_max, max_v_max = data.get_99_and_100_percentiles_by_row(
+                np.stack([block] if len(batch) == 1 else [block[field] for field in batch])
+            )
+            for n, field in enumerate(batch):
+                regulons[regulon_by_field[field]] = (v_max[n], max_v_max[n])
+    return regulons
+
+
+def build_metrics(loom) -> Dict[Tuple[str, bool, bool], Tuple[float, float]]:
+    metrics: Dict[Tuple[str, bool, bool], Tuple[float, float]] = {}
+    with loom.connection_lock:
+        if not loom.has_md_metrics():
+            return metrics
+        names = [m["name"] for m in loom.get_meta_data_by_key(key="metrics") if loom.has_ca_attr(name=m["name"])]
+    if len(names) > 0:
+        # nUMI may still be computed by its own background job, wait for it before taking the connection lock
+        loom.get_nUMI()
+    for name in names:
+        for log_transform in (False, True):
+            for cpm_normalise in (False, True):
+                with loom.connection_lock:
+                    vals, _ = loom.get_metric(name, log_transform=log_transform, cpm_normalise=cpm_normalise)
+                metrics[(name, log_transform, cpm_normalise)] = data.get_99_and_100_percentiles(vals)
+    return metrics
+
+
+def build(loom) -> VmaxTable:
+    build_start_time = time.time()
+    table = VmaxTable(genes=build_genes(loom), regulons=build_regulons(loom), metrics=build_metrics(loom))
+    logger.debug(
+        "{0:.5f} seconds elapsed (building vmax table for {1}) ---".format(
+            time.time() - build_start_time, loom.file_path
+        )
+    )
+    return table
+
+
+def load(loom) -> Optional[VmaxTable]:
+    return sidecar.load(loom, VMAX_SUFFIX, CURRENT_VMAX_VERSION)
+
+
+def build_in_background(loom) -> futures.Future:
+    """ Queue the build of the vmax table of a loom and attach it to the loom once it is ready. """
+
+    def build_and_attach() -> None:
+        try:
+            table = build(loom)
+            sidecar.write(loom, VMAX_SUFFIX, CURRENT_VMAX_VERSION, table)
+        except Exception as err:
+            logger.error(f"Could not build vmax table for {loom.file_path}: {err}")
+            return
+        loom.vmax_table = table
+
+    return _JOBS.submit(loom.abs_file_path, build_and_attach)
+
+
+def remove(abs_file_path: Path) -> None:
+    sidecar.remove(abs_file_path, VMAX_SUFFIX)
@@ -3,8 +3,32 @@ from hypothesis import given
 from hypothesis.strategies import integers
 from hypothesis.extra.numpy import arrays
 
-from scopeserver.dataserver.utils.constant import LOWER_LIMIT_RGB, UPPER_LIMIT_RGB
+from scopeserver.dataserver.modules.gserver import s_pb2
+from scopeserver.dataserver.utils.annotation import Annotation
+from scopeserver.dataserver.utils.constant import BIG_COLOR_LIST, LOWER_LIMIT_RGB, UPPER_LIMIT_RGB
+from scopeserver.dataserver.utils.loom import Loom
+from scopeserver.dataserver.utils.loom_file_handler import LoomFileHandler
+from scopeserver.gen_test_loom import generate_test_loom_data
+import loompy as lp
 import numpy as np
+import pytest
+import os
+import zlib
+
+from pathlib import Path
+
+LOOM_FILE_HANDLER = LoomFileHandler()
+
+LOOM_PATH = Path("test/data/SCope_Test.loom")
+
+
+@pytest.fixture
+def loom_file():
+    if os.path.isfile("test/data/SCope_Test.loom"):
+        os.remove("test/data/SCope_Test.loom")
+    if os.path.isfile("test/data/SCope_Test.ss"):
+        os.remove("test/data/SCope_Test.ss")
+    return generate_test_loom_data()
 
 
 def test_normalise_vals():
@@ -30,3 +54,122 @@ def test_normalise_vals2(vals, v_min, v_max):
     normalised = CellColorByFeatures.normalise_vals(vals, v_max, v_min)
     assert np.amin(normalised) >= LOWER_LIMIT_RGB
     assert np.amax(normalised) <= UPPER_LIMIT_RGB
+
+
+@given(arrays(np.uint8, shape=(3, 20), elements=integers(0, 2)))
+def test_rgb_to_hex_bytes(rgb):
+    expected = "".join(
+        "XXXXXX" if r == g == b == 0 else "{0:02x}{1:02x}{2:02x}".format(r, g, b) for r, g, b in zip(*rgb * 100)
+    )
+    assert CellColorByFeatures.rgb_to_hex_bytes(rgb * 100) == expected.encode("ascii")
+
+
+@given(arrays(np.uint8, shape=(3, 20), elements=integers(0, 2)))
+def test_palette_round_trip(rgb):
+    hex_vec = np.frombuffer(CellColorByFeatures.rgb_to_hex_bytes(rgb * 100), dtype="S6").astype(str)
+    palette, codes = CellColorByFeatures.hex_to_palette(hex_vec)
+    assert len(palette) == len(set(hex_vec))
+    np.testing.assert_equal(np.array(palette)[codes], hex_vec)
+    np.testing.assert_equal(CellColorByFeatures.palette_to_rgb(palette)[codes], (rgb * 100).T)
+
+
+def test_annotation_colours(loom_file):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
+        values = test_loom.get_meta_data_annotation_by_name(name="Half cells")["values"]
+        expected = [BIG_COLOR_LIST[values.index(value)] for value in col_attrs["Half cells"]]
+
+        ccbf = CellColorByFeatures(test_loom)
+        ccbf.setAnnotationFeature("Half cells")
+        assert list(ccbf.getReply().color) == expected
+
+        ccbf = CellColorByFeatures(test_loom)
+        ccbf.setAnnotationFeature("Half cells", annotations=[Annotation(name="Clustering_0", values=["1"])])
+        assert list(ccbf.getReply().color) == expected[25:50]
+
+
+def test_all_clusters_colours(loom_file):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
+        expected = [BIG_COLOR_LIST[n % 4] for n in range(test_loom.get_nb_cells())]
+        request = s_pb2.CellColorByFeaturesRequest(
+            feature=["All Clusters"], featureType=["Clustering: Cluster set 1"], colorEncoding=s_pb2.PALETTE
+        )
+
+        ccbf = CellColorByFeatures(test_loom)
+        ccbf.setClusteringFeature(request, "All Clusters", 0)
+        assert list(ccbf.getReply().color) == expected
+
+        reply = ccbf.getReply(encoding=request.colorEncoding)
+        assert reply.colorEncoding == s_pb2.PALETTE
+        assert len(reply.color) == 0
+        codes = np.frombuffer(zlib.decompress(reply.compressedColor), dtype=np.uint8)
+        assert list(np.array(reply.palette)[codes]) == expected
+        assert sorted(reply.legend.colors) == sorted(BIG_COLOR_LIST[:4])
+
+
+def test_selected_cells_colours(loom_file):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
+        selected = np.array([3, 10, 42, 99])
+        request = s_pb2.CellColorByFeaturesRequest(
+            feature=["Gene_1"], featureType=["gene"], vmax=[0, 0, 0], vmin=[0, 0, 0], threshold=[0, 0, 0]
+        )
+
+        ccbf = CellColorByFeatures(test_loom)
+        ccbf.setGeneFeature(request, "Gene_1", 0)
+        all_rgb = ccbf.get_rgb()
+
+        ccbf = CellColorByFeatures(test_loom, cell_indices=selected)
+        ccbf.setGeneFeature(request, "Gene_1", 0)
+        np.testing.assert_equal(ccbf.get_rgb(), all_rgb[:, selected])
+        assert ccbf.get_cell_indices() == selected.tolist()
+
+        ccbf = CellColorByFeatures(test_loom, cell_indices=selected)
+        ccbf.setAnnotationFeature("Half cells")
+        assert len(ccbf.getReply().color) == len(selected)
+
+
+def test_stream_replies(loom_file):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
+        request = s_pb2.CellColorByFeaturesRequest(
+            feature=["Gene_1"], featureType=["gene"], vmax=[0, 0, 0], vmin=[0, 0, 0], threshold=[0, 0, 0]
+        )
+        ccbf = CellColorByFeatures(test_loom)
+        ccbf.setGeneFeature(request, "Gene_1", 0)
+        for encoding in (s_pb2.HEX, s_pb2.RGB):
+            reply = ccbf.getReply(encoding=encoding)
+            chunks = list(ccbf.get_replies(encoding=encoding, chunk_size=30))
+            assert len(chunks) == -(-test_loom.get_nb_cells() // 30)
+            assert list(chunks[0].vmax) == list(reply.vmax)
+            assert chunks[0].colorEncoding == encoding
+            assert not chunks[1].hasAddCompressionLayer
+            # Every chunk is compressed on its own
+            colours = b"".join(zlib.decompress(chunk.compressedColor) for chunk in chunks)
+            assert colours == zlib.decompress(reply.compressedColor)
+            assert [i for chunk in chunks for i in chunk.cellIndices] == list(reply.cellIndices)
+
+        request = s_pb2.CellColorByFeaturesRequest(
+            feature=["All Clusters"], featureType=["Clustering: Cluster set 1"], colorEncoding=s_pb2.PALETTE
+        )
+        ccbf = CellColorByFeatures(test_loom)
+        ccbf.setClusteringFeature(request, "All Clusters", 0)
+        reply = ccbf.getReply(encoding=s_pb2.PALETTE)
+        chunks = list(ccbf.get_replies(encoding=s_pb2.PALETTE, chunk_size=30))
+        assert chunks[0].legend == reply.legend
+        assert list(chunks[0].palette) == list(reply.palette)
+        assert not chunks[1].HasField("legend")
+        assert len(chunks[1].palette) == 0
+        codes = b"".join(zlib.decompress(chunk.compressedColor) for chunk in chunks)
+        assert codes == zlib.decompress(reply.compressedColor)
+        hex_chunks = list(ccbf.get_replies(encoding=s_pb2.HEX, chunk_size=30))
+        assert [colour for chunk in hex_chunks for colour in chunk.color] == list(ccbf.getReply().color)
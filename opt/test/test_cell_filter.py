@@ -0,0 +1,62 @@
+import loompy as lp
+import numpy as np
+import pytest
+import os
+
+from pathlib import Path
+
+from scopeserver.dataserver.utils.loom import Loom
+from scopeserver.dataserver.utils.loom_file_handler import LoomFileHandler
+from scopeserver.dataserver.utils.annotation import Annotation
+from scopeserver.gen_test_loom import generate_test_loom_data
+
+LOOM_FILE_HANDLER = LoomFileHandler()
+
+LOOM_PATH = Path("test/data/SCope_Test.loom")
+
+
+@pytest.fixture
+def loom_file():
+    if os.path.isfile("test/data/SCope_Test.loom"):
+        os.remove("test/data/SCope_Test.loom")
+    if os.path.isfile("test/data/SCope_Test.ss"):
+        os.remove("test/data/SCope_Test.ss")
+    return generate_test_loom_data()
+
+
+def test_get_anno_cells(loom_file):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
+        half_cells = np.array(col_attrs["Half cells"])
+        clustering = ds.ca.Clusterings["0"]
+
+        first_half = test_loom.get_anno_cells([Annotation(name="Half cells", values=["First half"])])
+        np.testing.assert_equal(first_half, np.flatnonzero(half_cells == "First half"))
+
+        both_halves = test_loom.get_anno_cells([Annotation(name="Half cells", values=["First half", "Second half"])])
+        np.testing.assert_equal(both_halves, np.arange(100))
+
+        first_half_cluster = test_loom.get_anno_cells(
+            [Annotation(name="Half cells", values=["First half"]), Annotation(name="Clustering_0", values=["1"])],
+            logic="AND",
+        )
+        np.testing.assert_equal(first_half_cluster, np.flatnonzero((half_cells == "First half") & (clustering == 1)))
+
+        assert len(test_loom.get_anno_cells([Annotation(name="Half cells", values=["No half"])])) == 0
+
+
+def test_mask_cache(loom_file):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
+        test_loom.cell_filter.max_masks = 2
+        mask = test_loom.cell_filter.get_mask("Half cells", "First half")
+        assert not mask.flags.writeable
+        assert test_loom.cell_filter.get_mask("Half cells", "First half") is mask
+
+        test_loom.cell_filter.get_mask("Half cells", "Second half")
+        test_loom.cell_filter.get_mask("Clustering_0", 1)
+        assert test_loom.cell_filter.get_mask("Half cells", "First half") is not mask
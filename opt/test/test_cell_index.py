@@ -0,0 +1,22 @@
+import numpy as np
+
+from scopeserver.dataserver.utils.cell_index import CellIndex, CellTranslation
+
+
+def test_lookup():
+    index = CellIndex(np.array(["c", "a", "b", "a"], dtype=object))
+    np.testing.assert_equal(index.lookup(["a", "b", "c", "d", "0"]), [1, 2, 0, -1, -1])
+    assert len(index.lookup([])) == 0
+    np.testing.assert_equal(CellIndex(np.array([], dtype=str)).lookup(["a"]), [-1])
+
+
+def test_translate():
+    src_ids = np.array(["a", "b", "c", "a"])
+    dest_ids = np.array(["c", "x", "a", "b", "a"])
+    src_index = CellIndex(src_ids)
+    translation = CellTranslation(src_first=src_index.lookup(src_ids), dest_to_src=src_index.lookup(dest_ids))
+
+    np.testing.assert_equal(translation.translate([0]), [2, 4])
+    np.testing.assert_equal(translation.translate([3]), [2, 4])
+    np.testing.assert_equal(translation.translate([1, 2]), [0, 3])
+    assert len(translation.translate([])) == 0
@@ -0,0 +1,65 @@
+import loompy as lp
+import numpy as np
+import pytest
+import os
+
+from pathlib import Path
+
+from scopeserver.dataserver.utils.loom import Loom
+from scopeserver.dataserver.utils.loom_file_handler import LoomFileHandler
+from scopeserver.dataserver.utils.cluster_index import ClusterIndex
+from scopeserver.gen_test_loom import generate_test_loom_data
+
+LOOM_FILE_HANDLER = LoomFileHandler()
+
+LOOM_PATH = Path("test/data/SCope_Test.loom")
+
+
+@pytest.fixture
+def loom_file():
+    if os.path.isfile("test/data/SCope_Test.loom"):
+        os.remove("test/data/SCope_Test.loom")
+    if os.path.isfile("test/data/SCope_Test.ss"):
+        os.remove("test/data/SCope_Test.ss")
+    return generate_test_loom_data()
+
+
+def test_cluster_index():
+    clustering = np.array([2, -1, 0, 2, 0, 2])
+    index = ClusterIndex(clustering)
+    np.testing.assert_equal(index.cluster_ids, [-1, 0, 2])
+    np.testing.assert_equal(index.sizes, [1, 2, 3])
+    np.testing.assert_equal(index.get_cells(2), [0, 3, 5])
+    np.testing.assert_equal(index.get_cells(-1), [1])
+    assert len(index.get_cells(1)) == 0
+    assert index.get_size(0) == 2
+    assert index.get_size(7) == 0
+    np.testing.assert_equal(index.get_mask(0), clustering == 0)
+    np.testing.assert_equal(index.count([0, 2, 3]), [0, 1, 2])
+    assert index.value_codes == {"-1": 0, "0": 1, "2": 2}
+
+
+def test_cluster_lookups(loom_file):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
+        assert set(test_loom.cluster_indices) == {0, 1}
+
+        coords = test_loom.get_coordinates(-1, cluster_info=(1, 2))
+        np.testing.assert_equal(coords["cellIndices"], np.arange(2, 100, 4))
+
+        overlaps = test_loom.get_cluster_overlaps([0, 1, 2, 30])
+        assert overlaps[0] == {
+            "clustering_name": "Cluster set 0",
+            "cluster_name": "Unannotated Cluster 1",
+            "n_cells": 3,
+            "cells_in_cluster": 75.0,
+            "cluster_in_cells": 12.0,
+        }
+        assert [(o["cluster_name"], o["n_cells"]) for o in overlaps[1:]] == [
+            ("Unannotated Cluster 2", 1),
+            ("Unannotated Cluster 1", 1),
+            ("Unannotated Cluster 2", 1),
+            ("Unannotated Cluster 3", 2),
+        ]
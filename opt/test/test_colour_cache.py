@@ -0,0 +1,108 @@
+import threading
+
+from pathlib import Path
+from types import SimpleNamespace
+
+from scopeserver.dataserver.modules.gserver import s_pb2
+from scopeserver.dataserver.utils import colour_cache
+from scopeserver.dataserver.utils.colour_cache import ColourCache, ColourCacheKey, fingerprint
+
+
+def key(n: int) -> ColourCacheKey:
+    return ColourCacheKey(Path("test.loom"), 0, 0, bytes([n]))
+
+
+def reply(size: int) -> s_pb2.CellColorByFeaturesReply:
+    return s_pb2.CellColorByFeaturesReply(compressedColor=bytes(size))
+
+
+def test_fingerprint():
+    request = s_pb2.CellColorByFeaturesRequest(
+        loomFilePath="a.loom", feature=["Gene_1", "", ""], featureType=["gene", "gene", "gene"]
+    )
+    same = s_pb2.CellColorByFeaturesRequest(
+        loomFilePath="b.loom", feature=["Gene_1", "", ""], featureType=["gene", "gene", "gene"]
+    )
+    other = s_pb2.CellColorByFeaturesRequest(
+        loomFilePath="a.loom", feature=["Gene_1", "", ""], featureType=["gene", "gene", "gene"], hasLogTransform=True
+    )
+    assert fingerprint(request) == fingerprint(same)
+    assert fingerprint(request) != fingerprint(other)
+    assert request.loomFilePath == "a.loom"
+
+
+def test_put_and_get():
+    cache = ColourCache(max_bytes=1024)
+    assert cache.get(key(0)) is None
+    cached = reply(10)
+    cache.put(key(0), cached)
+    assert cache.get(key(0)) is cached
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["bytes"] == cached.ByteSize()
+
+
+def test_lru_eviction():
+    cache = ColourCache(max_bytes=2 * reply(100).ByteSize())
+    cache.put(key(0), reply(100))
+    cache.put(key(1), reply(100))
+    cache.get(key(0))
+    cache.put(key(2), reply(100))
+    assert cache.get(key(1)) is None
+    assert cache.get(key(0)) is not None
+    assert cache.get(key(2)) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_errors_are_not_cached():
+    cache = ColourCache(max_bytes=1024)
+    error = s_pb2.CellColorByFeaturesReply(error=s_pb2.ErrorReply(type="Value Error", message="No such cluster"))
+    assert cache.get_or_compute(key(0), lambda: error) is error
+    assert cache.get(key(0)) is None
+
+
+def test_single_flight():
+    cache = ColourCache(max_bytes=1024)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(None)
+        started.set()
+        release.wait()
+        return reply(10)
+
+    results = []
+    owner = threading.Thread(target=lambda: results.append(cache.get_or_compute(key(0), compute)))
+    owner.start()
+    started.wait()
+    waiters = [threading.Thread(target=lambda: results.append(cache.get_or_compute(key(0), compute))) for _ in range(4)]
+    for waiter in waiters:
+        waiter.start()
+    while cache.stats()["coalesced"] < len(waiters):
+        pass
+    release.set()
+    for thread in [owner, *waiters]:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 5
+    assert all(result is results[0] for result in results)
+    assert cache.get_or_compute(key(0), compute) is results[0]
+    assert len(calls) == 1
+
+
+def test_discard_outdated(monkeypatch):
+    cache = ColourCache(max_bytes=1024)
+    monkeypatch.setattr(colour_cache, "COLOUR_CACHE", cache)
+    for meta_data_version in (0, 1):
+        cache.put(ColourCacheKey(Path("test.loom"), 0, meta_data_version, bytes([0])), reply(10))
+    cache.put(ColourCacheKey(Path("other.loom"), 0, 0, bytes([0])), reply(10))
+
+    # Replies of the previous metadata of the loom are dropped, the ones of other looms are kept
+    colour_cache.discard_outdated(SimpleNamespace(abs_file_path=Path("test.loom"), meta_data_version=1))
+    assert cache.get(ColourCacheKey(Path("test.loom"), 0, 0, bytes([0]))) is None
+    assert cache.get(ColourCacheKey(Path("test.loom"), 0, 1, bytes([0]))) is not None
+    assert cache.get(ColourCacheKey(Path("other.loom"), 0, 0, bytes([0]))) is not None
+    assert cache.stats()["bytes"] == 2 * reply(10).ByteSize()
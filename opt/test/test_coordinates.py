@@ -0,0 +1,100 @@
+import loompy as lp
+import numpy as np
+import pytest
+import os
+
+from pathlib import Path
+
+from scopeserver.dataserver.modules.gserver import s_pb2
+from scopeserver.dataserver.utils.loom import Loom
+from scopeserver.dataserver.utils.loom_file_handler import LoomFileHandler
+from scopeserver.dataserver.utils.coordinates import dequantise, pack
+from scopeserver.gen_test_loom import generate_test_loom_data
+
+LOOM_FILE_HANDLER = LoomFileHandler()
+
+LOOM_PATH = Path("test/data/SCope_Test.loom")
+
+
+@pytest.fixture
+def loom_file():
+    if os.path.isfile("test/data/SCope_Test.loom"):
+        os.remove("test/data/SCope_Test.loom")
+    if os.path.isfile("test/data/SCope_Test.ss"):
+        os.remove("test/data/SCope_Test.ss")
+    return generate_test_loom_data()
+
+
+def test_pack_float32():
+    x = np.array([0.5, -1.25, 3.0])
+    y = np.array([2.0, 0.0, -4.5])
+    packed = pack(x, y, s_pb2.FLOAT32)
+    assert packed.encoding == s_pb2.FLOAT32
+    np.testing.assert_equal(np.frombuffer(packed.x, dtype="<f4"), x)
+    np.testing.assert_equal(np.frombuffer(packed.y, dtype="<f4"), y)
+    assert (packed.x_min, packed.x_max, packed.y_min, packed.y_max) == (-1.25, 3.0, -4.5, 2.0)
+
+
+def test_pack_uint16():
+    x = np.linspace(-10, 10, 1000)
+    y = np.full(1000, 3.0)
+    packed = pack(x, y, s_pb2.UINT16)
+    assert packed.encoding == s_pb2.UINT16
+    assert len(packed.x) == 2 * len(x)
+    unpacked_x = dequantise(np.frombuffer(packed.x, dtype="<u2"), packed.x_min, packed.x_max)
+    np.testing.assert_allclose(unpacked_x, x, atol=20 / 65535)
+    np.testing.assert_equal(dequantise(np.frombuffer(packed.y, dtype="<u2"), packed.y_min, packed.y_max), y)
+
+
+def test_pack_empty():
+    packed = pack([], [], s_pb2.UINT16)
+    assert packed.x == b""
+    assert (packed.x_min, packed.x_max) == (0.0, 0.0)
+
+
+def test_get_packed_coordinates(loom_file):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
+        coords = test_loom.get_coordinates(-1)
+        packed = test_loom.get_packed_coordinates(-1, s_pb2.FLOAT32)
+        assert test_loom.get_packed_coordinates(-1, s_pb2.FLOAT32) is packed
+        np.testing.assert_equal(np.frombuffer(packed.x, dtype="<f4"), coords["x"].astype(np.float32))
+        np.testing.assert_equal(np.frombuffer(packed.y, dtype="<f4"), coords["y"].astype(np.float32))
+
+
+def test_packed_cells():
+    x = np.arange(10.0)
+    for encoding in (s_pb2.FLOAT32, s_pb2.UINT16):
+        packed = pack(x, -x, encoding)
+        parts = [packed.get_cells(start, min(start + 4, 10)) for start in range(0, 10, 4)]
+        assert b"".join(part.x for part in parts) == packed.x
+        assert b"".join(part.y for part in parts) == packed.y
+        assert all(part.x_max == 9.0 and part.y_min == -9.0 for part in parts)
+
+
+def test_packed_coordinates_after_embedding_write(loom_file, tmp_path):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(
+        filename=str(tmp_path / "test.loom"), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs
+    )
+    loom_file_handler = LoomFileHandler()
+    loom_file_handler.loom_dir = tmp_path
+    test_loom = loom_file_handler.get_loom(Path("test.loom"))
+    packed = test_loom.get_packed_coordinates(-1, s_pb2.FLOAT32)
+    lod_index = test_loom.get_lod_index(-1)
+
+    # Rewrite the default embedding together with the metadata, as generate_meta_data does
+    embedding = test_loom.get_connection().ca["Embedding"].copy()
+    embedding["_X"] = embedding["_X"] * 2
+    connection = loom_file_handler.change_loom_mode(Path("test.loom"), mode="r+")
+    connection.ca["Embedding"] = embedding
+    test_loom.update_metadata(test_loom.get_meta_data())
+
+    assert test_loom.get_packed_coordinates(-1, s_pb2.FLOAT32) is not packed
+    x = np.frombuffer(test_loom.get_packed_coordinates(-1, s_pb2.FLOAT32).x, dtype="<f4")
+    np.testing.assert_equal(x, embedding["_X"].astype(np.float32))
+    np.testing.assert_equal(test_loom.get_lod_index(-1).x, embedding["_X"])
+    assert test_loom.get_lod_index(-1) is not lod_index
+    test_loom.get_connection().close()
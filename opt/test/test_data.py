@@ -18,3 +18,17 @@ def test_uniq(values):
     unique_values = data.uniq(values)
     assert set(values) == set(unique_values)
     assert len(set(values)) == len(unique_values)
+
+
+@given(arrays(np.float, shape=(3, 50), elements=floats(-1000, 1000)))
+def test_vmax_by_row(values):
+    v_max, max_v_max = data.get_99_and_100_percentiles_by_row(values)
+    for row in range(values.shape[0]):
+        assert (v_max[row], max_v_max[row]) == data.get_99_and_100_percentiles(values[row])
+
+
+def test_get_chunks():
+    assert list(data.get_chunks(10, 4)) == [(0, 4), (4, 8), (8, 10)]
+    assert list(data.get_chunks(8, 4)) == [(0, 4), (4, 8)]
+    assert list(data.get_chunks(10, 0)) == [(0, 10)]
+    assert list(data.get_chunks(0, 4)) == [(0, 0)]
@@ -0,0 +1,70 @@
+import loompy as lp
+import numpy as np
+
+from pathlib import Path
+
+from scopeserver.dataserver.utils import data
+from scopeserver.dataserver.utils import expression_cache as ec
+from scopeserver.dataserver.utils.expression_cache import ExpressionCache, ExpressionCacheKey
+from scopeserver.dataserver.utils.loom_file_handler import LoomFileHandler
+from scopeserver.gen_test_loom import generate_test_loom_data
+
+
+def key(gene_row: int) -> ExpressionCacheKey:
+    return ExpressionCacheKey(Path("test.loom"), 0, gene_row, True, False)
+
+
+def test_put_and_get():
+    cache = ExpressionCache(max_bytes=1024)
+    assert cache.get(key(0)) is None
+    cached = cache.put(key(0), np.arange(10))
+    assert cached.dtype == np.float32
+    assert not cached.flags.writeable
+    assert cache.get(key(0)) is cached
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["bytes"] == 40
+
+
+def test_lru_eviction():
+    cache = ExpressionCache(max_bytes=80)
+    cache.put(key(0), np.zeros(10))
+    cache.put(key(1), np.zeros(10))
+    cache.get(key(0))
+    cache.put(key(2), np.zeros(10))
+    assert cache.get(key(1)) is None
+    assert cache.get(key(0)) is not None
+    assert cache.get(key(2)) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_too_large_is_not_cached():
+    cache = ExpressionCache(max_bytes=8)
+    cache.put(key(0), np.zeros(10))
+    assert cache.get(key(0)) is None
+    assert cache.stats()["bytes"] == 0
+
+
+def test_loom_expression_precision_and_stamp(tmp_path):
+    matrix, row_attrs, col_attrs, attrs = generate_test_loom_data()
+    lp.create(
+        filename=str(tmp_path / "test.loom"), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs
+    )
+    loom_file_handler = LoomFileHandler()
+    loom_file_handler.loom_dir = tmp_path
+    test_loom = loom_file_handler.get_loom(Path("test.loom"))
+
+    # Expression is served as float32, so are the percentiles computed from it
+    vals, _ = test_loom.get_gene_expression("Gene_3", log_transform=True, cpm_normalise=True)
+    assert vals.dtype == np.float32
+    expected = test_loom.transform_expression(matrix[2].astype(np.float64), True, True)
+    np.testing.assert_allclose(vals, expected, rtol=1e-6)
+    v_max, max_v_max = data.get_99_and_100_percentiles(vals)
+    np.testing.assert_allclose([v_max, max_v_max], data.get_99_and_100_percentiles(expected), rtol=1e-6)
+
+    # Writing metadata does not change the expression matrix, cached vectors are still used
+    hits = ec.EXPRESSION_CACHE.stats()["hits"]
+    test_loom.update_metadata(test_loom.get_meta_data())
+    assert test_loom.get_gene_expression("Gene_3", log_transform=True, cpm_normalise=True)[0] is vals
+    assert ec.EXPRESSION_CACHE.stats()["hits"] == hits + 1
+    test_loom.get_connection().close()
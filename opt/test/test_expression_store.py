@@ -0,0 +1,103 @@
+import loompy as lp
+import numpy as np
+import pytest
+import os
+import shutil
+
+from pathlib import Path
+
+from scopeserver.dataserver.utils.loom import Loom
+from scopeserver.dataserver.utils.loom_file_handler import LoomFileHandler
+from scopeserver.dataserver.utils import expression_store as es
+from scopeserver.gen_test_loom import generate_test_loom_data
+
+LOOM_FILE_HANDLER = LoomFileHandler()
+
+LOOM_PATH = Path("test/data/SCope_Test.loom")
+
+
+@pytest.fixture
+def loom_file():
+    if os.path.isfile("test/data/SCope_Test.loom"):
+        os.remove("test/data/SCope_Test.loom")
+    if os.path.isfile("test/data/SCope_Test.ss"):
+        os.remove("test/data/SCope_Test.ss")
+    shutil.rmtree(es.get_store_path(LOOM_PATH), ignore_errors=True)
+    return generate_test_loom_data()
+
+
+def test_build_and_load(loom_file):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
+        assert test_loom.expression_store is None
+
+        store = es.build(test_loom, block_size=7 * matrix.shape[1], max_density=1.0)
+        assert store.nnz == np.count_nonzero(matrix)
+        for row in range(matrix.shape[0]):
+            np.testing.assert_equal(store.get_row(row), matrix[row])
+
+        test_loom.expression_store = es.load(test_loom)
+        np.testing.assert_equal(test_loom.get_gene_expression("Gene_3", False, False)[0], matrix[2])
+    es.remove(LOOM_PATH)
+
+
+def test_build_too_dense(loom_file):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
+        assert es.build(test_loom, max_density=0.01) is None
+        assert es.load(test_loom) is None
+
+
+def test_outdated_store_is_ignored(loom_file):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
+        assert es.build(test_loom, max_density=1.0) is not None
+
+        # A loom of the same shape replaced the one the store was built from
+        mtime = test_loom.get_mtime()
+        os.utime(LOOM_PATH, ns=(0, 0))
+        assert es.load(test_loom) is None
+        # The outdated store stays outdated after a write of SCope to the new loom
+        es.restamp(test_loom, previous_mtime=0)
+        assert es.load(test_loom) is None
+        es.restamp(test_loom, previous_mtime=mtime)
+        assert es.load(test_loom) is not None
+    es.remove(LOOM_PATH)
+
+
+def test_build_while_metadata_is_written(loom_file, tmp_path, monkeypatch):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(
+        filename=str(tmp_path / "test.loom"), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs
+    )
+    loom_file_handler = LoomFileHandler()
+    loom_file_handler.loom_dir = tmp_path
+    test_loom = loom_file_handler.get_loom(Path("test.loom"))
+
+    class Numpy:
+        """ Write metadata, which reopens the loom, after the first block of the store is read. """
+
+        written = False
+
+        def __getattr__(self, name):
+            return getattr(np, name)
+
+        def nonzero(self, block):
+            if not self.written:
+                self.written = True
+                test_loom.update_metadata(test_loom.get_meta_data())
+            return np.nonzero(block)
+
+    numpy = Numpy()
+    monkeypatch.setattr(es, "np", numpy)
+    store = es.build(test_loom, block_size=7 * matrix.shape[1], max_density=1.0)
+    assert numpy.written and store is not None
+    for row in range(matrix.shape[0]):
+        np.testing.assert_equal(store.get_row(row), matrix[row])
+    test_loom.get_connection().close()
@@ -0,0 +1,73 @@
+import threading
+
+from scopeserver.dataserver.utils import global_search
+from scopeserver.dataserver.utils import search_space as ss
+from scopeserver.dataserver.utils.global_search import GlobalSearchIndex
+from scopeserver.dataserver.utils.search_space import SSKey
+
+
+def make_loom(path, search_space_dict):
+    path.write_bytes(b"")
+    ss.write(path, search_space_dict)
+    return path
+
+
+def test_global_search(tmp_path, monkeypatch):
+    looms = {
+        "a.loom": make_loom(
+            tmp_path / "a.loom",
+            {SSKey("Gene_1", "gene"): ["Gene_1"], SSKey("Neuron (CL_1)", "cluster_annotation"): ["0_1"]},
+        ),
+        "b.loom": make_loom(
+            tmp_path / "b.loom", {SSKey("Gene_1", "gene"): ["Gene_1"], SSKey("Gene_2", "gene"): ["Gene_2"]}
+        ),
+        "c.loom": tmp_path / "c.loom",
+    }
+    looms["c.loom"].write_bytes(b"")
+    index = GlobalSearchIndex(tmp_path / global_search.GLOBAL_SEARCH_FILE_NAME)
+    assert index.refresh(looms)
+    assert index.find("gene_1") == [(SSKey("Gene_1", "gene"), ["a.loom", "b.loom"])]
+    assert index.find("neuron") == [(SSKey("Neuron (CL_1)", "cluster_annotation"), ["a.loom"])]
+    assert [key.element for key, _ in index.find("gene", limit=1)] == ["Gene_1"]
+
+    # Only the looms whose stamp changed are read again
+    read, read_search_space = [], ss.read
+    monkeypatch.setattr(ss, "read", lambda path: read.append(path.name) or read_search_space(path))
+    assert not index.refresh(looms)
+    make_loom(looms["c.loom"], {SSKey("Gene_2", "gene"): ["Gene_2"]})
+    del looms["a.loom"]
+    assert index.refresh(looms)
+    assert read == ["c.loom"]
+    assert index.find("gene_1") == [(SSKey("Gene_1", "gene"), ["b.loom"])]
+    assert index.find("gene_2") == [(SSKey("Gene_2", "gene"), ["b.loom", "c.loom"])]
+    assert index.find("neuron") == []
+
+    # The index and the stamps of the looms are persisted
+    reloaded = GlobalSearchIndex(tmp_path / global_search.GLOBAL_SEARCH_FILE_NAME)
+    assert reloaded.stamps == index.stamps
+    assert not reloaded.refresh(looms)
+    assert reloaded.find("gene_2") == index.find("gene_2")
+
+    # Every loom has its own segment, removed with the loom
+    assert sorted(reloaded.segments) == ["b.loom", "c.loom"]
+    assert not index.get_segment_path("a.loom").exists()
+    assert index.get_segment_path("b.loom").exists()
+
+
+def test_refresh_in_background_is_debounced(tmp_path):
+    looms = {"a.loom": make_loom(tmp_path / "a.loom", {SSKey("Gene_1", "gene"): ["Gene_1"]})}
+    index = GlobalSearchIndex(tmp_path / global_search.GLOBAL_SEARCH_FILE_NAME)
+    running = threading.Event()
+    release = threading.Event()
+    blocking = global_search._WORKER.submit(lambda: running.set() or release.wait())
+    running.wait()
+
+    # Refreshes queued while the worker is busy are one refresh, with the looms of the last call
+    first = index.refresh_in_background({})
+    assert index.refresh_in_background(looms) is first
+    release.set()
+    blocking.result()
+    assert first.result()
+    assert index.find("gene_1") == [(SSKey("Gene_1", "gene"), ["a.loom"])]
+    second = index.refresh_in_background(looms)
+    assert second is not first and not second.result()
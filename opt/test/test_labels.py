@@ -28,8 +28,8 @@ LOOM_PATH = Path("test/data/SCope_Test.loom")
 def loom_file():
     if os.path.isfile("test/data/SCope_Test.loom"):
         os.remove("test/data/SCope_Test.loom")
-    if os.path.isfile("test/data/SCope_Test.ss_pkl"):
-        os.remove("test/data/SCope_Test.ss_pkl")
+    if os.path.isfile("test/data/SCope_Test.ss"):
+        os.remove("test/data/SCope_Test.ss")
     return generate_test_loom_data()
 
 
@@ -49,9 +49,11 @@ def test_label_annotation(loom_file):
         coords = test_loom.get_coordinates(-1, annotation=[Annotation(name="Test_Anno", values=[anno_vals[0]])])
         anno_coords = Coordinate(np.mean(coords["x"]), y=np.mean(coords["y"]))
         colour = constant.BIG_COLOR_LIST[0]
-        assert label_annotation(test_loom, -1, "Test_Anno")[0] == FeatureLabel(
-            label=anno_vals[0], colour=colour, coordinate=anno_coords
-        )
+        label = label_annotation(test_loom, -1, "Test_Anno")[0]
+        assert label.label == anno_vals[0]
+        assert label.colour == colour
+        # Centroids are summed in one pass over all cells, which may differ from np.mean in the last digits
+        assert label.coordinate == pytest.approx(anno_coords)
 
 
 def test_label_all_clusters(loom_file):
@@ -70,4 +72,21 @@ def test_label_all_clusters(loom_file):
             labels.append(FeatureLabel(label=cluster, colour=colour, coordinate=cluster_coords))
 
         print(labels)
-        assert sorted(label_all_clusters(test_loom, -1, clustering_meta["name"])) == sorted(labels)
+        found = sorted(label_all_clusters(test_loom, -1, clustering_meta["name"]))
+        assert [(label.label, label.colour) for label in found] == [
+            (label.label, label.colour) for label in sorted(labels)
+        ]
+        for found_label, label in zip(found, sorted(labels)):
+            assert found_label.coordinate == pytest.approx(label.coordinate)
+
+
+def test_centroids_cached_per_meta_data_version(loom_file):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
+        centroids = test_loom.get_centroids(-1, "Clustering_1")
+        assert sorted(centroids) == ["0", "1", "2", "3"]
+        assert test_loom.get_centroids(-1, "Clustering_1") is centroids
+        test_loom.invalidate_meta_data()
+        assert test_loom.get_centroids(-1, "Clustering_1") is not centroids
@@ -0,0 +1,91 @@
+import loompy as lp
+import numpy as np
+import pytest
+import os
+
+from pathlib import Path
+from numpy.random import Generator, PCG64
+
+from scopeserver.dataserver.utils.loom import Loom
+from scopeserver.dataserver.utils.loom_file_handler import LoomFileHandler
+from scopeserver.dataserver.utils.annotation import Annotation
+from scopeserver.dataserver.utils.lod import LodIndex, Viewport
+from scopeserver.gen_test_loom import generate_test_loom_data
+
+LOOM_FILE_HANDLER = LoomFileHandler()
+
+rg = Generator(PCG64(55850))
+
+LOOM_PATH = Path("test/data/SCope_Test.loom")
+
+
+@pytest.fixture
+def loom_file():
+    if os.path.isfile("test/data/SCope_Test.loom"):
+        os.remove("test/data/SCope_Test.loom")
+    if os.path.isfile("test/data/SCope_Test.ss"):
+        os.remove("test/data/SCope_Test.ss")
+    return generate_test_loom_data()
+
+
+def test_select_all():
+    x, y = rg.normal(size=1000), rg.normal(size=1000)
+    lod_index = LodIndex(x, y, grid_size=16)
+    cells, total = lod_index.select()
+    np.testing.assert_equal(cells, np.arange(1000))
+    assert total == 1000
+
+    cells, total = lod_index.select(max_cells=100)
+    assert len(cells) == 100
+    assert total == 1000
+    assert np.all(np.diff(cells) > 0)
+
+
+def test_select_viewport():
+    x, y = rg.normal(size=1000), rg.normal(size=1000)
+    lod_index = LodIndex(x, y, grid_size=16)
+    viewport = Viewport(-1.0, 0.5, -0.25, 2.0)
+    inside = np.flatnonzero((x >= -1.0) & (x <= 0.5) & (y >= -0.25) & (y <= 2.0))
+
+    cells, total = lod_index.select(viewport=viewport)
+    np.testing.assert_equal(cells, inside)
+    assert total == len(inside)
+
+    sample, total = lod_index.select(viewport=viewport, max_cells=50)
+    assert len(sample) == 50
+    assert total == len(inside)
+    assert set(sample) <= set(inside)
+
+    # Zooming in keeps the cells that were already shown in the smaller viewport
+    zoomed = Viewport(-1.0, 0.0, 0.0, 1.0)
+    zoomed_sample, _ = lod_index.select(viewport=zoomed, max_cells=50)
+    shown = sample[(x[sample] <= 0.0) & (y[sample] >= 0.0) & (y[sample] <= 1.0)]
+    assert set(shown) <= set(zoomed_sample)
+
+    mask = np.zeros(1000, dtype=bool)
+    mask[::2] = True
+    cells, total = lod_index.select(viewport=viewport, mask=mask)
+    np.testing.assert_equal(cells, inside[inside % 2 == 0])
+
+    cells, total = lod_index.select(viewport=Viewport(10.0, 11.0, 10.0, 11.0), max_cells=50)
+    assert len(cells) == 0
+    assert total == 0
+
+
+def test_get_lod_coordinates(loom_file):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
+        coords = test_loom.get_coordinates(-1)
+        lod_coords = test_loom.get_lod_coordinates(-1, max_cells=10)
+        assert len(lod_coords["cellIndices"]) == 10
+        assert lod_coords["totalCells"] == test_loom.get_nb_cells()
+        np.testing.assert_equal(lod_coords["x"], coords["x"][lod_coords["cellIndices"]])
+        np.testing.assert_equal(lod_coords["y"], coords["y"][lod_coords["cellIndices"]])
+
+        lod_coords = test_loom.get_lod_coordinates(
+            -1, max_cells=10, annotation=[Annotation(name="Clustering_0", values=["1"])]
+        )
+        assert lod_coords["totalCells"] == 25
+        assert all(25 <= cell < 50 for cell in lod_coords["cellIndices"])
@@ -9,6 +9,8 @@ from numpy.random import Generator, PCG64
 
 from scopeserver.dataserver.utils.loom import Loom
 from scopeserver.dataserver.utils.loom_file_handler import LoomFileHandler
+from scopeserver.dataserver.utils import expression_cache as ec
+from scopeserver.dataserver.utils.annotation import Annotation
 from scopeserver.gen_test_loom import generate_test_loom_data
 
 LOOM_FILE_HANDLER = LoomFileHandler()
@@ -34,8 +36,8 @@ def matrix():
 def loom_file():
     if os.path.isfile("test/data/SCope_Test.loom"):
         os.remove("test/data/SCope_Test.loom")
-    if os.path.isfile("test/data/SCope_Test.ss_pkl"):
-        os.remove("test/data/SCope_Test.ss_pkl")
+    if os.path.isfile("test/data/SCope_Test.ss"):
+        os.remove("test/data/SCope_Test.ss")
     return generate_test_loom_data()
 
 
@@ -143,3 +145,89 @@ def get_gene_expression(loom_file):
         test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
         np.testing.assert_equal(test_loom.get_gene_expression("Gene_1", True, False), np.log1p(matrix[0]))
         np.testing.assert_equal(test_loom.get_gene_expression("Gene_100", False, False), matrix[99])
+
+
+def test_get_gene_row(loom_file):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
+        assert test_loom.get_gene_row("Gene_1") == 0
+        assert test_loom.get_gene_row("Gene_100") == 99
+        assert test_loom.get_gene_row("Not_A_Gene") is None
+        np.testing.assert_equal(test_loom.get_gene_expression("Gene_100", False, False)[0], matrix[99])
+        np.testing.assert_equal(test_loom.get_gene_expression("Not_A_Gene", False, False)[0], np.zeros(100))
+
+
+def test_get_gene_expression_cached(loom_file):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
+        first, _ = test_loom.get_gene_expression("Gene_5", True, False)
+        second, _ = test_loom.get_gene_expression("Gene_5", True, False)
+        assert first is second
+        assert first.dtype == np.float32
+        assert not first.flags.writeable
+        np.testing.assert_allclose(first, np.log2(matrix[4] + 1), rtol=1e-6)
+
+
+def test_get_meta_data_cached(loom_file):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
+        meta_data = test_loom.get_meta_data()
+        assert test_loom.get_meta_data() is meta_data
+
+        meta_data_copy = test_loom.get_meta_data_copy()
+        meta_data_copy["clusterings"][0]["name"] = "Renamed"
+        assert test_loom.get_meta_data_clustering_by_id(0)["name"] != "Renamed"
+
+        test_loom.invalidate_meta_data()
+        assert test_loom.meta_data_version == 1
+        assert test_loom.get_meta_data() is not meta_data
+        assert test_loom.get_meta_data() == meta_data
+
+
+def test_get_auc_values(loom_file):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
+        assert test_loom.get_regulon_registry()["MotifRegulon_2"].regulon_type == "motif"
+        assert test_loom.get_regulon_registry()["TrackRegulon_2"].attribute == "TrackRegulonsAUC"
+        assert test_loom.get_regulon_names(regulon_type="track") == ds.ca.TrackRegulonsAUC.dtype.names
+        assert test_loom.get_regulon_names(regulon_type="legacy") == ()
+
+        vals, _ = test_loom.get_auc_values("MotifRegulon_2")
+        np.testing.assert_equal(vals, ds.ca.MotifRegulonsAUC["MotifRegulon_2"])
+        assert test_loom.get_regulon_auc("MotifRegulon_2") is test_loom.get_regulon_auc("MotifRegulon_2")
+
+        vals, _ = test_loom.get_auc_values("Not_A_Regulon")
+        assert vals.shape == (0, 0)
+
+
+def test_get_genes_expression(loom_file):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
+        genes = ["Gene_7", "Not_A_Gene", "Gene_2", "Gene_7"]
+        for log_transform in (False, True):
+            for cpm_normalise in (False, True):
+                expected = [test_loom.get_gene_expression(gene, log_transform, cpm_normalise)[0] for gene in genes]
+                ec.EXPRESSION_CACHE.clear()
+                np.testing.assert_equal(
+                    test_loom.get_genes_expression(genes, log_transform, cpm_normalise), np.stack(expected)
+                )
+
+        values, cell_indices = test_loom.get_features_values(
+            [("gene", "Gene_3"), ("regulon", "MotifRegulon_1"), ("metric", "nGene")],
+            log_transform=False,
+            annotation=[Annotation(name="Half cells", values=["Second half"])],
+        )
+        np.testing.assert_equal(cell_indices, np.arange(1, 100, 2))
+        np.testing.assert_equal(values[0], matrix[2][1::2])
+        np.testing.assert_allclose(values[1], ds.ca.MotifRegulonsAUC["MotifRegulon_1"][1::2], rtol=1e-6)
+        np.testing.assert_equal(values[2], ds.ca.nGene[1::2])
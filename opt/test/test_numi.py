@@ -0,0 +1,78 @@
+import loompy as lp
+import numpy as np
+import pytest
+import os
+
+from pathlib import Path
+
+from scopeserver.dataserver.utils.loom import Loom
+from scopeserver.dataserver.utils.loom_file_handler import LoomFileHandler
+from scopeserver.dataserver.utils import expression_store as es
+from scopeserver.dataserver.utils import numi
+from scopeserver.dataserver.utils import sidecar
+from scopeserver.gen_test_loom import generate_test_loom_data
+
+LOOM_FILE_HANDLER = LoomFileHandler()
+
+LOOM_PATH = Path("test/data/SCope_Test.loom")
+
+
+@pytest.fixture
+def loom_file():
+    if os.path.isfile("test/data/SCope_Test.loom"):
+        os.remove("test/data/SCope_Test.loom")
+    if os.path.isfile("test/data/SCope_Test.ss"):
+        os.remove("test/data/SCope_Test.ss")
+    numi.remove(LOOM_PATH)
+    matrix, row_attrs, col_attrs, attrs = generate_test_loom_data()
+    del col_attrs["nUMI"]
+    return matrix, row_attrs, col_attrs, attrs
+
+
+def test_compute_chunked(loom_file):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
+        np.testing.assert_allclose(numi.compute(test_loom, batch_size=7), matrix.sum(axis=0))
+
+        test_loom.expression_store = es.build(test_loom, max_density=1.0)
+        np.testing.assert_allclose(numi.compute(test_loom, batch_size=1), matrix.sum(axis=0))
+    es.remove(LOOM_PATH)
+
+
+def test_get_persists(loom_file):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
+        assert numi.load(test_loom) is None
+
+        numi.schedule(test_loom)
+        np.testing.assert_allclose(test_loom.get_nUMI(), matrix.sum(axis=0))
+        np.testing.assert_allclose(numi.load(test_loom), matrix.sum(axis=0))
+
+        mtime = test_loom.get_mtime()
+        os.utime(LOOM_PATH, ns=(0, 0))
+        assert numi.load(test_loom) is None
+        # Only a sidecar of the loom as it was before the write is restamped
+        sidecar.restamp(test_loom, numi.NUMI_SUFFIX, previous_mtime=mtime + 1)
+        assert numi.load(test_loom) is None
+        sidecar.restamp(test_loom, numi.NUMI_SUFFIX, previous_mtime=mtime)
+        np.testing.assert_allclose(numi.load(test_loom), matrix.sum(axis=0))
+    numi.remove(LOOM_PATH)
+
+
+def test_get_failed_job(loom_file, monkeypatch):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
+
+        def fail(loom, nUMI):
+            raise OSError("Disk full")
+
+        # The client gets nUMI computed on the spot instead of the error of the background job
+        monkeypatch.setattr(numi, "write", fail)
+        np.testing.assert_allclose(numi.get(test_loom), matrix.sum(axis=0))
+        assert numi.load(test_loom) is None
@@ -0,0 +1,50 @@
+from pathlib import Path
+
+from hypothesis import given
+from hypothesis.strategies import booleans, builds, dictionaries, integers, lists, sampled_from
+
+from scopeserver.dataserver.utils.search import aggregate_matches, find_matches
+from scopeserver.dataserver.utils.search_space import JournaledSearchSpace, PackedSearchSpace, SSChange, SSKey
+
+ELEMENTS = ["Gene_1", "gene_1", "Gene_10", "XGene_1", "xgene_10", "G"]
+TYPES = ["gene", "marker_gene", "regulon_target", "annotation"]
+RESULTS = ["Gene_1", "Gene_10", "0_1", "Regulon(+)"]
+
+
+def make_search_space(search_space_dict, journal=()):
+    return JournaledSearchSpace(Path("test.loom"), PackedSearchSpace.pack(search_space_dict), journal)
+
+
+def test_find_matches_limit():
+    search_space = make_search_space(
+        {
+            SSKey("xgene_10", "gene"): ["xgene_10"],
+            SSKey("Gene_10", "gene"): ["Gene_10"],
+            SSKey("Gene_1", "marker_gene"): ["0_1"],
+            SSKey("Gene_1", "gene"): ["Gene_1"],
+        }
+    )
+    matches = find_matches("Gene_1", search_space)
+    assert [m.result for m in matches] == ["Gene_1", "Gene_10", "xgene_10", "0_1"]
+    assert [m.result for m in find_matches("Gene_1", search_space, limit=2)] == ["Gene_1", "Gene_10"]
+    assert find_matches("Gene_1", search_space, limit=10) == matches
+
+
+@given(
+    dictionaries(
+        builds(SSKey, sampled_from(ELEMENTS), sampled_from(TYPES)),
+        lists(sampled_from(RESULTS), min_size=1, max_size=3, unique=True),
+        max_size=12,
+    ),
+    lists(builds(SSChange, sampled_from(ELEMENTS), sampled_from(TYPES), sampled_from(RESULTS), booleans()), max_size=6),
+    sampled_from(["gene_1", "GENE", "g", ""]),
+    integers(min_value=1, max_value=8),
+)
+def test_find_matches_limit_is_prefix(search_space_dict, journal, term, limit):
+    search_space = make_search_space(search_space_dict, journal)
+    all_results = aggregate_matches(find_matches(term, search_space))
+    top_results = aggregate_matches(find_matches(term, search_space, limit=limit))
+    # The best results are selected, with their matches found before the search stopped
+    assert list(top_results) == list(all_results)[:limit]
+    for result, elements in top_results.items():
+        assert elements == all_results[result][: len(elements)]
@@ -0,0 +1,60 @@
+from hypothesis import given
+from hypothesis.strategies import lists, sampled_from, text
+
+import loompy as lp
+import pytest
+import os
+
+from pathlib import Path
+
+from scopeserver.dataserver.utils.loom import Loom
+from scopeserver.dataserver.utils.loom_file_handler import LoomFileHandler
+from scopeserver.dataserver.utils.search_index import SearchIndex
+from scopeserver.dataserver.utils.search_space import SSKey
+from scopeserver.gen_test_loom import generate_test_loom_data
+
+LOOM_FILE_HANDLER = LoomFileHandler()
+
+LOOM_PATH = Path("test/data/SCope_Test.loom")
+
+ELEMENTS = ["Gene_1", "Gene_10", "gene_2", "Cluster 1", "ENSG0001", "Straße"]
+
+
+@pytest.fixture
+def loom_file():
+    if os.path.isfile("test/data/SCope_Test.loom"):
+        os.remove("test/data/SCope_Test.loom")
+    if os.path.isfile("test/data/SCope_Test.ss"):
+        os.remove("test/data/SCope_Test.ss")
+    return generate_test_loom_data()
+
+
+def test_search_index():
+    index = SearchIndex.build(ELEMENTS)
+    assert list(index.exact("GENE_1")) == [0]
+    assert list(index.substring("ne_")) == [0, 1, 2]
+    assert list(index.substring("e_1")) == [0, 1]
+    assert list(index.substring("1")) == [0, 1, 3, 4]
+    assert list(index.substring("ß")) == [5]
+    assert list(index.substring("")) == [0, 1, 2, 3, 4, 5]
+    assert list(index.substring("STRASSE")) == [5]
+    assert list(index.substring("gene_3")) == []
+    assert list(index.substring("0g")) == []
+
+
+@given(lists(text(alphabet="abAB_", max_size=6), max_size=20), text(alphabet="abAB_", max_size=5))
+def test_search_index_matches_scan(elements, term):
+    index = SearchIndex.build(elements)
+    folded = term.casefold()
+    assert list(index.exact(term)) == [i for i, e in enumerate(elements) if e.casefold() == folded]
+    assert list(index.substring(term)) == [i for i, e in enumerate(elements) if folded in e.casefold()]
+
+
+def test_search_space_find(loom_file):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
+        assert (SSKey("Gene_12", "gene"), ["Gene_12"]) in test_loom.ss.find("gene_12")
+        assert {key.element for key, _ in test_loom.ss.find("gene_12", exact=True)} == {"Gene_12"}
+        assert all("cluster 1" in key.element.casefold() for key, _ in test_loom.ss.find("cluster 1"))
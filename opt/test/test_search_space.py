@@ -0,0 +1,171 @@
+import copy
+import threading
+
+import loompy as lp
+import numpy as np
+import pytest
+import os
+
+from pathlib import Path
+
+from scopeserver.dataserver.utils import array_file
+from scopeserver.dataserver.utils import search_space as ss
+from scopeserver.dataserver.utils.loom import Loom
+from scopeserver.dataserver.utils.loom_file_handler import LoomFileHandler
+from scopeserver.dataserver.utils.search_space import PackedSearchSpace, SSKey
+from scopeserver.dataserver.utils.string_table import StringTable
+from scopeserver.gen_test_loom import generate_test_loom_data
+
+LOOM_FILE_HANDLER = LoomFileHandler()
+
+LOOM_PATH = Path("test/data/SCope_Test.loom")
+
+SEARCH_SPACE = {
+    SSKey("Gene_1", "gene"): ["Gene_1"],
+    SSKey("Gene_1", "marker_gene"): ["0_1", "1_3"],
+    SSKey("Regulon(+)", "regulon"): ["Regulon(+)"],
+    SSKey("Gene_1", "regulon_target"): ["Regulon(+)"],
+    SSKey("Straße", "annotation_category"): [],
+}
+
+
+@pytest.fixture
+def loom_file():
+    if os.path.isfile("test/data/SCope_Test.loom"):
+        os.remove("test/data/SCope_Test.loom")
+    if os.path.isfile("test/data/SCope_Test.ss"):
+        os.remove("test/data/SCope_Test.ss")
+    return generate_test_loom_data()
+
+
+def test_string_table():
+    table = StringTable.from_strings(["", "a", "ab", "b", "é"])
+    assert list(table) == ["", "a", "ab", "b", "é"]
+    assert table.bisect(b"ab") == 2
+    assert table.bisect(b"ab", right=True) == 3
+    assert table.bisect(b"c") == 4
+    assert table.bisect(b"b", order=np.array([4, 3, 0])) == 0
+
+
+def test_array_file(tmp_path):
+    path = tmp_path / "arrays"
+    arrays = {"a": np.arange(5, dtype=np.int32), "b": np.array([], dtype=np.uint8), "c": np.ones((2, 3))}
+    array_file.write(path, 2, arrays)
+    mapped = array_file.read(path, 2)
+    assert mapped is not None
+    for name, array in arrays.items():
+        np.testing.assert_equal(mapped[name], array)
+        assert mapped[name].dtype == array.dtype
+        assert not mapped[name].flags.writeable
+    assert array_file.read(path, 3) is None
+    assert array_file.read(tmp_path / "missing", 2) is None
+
+
+def test_packed_search_space(tmp_path):
+    packed = PackedSearchSpace.pack(SEARCH_SPACE)
+    assert packed.to_dict() == SEARCH_SPACE
+    # Strings are interned
+    assert len(packed.strings) == 10
+
+    array_file.write(tmp_path / "ss", ss.CURRENT_SS_VERISON, packed.to_arrays())
+    arrays = array_file.read(tmp_path / "ss", ss.CURRENT_SS_VERISON)
+    assert arrays is not None
+    loaded = PackedSearchSpace.from_arrays(arrays)
+    assert loaded.to_dict() == SEARCH_SPACE
+    assert loaded.find("gene_1") == [
+        (SSKey("Gene_1", "gene"), ["Gene_1"]),
+        (SSKey("Gene_1", "marker_gene"), ["0_1", "1_3"]),
+        (SSKey("Gene_1", "regulon_target"), ["Regulon(+)"]),
+    ]
+    assert loaded.find("STRASSE") == [(SSKey("Straße", "annotation_category"), [])]
+
+
+def test_loom_search_space_is_persisted(loom_file):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        built = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER).ss.to_dict()
+    assert os.path.isfile("test/data/SCope_Test.ss")
+    assert SSKey("Gene_1", "gene") in built
+
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        loaded = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER).ss
+        # Loaded arrays are read-only views of the mapped file
+        assert not loaded.packed.values.flags.owndata and not loaded.packed.values.flags.writeable
+        assert loaded.to_dict() == built
+
+
+def test_journaled_search_space(tmp_path, monkeypatch):
+    monkeypatch.setattr(ss.constant, "SS_JOURNAL_MAX_CHANGES", 3)
+    abs_file_path = tmp_path / "test.loom"
+    search_space = ss.JournaledSearchSpace(abs_file_path, ss.write(abs_file_path, SEARCH_SPACE))
+    search_space.apply(
+        [
+            ss.SSChange("Gene_1", "marker_gene", "0_1", False),
+            ss.SSChange("Gene_12", "marker_gene", "2_0", True),
+        ]
+    )
+    assert search_space.get(SSKey("Gene_1", "marker_gene")) == ["1_3"]
+    assert search_space.find("gene_12") == [(SSKey("Gene_12", "marker_gene"), ["2_0"])]
+    assert search_space.compaction is None
+
+    # The journal is replayed on load
+    reloaded = ss.JournaledSearchSpace(
+        abs_file_path, search_space.packed, ss.read_journal(ss.get_journal_path(abs_file_path))
+    )
+    assert reloaded.to_dict() == search_space.to_dict()
+
+    search_space.apply([ss.SSChange("Regulon(+)", "regulon", "Regulon(+)", False)])
+    assert search_space.find("regulon") == []
+    search_space.wait_for_compaction()
+    assert search_space.compaction is None
+    assert search_space.journal == []
+    assert ss.read_journal(ss.get_journal_path(abs_file_path)) == []
+    assert search_space.packed.get(SSKey("Gene_12", "marker_gene")) == ["2_0"]
+    assert search_space.packed.get(SSKey("Regulon(+)", "regulon")) is None
+    assert search_space.find("gene_1", exact=True) == [
+        (SSKey("Gene_1", "gene"), ["Gene_1"]),
+        (SSKey("Gene_1", "marker_gene"), ["1_3"]),
+        (SSKey("Gene_1", "regulon_target"), ["Regulon(+)"]),
+    ]
+
+
+def test_clustering_changes(loom_file):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
+        clustering = test_loom.get_meta_data_clustering_by_id(0)
+        # The entries of a clustering are the ones of the built search space
+        for key, value in ss.get_clustering_entries(clustering):
+            assert value in test_loom.ss.get(key)
+
+        renamed = copy.deepcopy(clustering)
+        renamed["clusters"][0]["description"] = "Renamed Cluster"
+        renamed["clusters"][1]["cell_type_annotation"] = [{"data": {"annotation_label": "Neuron", "obo_id": "CL_1"}}]
+        assert ss.get_clustering_changes(clustering, renamed) == [
+            ss.SSChange("Unannotated Cluster 1", "Clustering: Cluster set 0", "Unannotated Cluster 1", False),
+            ss.SSChange("Neuron (CL_1)", "cluster_annotation", "0_1", True),
+            ss.SSChange("Renamed Cluster", "Clustering: Cluster set 0", "Renamed Cluster", True),
+        ]
+        assert len(ss.get_clustering_changes(None, clustering)) == len(clustering["clusters"]) + 1
+
+
+def test_wait_for_compaction(tmp_path, monkeypatch):
+    monkeypatch.setattr(ss.constant, "SS_JOURNAL_MAX_CHANGES", 1)
+    abs_file_path = tmp_path / "test.loom"
+    search_space = ss.JournaledSearchSpace(abs_file_path, ss.write(abs_file_path, SEARCH_SPACE))
+    release = threading.Event()
+    write = ss.write
+    monkeypatch.setattr(ss, "write", lambda *args: release.wait() and write(*args))
+    search_space.apply([ss.SSChange("Gene_12", "marker_gene", "2_0", True)])
+
+    # Rebuilding the search space waits for the compaction writing the same files
+    waiting = threading.Thread(target=search_space.wait_for_compaction)
+    waiting.start()
+    waiting.join(timeout=0.1)
+    assert waiting.is_alive()
+    release.set()
+    waiting.join()
+    assert search_space.compaction is None
+    assert ss.read(abs_file_path).packed.get(SSKey("Gene_12", "marker_gene")) == ["2_0"]
@@ -0,0 +1,78 @@
+import struct
+import zlib
+
+import numpy as np
+
+from scopeserver.dataserver.utils.constant import NO_EXPR_RGB
+from scopeserver.dataserver.utils.lod import LodIndex
+from scopeserver.dataserver.utils.tiles import Tile, encode_png, get_tile_viewport, rasterise
+
+
+def decode_png(png: bytes) -> np.ndarray:
+    assert png[:8] == b"\x89PNG\r\n\x1a\n"
+    position, idat, width, height = 8, b"", 0, 0
+    while position < len(png):
+        (length,) = struct.unpack(">I", png[position : position + 4])
+        chunk_type = png[position + 4 : position + 8]
+        data = png[position + 8 : position + 8 + length]
+        assert struct.unpack(">I", png[position + 8 + length : position + 12 + length])[0] == zlib.crc32(
+            chunk_type + data
+        )
+        if chunk_type == b"IHDR":
+            width, height = struct.unpack(">II", data[:8])
+        elif chunk_type == b"IDAT":
+            idat += data
+        position += 12 + length
+    scanlines = np.frombuffer(zlib.decompress(idat), dtype=np.uint8).reshape(height, 1 + width * 4)
+    assert np.all(scanlines[:, 0] == 0)
+    return scanlines[:, 1:].reshape(height, width, 4)
+
+
+def test_encode_png():
+    image = np.arange(4 * 3 * 4, dtype=np.uint8).reshape(4, 3, 4)
+    np.testing.assert_equal(decode_png(encode_png(image)), image)
+
+
+def test_tile_viewport():
+    lod_index = LodIndex(np.array([0.0, 4.0]), np.array([0.0, 2.0]))
+    assert get_tile_viewport(lod_index, Tile(0, 0, 0, 4)) == (0.0, 4.0, -2.0, 2.0)
+    assert get_tile_viewport(lod_index, Tile(1, 1, 0, 4)) == (2.0, 4.0, 0.0, 2.0)
+    assert get_tile_viewport(lod_index, Tile(1, 0, 1, 4)) == (0.0, 2.0, -2.0, 0.0)
+
+
+def test_rasterise():
+    # Two cells in the top left pixel, one in the bottom right pixel
+    x = np.array([0.0, 0.1, 3.9])
+    y = np.array([4.0, 3.9, 0.0])
+    rgb = np.array([[100, 0, 0], [200, 50, 0], [0, 0, 255]], dtype=np.uint8)
+    lod_index = LodIndex(x, y, grid_size=4)
+
+    image = rasterise(lod_index, rgb, Tile(0, 0, 0, 2))
+    np.testing.assert_equal(image[0, 0], [150, 25, 0, 255])
+    np.testing.assert_equal(image[1, 1], [0, 0, 255, 255])
+    assert image[0, 1, 3] == 0
+    assert image[1, 0, 3] == 0
+
+    image = rasterise(lod_index, rgb, Tile(0, 0, 0, 2), aggregation="max")
+    np.testing.assert_equal(image[0, 0], [200, 50, 0, 255])
+
+    image = rasterise(lod_index, rgb, Tile(1, 1, 1, 2))
+    assert image[:, :, 3].sum() == 255
+
+    assert not rasterise(lod_index, rgb, Tile(1, 2, 0, 2)).any()
+
+
+def test_rasterise_uncoloured_cells():
+    # A coloured and an uncoloured cell in the top left pixel, an uncoloured cell in the bottom right pixel
+    x = np.array([0.0, 0.1, 3.9])
+    y = np.array([4.0, 3.9, 0.0])
+    rgb = np.array([[200, 0, 100], [0, 0, 0], [0, 0, 0]], dtype=np.uint8)
+    lod_index = LodIndex(x, y, grid_size=4)
+
+    image = rasterise(lod_index, rgb, Tile(0, 0, 0, 2))
+    np.testing.assert_equal(image[0, 0], [183, 83, 133, 255])
+    np.testing.assert_equal(image[1, 1], [NO_EXPR_RGB, NO_EXPR_RGB, NO_EXPR_RGB, 255])
+
+    image = rasterise(lod_index, rgb, Tile(0, 0, 0, 2), aggregation="max")
+    np.testing.assert_equal(image[0, 0], [200, NO_EXPR_RGB, NO_EXPR_RGB, 255])
+    np.testing.assert_equal(rgb[1], [0, 0, 0])
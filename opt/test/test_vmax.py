@@ -0,0 +1,94 @@
+import loompy as lp
+import numpy as np
+import pytest
+import os
+
+from pathlib import Path
+
+from scopeserver.dataserver.utils.loom import Loom
+from scopeserver.dataserver.utils.loom_file_handler import LoomFileHandler
+from scopeserver.dataserver.utils import data
+from scopeserver.dataserver.utils import vmax
+from scopeserver.gen_test_loom import generate_test_loom_data
+
+LOOM_FILE_HANDLER = LoomFileHandler()
+
+LOOM_PATH = Path("test/data/SCope_Test.loom")
+
+
+@pytest.fixture
+def loom_file():
+    if os.path.isfile("test/data/SCope_Test.loom"):
+        os.remove("test/data/SCope_Test.loom")
+    if os.path.isfile("test/data/SCope_Test.ss"):
+        os.remove("test/data/SCope_Test.ss")
+    vmax.remove(LOOM_PATH)
+    return generate_test_loom_data()
+
+
+def test_build(loom_file):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(filename=str(LOOM_PATH), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs)
+    with lp.connect(LOOM_PATH, mode="r", validate=False) as ds:
+        test_loom = Loom(LOOM_PATH, LOOM_PATH, ds, LOOM_FILE_HANDLER)
+        assert test_loom.vmax_table is None
+        table = vmax.VmaxTable(
+            genes=vmax.build_genes(test_loom, block_size=700),
+            regulons=vmax.build_regulons(test_loom, block_size=300),
+            metrics=vmax.build_metrics(test_loom),
+        )
+        assert len(table.regulons) == len(test_loom.get_regulon_registry())
+
+        for log_transform in (False, True):
+            for cpm_normalise in (False, True):
+                for gene in ["Gene_1", "Gene_42"]:
+                    vals, _ = test_loom.get_gene_expression(gene, log_transform, cpm_normalise)
+                    expected = data.get_99_and_100_percentiles(vals)
+                    assert table.lookup(test_loom, "gene", gene, log_transform, cpm_normalise) == expected
+                vals, _ = test_loom.get_metric("nGene", log_transform, cpm_normalise)
+                expected = data.get_99_and_100_percentiles(vals)
+                assert table.lookup(test_loom, "metric", "nGene", log_transform, cpm_normalise) == expected
+
+        vals, _ = test_loom.get_auc_values("TrackRegulon_3")
+        assert table.lookup(test_loom, "regulon", "TrackRegulon_3", False, False) == data.get_99_and_100_percentiles(
+            vals
+        )
+        assert table.lookup(test_loom, "gene", "Not_A_Gene", False, False) is None
+
+        vmax.build_in_background(test_loom).result()
+        assert vmax.load(test_loom) is not None
+        assert test_loom.get_vmax("gene", "Gene_42", True, False) == table.lookup(
+            test_loom, "gene", "Gene_42", True, False
+        )
+    vmax.remove(LOOM_PATH)
+
+
+def test_build_while_metadata_is_written(loom_file, tmp_path, monkeypatch):
+    matrix, row_attrs, col_attrs, attrs = loom_file
+    lp.create(
+        filename=str(tmp_path / "test.loom"), layers=matrix, row_attrs=row_attrs, col_attrs=col_attrs, file_attrs=attrs
+    )
+    loom_file_handler = LoomFileHandler()
+    loom_file_handler.loom_dir = tmp_path
+    test_loom = loom_file_handler.get_loom(Path("test.loom"))
+    expected = vmax.build_genes(test_loom, block_size=700)
+
+    class Data:
+        """ Write metadata, which reopens the loom, after the first block of genes is read. """
+
+        written = False
+
+        def __getattr__(self, name):
+            return getattr(data, name)
+
+        def get_99_and_100_percentiles_by_row(self, values):
+            if not self.written:
+                self.written = True
+                test_loom.update_metadata(test_loom.get_meta_data())
+            return data.get_99_and_100_percentiles_by_row(values)
+
+    reopening = Data()
+    monkeypatch.setattr(vmax, "data", reopening)
+    np.testing.assert_equal(vmax.build_genes(test_loom, block_size=700), expected)
+    assert reopening.written
+    test_loom.get_connection().close()